@@ -0,0 +1,25 @@
+class QuietLogger:
+
+    def add_global_properties(self, properties: dict):
+        ...
+
+    def clear_global_properties(self):
+        ...
+
+    def log_error(self, message: str, properties: dict = None):
+        ...
+
+    def log_exception(self, exception: Exception, properties: dict = None):
+        ...
+
+    def log_event(self, message: str, properties: dict = None):
+        ...
+
+    def log_info(self, message: str, properties: dict = None):
+        ...
+
+    def log_debug(self, message: str, properties: dict = None):
+        ...
+
+    def log_trace(self, message: str, properties: dict = None):
+        ...
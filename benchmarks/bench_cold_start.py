@@ -0,0 +1,88 @@
+import time
+
+from benchmarks import QuietLogger
+from formula_thoughts_web.abstractions import ApiRequestHandler, ApplicationContext, Deserializer, Logger
+from formula_thoughts_web.application import FluentSequenceBuilder, TopLevelSequenceRunner, USE_RESPONSE_ERROR
+from formula_thoughts_web.ioc import Container, LambdaRunner, register_web
+from formula_thoughts_web.web import ApiRequestHandlerBase
+
+ROUTE_COUNT = 60
+COMMANDS_PER_ROUTE = 4
+REPEAT = 20
+
+
+def build_route(index: int) -> tuple[str, type, list[type]]:
+    route_key = f"GET /route-{index}"
+
+    class RouteService:
+
+        def __init__(self, logger: Logger):
+            self.__logger = logger
+
+    commands = []
+    for _ in range(0, COMMANDS_PER_ROUTE):
+        class RouteCommand:
+
+            def __init__(self, service: RouteService):
+                self.__service = service
+
+            def run(self, context: ApplicationContext) -> None:
+                ...
+
+        commands.append(RouteCommand)
+
+    class RouteSequenceBuilder(FluentSequenceBuilder):
+
+        def __init__(self, command_1: commands[0], command_2: commands[1], command_3: commands[2],
+                     command_4: commands[3]):
+            super().__init__()
+            self.__commands = [command_1, command_2, command_3, command_4]
+
+        def build(self):
+            for command in self.__commands:
+                self._add_command(command)
+
+    class RouteRequestHandler(ApiRequestHandlerBase):
+
+        def __init__(self, sequence: RouteSequenceBuilder,
+                     command_pipeline: TopLevelSequenceRunner,
+                     deserializer: Deserializer,
+                     logger: Logger):
+            super().__init__(route_key, sequence, command_pipeline, deserializer, logger)
+
+    return route_key, RouteRequestHandler, [RouteService, RouteSequenceBuilder, *commands]
+
+
+ROUTES = [build_route(index) for index in range(0, ROUTE_COUNT)]
+
+
+def cold_start(lazy: bool) -> tuple[float, float]:
+    start = time.perf_counter()
+    services = Container()
+    register_web(services=services, default_error_handling_strategy=USE_RESPONSE_ERROR)
+    services.register(Logger, QuietLogger)
+    for route_key, request_handler, dependencies in ROUTES:
+        for dependency in dependencies:
+            services.register(dependency)
+        if lazy:
+            services.register_lazy_request_handler(route_key=route_key, implementation=request_handler)
+        else:
+            services.register(ApiRequestHandler, request_handler)
+    lambda_runner = services.resolve(LambdaRunner)
+    resolved = time.perf_counter()
+    lambda_runner.run(event={"routeKey": ROUTES[0][0]}, context={})
+    return resolved - start, time.perf_counter() - start
+
+
+def main():
+    print(f"{ROUTE_COUNT} routes, {COMMANDS_PER_ROUTE} commands per route, best of {REPEAT}")
+    print(f"{'mode':>6} {'resolve LambdaRunner (ms)':>26} {'first request (ms)':>19}")
+    for lazy in (False, True):
+        timings = [cold_start(lazy=lazy) for _ in range(0, REPEAT)]
+        resolve = min(map(lambda x: x[0], timings))
+        first_request = min(map(lambda x: x[1], timings))
+        print(f"{'lazy' if lazy else 'eager':>6} {resolve * 1e3:>26.2f} {first_request * 1e3:>19.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+import time
+
+import punq
+
+from benchmarks import QuietLogger
+from benchmarks.bench_cold_start import ROUTES, ROUTE_COUNT, COMMANDS_PER_ROUTE
+from formula_thoughts_web.abstractions import ApiRequestHandler, Logger
+from formula_thoughts_web.application import USE_RESPONSE_ERROR
+from formula_thoughts_web.ioc import Container, LambdaRunner, register_web
+
+REPEAT = 20
+TRANSIENT_RESOLVES = 20
+
+
+def build_container(scope: punq.Scope) -> Container:
+    services = Container()
+    register_web(services=services, default_error_handling_strategy=USE_RESPONSE_ERROR)
+    services.register(Logger, QuietLogger)
+    for _, request_handler, dependencies in ROUTES:
+        for dependency in dependencies:
+            services.register(dependency, scope=scope)
+        services.register(request_handler, scope=scope)
+        services.register(ApiRequestHandler, request_handler, scope=scope)
+    return services
+
+
+def cold_start(compiled: bool) -> tuple[float, float]:
+    services = build_container(scope=punq.Scope.singleton)
+    start = time.perf_counter()
+    if compiled:
+        services.compile()
+    compiled_at = time.perf_counter()
+    services.resolve(LambdaRunner)
+    return compiled_at - start, time.perf_counter() - start
+
+
+def transient_resolves(compiled: bool) -> float:
+    services = build_container(scope=punq.Scope.transient)
+    if compiled:
+        services.compile()
+    start = time.perf_counter()
+    for _ in range(0, TRANSIENT_RESOLVES):
+        for _, request_handler, _ in ROUTES:
+            services.resolve(request_handler)
+    return (time.perf_counter() - start) / TRANSIENT_RESOLVES
+
+
+def main():
+    print(f"{ROUTE_COUNT} routes, {COMMANDS_PER_ROUTE} commands per route, best of {REPEAT}")
+    print(f"{'mode':>9} {'compile (ms)':>13} {'cold resolve (ms)':>18} {'transient resolve all (ms)':>27}")
+    for compiled in (False, True):
+        timings = [cold_start(compiled=compiled) for _ in range(0, REPEAT)]
+        compile_time = min(map(lambda x: x[0], timings))
+        cold_resolve = min(map(lambda x: x[1], timings))
+        transient = min(transient_resolves(compiled=compiled) for _ in range(0, REPEAT))
+        print(f"{'compiled' if compiled else 'punq':>9} {compile_time * 1e3:>13.2f} {cold_resolve * 1e3:>18.2f} "
+              f"{transient * 1e3:>27.2f}")
+
+
+if __name__ == '__main__':
+    main()
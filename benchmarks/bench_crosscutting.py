@@ -0,0 +1,126 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from importlib import metadata
+
+from benchmarks.fixtures import build_fixtures, Fixture, FIXTURE_BUILDERS
+from formula_thoughts_web.crosscutting import ObjectMapper, JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer
+
+MAP = "map"
+MAP_FROM_DICT = "map_from_dict"
+MAP_TO_DICT = "map_to_dict"
+SERIALIZE = "serialize"
+DESERIALIZE = "deserialize"
+OPERATIONS = [MAP, MAP_FROM_DICT, MAP_TO_DICT, SERIALIZE, DESERIALIZE]
+
+
+def build_operations(fixture: Fixture, object_mapper: ObjectMapper, serializer: JsonSnakeToCamelSerializer,
+                     deserializer: JsonCamelToSnakeDeserializer) -> dict:
+    data = object_mapper.map_to_dict(_from=fixture.dto, to=fixture.dto_type)
+    body = serializer.serialize(data=data)
+    return {
+        MAP: lambda: object_mapper.map(_from=fixture.dto, to=fixture.dto_type),
+        MAP_FROM_DICT: lambda: object_mapper.map_from_dict(_from=data, to=fixture.dto_type),
+        MAP_TO_DICT: lambda: object_mapper.map_to_dict(_from=fixture.dto, to=fixture.dto_type),
+        SERIALIZE: lambda: serializer.serialize(data=data),
+        DESERIALIZE: lambda: deserializer.deserialize(data=body)
+    }
+
+
+def measure(operation, number: int, repeat: int) -> dict:
+    timings = [timing / number * 1e6 for timing in timeit.repeat(operation, number=number, repeat=repeat)]
+    return {
+        "mean_us": round(statistics.mean(timings), 3),
+        "min_us": round(min(timings), 3),
+        "stdev_us": round(statistics.stdev(timings), 3) if len(timings) > 1 else 0.0
+    }
+
+
+def get_package_version() -> str:
+    try:
+        return metadata.version("formula-thoughts-web")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def run(shapes: list[str], operations: list[str], number: int, repeat: int) -> dict:
+    object_mapper = ObjectMapper()
+    serializer = JsonSnakeToCamelSerializer()
+    deserializer = JsonCamelToSnakeDeserializer()
+    results = []
+    for fixture in build_fixtures(shapes=shapes):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fixture_operations = build_operations(fixture=fixture,
+                                                  object_mapper=object_mapper,
+                                                  serializer=serializer,
+                                                  deserializer=deserializer)
+            for operation in operations:
+                results.append({"shape": fixture.shape,
+                                "size": fixture.size,
+                                "operation": operation,
+                                **measure(operation=fixture_operations[operation], number=number, repeat=repeat)})
+    return {
+        "package_version": get_package_version(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "number": number,
+        "repeat": repeat,
+        "results": results
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[dict]:
+    baseline_results = {(result["shape"], result["size"], result["operation"]): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        previous = baseline_results.get((result["shape"], result["size"], result["operation"]))
+        if previous is None or previous["min_us"] == 0:
+            continue
+        ratio = result["min_us"] / previous["min_us"]
+        if ratio > 1 + tolerance:
+            regressions.append({"shape": result["shape"],
+                                "size": result["size"],
+                                "operation": result["operation"],
+                                "baseline_min_us": previous["min_us"],
+                                "min_us": result["min_us"],
+                                "ratio": round(ratio, 3)})
+    return regressions
+
+
+def main(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="measure crosscutting serialization and mapping hot paths")
+    parser.add_argument("--shape", action="append", choices=list(FIXTURE_BUILDERS), dest="shapes")
+    parser.add_argument("--operation", action="append", choices=OPERATIONS, dest="operations")
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", help="JSON report of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+    report = run(shapes=args.shapes,
+                 operations=OPERATIONS if args.operations is None else args.operations,
+                 number=args.number,
+                 repeat=args.repeat)
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            report["regressions"] = compare(report=report, baseline=json.load(file), tolerance=args.tolerance)
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if any(report.get("regressions", [])):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
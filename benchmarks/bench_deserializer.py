@@ -0,0 +1,48 @@
+import json
+import time
+import tracemalloc
+
+from formula_thoughts_web.crosscutting import JsonCamelToSnakeDeserializer, KeyCaseCache
+
+BODY_SIZES = [1024 * 1024, 10 * 1024 * 1024]
+
+
+def build_body(size: int) -> str:
+    item = {"ingredientName": "strong white flour", "weightG": 500.5, "addedAt": "2024-01-01T12:00:00",
+            "nutritionValues": [{"nutrientName": "protein", "amountG": 12.5}, {"nutrientName": "fibreContent", "amountG": 3.1}]}
+    item_size = len(json.dumps(item)) + 2
+    return json.dumps({"recipeId": "recipe-1", "ingredientList": [item] * (size // item_size)})
+
+
+def two_pass_deserialize(data: str, key_case_cache: KeyCaseCache):
+    def convert(d):
+        if isinstance(d, list):
+            return [convert(i) if isinstance(i, (dict, list)) else i for i in d]
+        return {key_case_cache.to_snake_case(a): convert(b) if isinstance(b, (dict, list)) else b for a, b in d.items()}
+    return convert(json.loads(data))
+
+
+def measure(deserialize) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    deserialize()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    key_case_cache = KeyCaseCache()
+    deserializer = JsonCamelToSnakeDeserializer(key_case_cache=key_case_cache)
+    print(f"{'body (MB)':>10} {'two pass (ms)':>14} {'two pass peak (MB)':>19} {'hook (ms)':>10} {'hook peak (MB)':>15}")
+    for size in BODY_SIZES:
+        body = build_body(size)
+        two_pass_time, two_pass_peak = measure(lambda: two_pass_deserialize(data=body, key_case_cache=key_case_cache))
+        hook_time, hook_peak = measure(lambda: deserializer.deserialize(data=body))
+        print(f"{len(body) / 1024 / 1024:>10.1f} {two_pass_time * 1e3:>14.1f} {two_pass_peak / 1024 / 1024:>19.1f} "
+              f"{hook_time * 1e3:>10.1f} {hook_peak / 1024 / 1024:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import contextlib
+import io
+import timeit
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from formula_thoughts_web.crosscutting import ObjectMapper, JsonSnakeToCamelSerializer, JsonDtoEncoder
+
+ITEM_COUNTS = [1, 10, 100]
+NUMBER = 50
+
+
+@dataclass
+class IngredientDto:
+    ingredient_name: str = None
+    weight_g: Decimal = None
+    added_at: datetime = None
+
+
+@dataclass
+class RecipeDto:
+    recipe_id: str = None
+    recipe_name: str = None
+    oven_temperature_c: int = None
+    ingredients: list[IngredientDto] = None
+
+
+def build_recipe(count: int) -> RecipeDto:
+    return RecipeDto(recipe_id="recipe-1",
+                     recipe_name="sourdough",
+                     oven_temperature_c=230,
+                     ingredients=[IngredientDto(ingredient_name=f"ingredient {i}",
+                                                weight_g=Decimal(i) / 4,
+                                                added_at=datetime(2024, 1, 1, 12, i % 60))
+                                  for i in range(0, count)])
+
+
+def main():
+    object_mapper = ObjectMapper()
+    serializer = JsonSnakeToCamelSerializer()
+    dto_encoder = JsonDtoEncoder()
+    print(f"{'items':>6} {'map + serialize (us)':>21} {'single pass (us)':>17}")
+    for count in ITEM_COUNTS:
+        recipe = build_recipe(count)
+        with contextlib.redirect_stdout(io.StringIO()):
+            double_walk = timeit.timeit(lambda: serializer.serialize(
+                data=object_mapper.map_to_dict(_from=recipe, to=RecipeDto)), number=NUMBER)
+        single_pass = timeit.timeit(lambda: dto_encoder.encode(dto=recipe, to=RecipeDto), number=NUMBER)
+        print(f"{count:>6} {double_walk / NUMBER * 1e6:>21.1f} {single_pass / NUMBER * 1e6:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
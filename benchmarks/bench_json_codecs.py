@@ -0,0 +1,42 @@
+import contextlib
+import io
+import timeit
+
+from benchmarks.bench_dto_encoder import build_recipe, RecipeDto
+from formula_thoughts_web.crosscutting import JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer, ObjectMapper, \
+    StdlibJsonCodec, OrjsonJsonCodec, orjson
+
+ITEM_COUNTS = [1, 10, 100]
+NUMBER = 50
+
+
+def build_codecs() -> dict:
+    codecs = {"stdlib": StdlibJsonCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonJsonCodec()
+    return codecs
+
+
+def main():
+    codecs = build_codecs()
+    if orjson is None:
+        print("orjson is not installed, only the stdlib codec is measured")
+    print(f"{'codec':>8} {'items':>6} {'serialize (us)':>15} {'deserialize (us)':>17} {'map_to_dict (us)':>17}")
+    for name, codec in codecs.items():
+        serializer = JsonSnakeToCamelSerializer(json_codec=codec)
+        deserializer = JsonCamelToSnakeDeserializer(json_codec=codec)
+        object_mapper = ObjectMapper(json_codec=codec)
+        for count in ITEM_COUNTS:
+            recipe = build_recipe(count)
+            with contextlib.redirect_stdout(io.StringIO()):
+                data = object_mapper.map_to_dict(_from=recipe, to=RecipeDto)
+                mapped = timeit.timeit(lambda: object_mapper.map_to_dict(_from=recipe, to=RecipeDto), number=NUMBER)
+            body = serializer.serialize(data=data)
+            serialized = timeit.timeit(lambda: serializer.serialize(data=data), number=NUMBER)
+            deserialized = timeit.timeit(lambda: deserializer.deserialize(data=body), number=NUMBER)
+            print(f"{name:>8} {count:>6} {serialized / NUMBER * 1e6:>15.1f} {deserialized / NUMBER * 1e6:>17.1f} "
+                  f"{mapped / NUMBER * 1e6:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
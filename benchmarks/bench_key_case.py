@@ -0,0 +1,42 @@
+import re
+import timeit
+
+from formula_thoughts_web.crosscutting import KeyCaseCache
+
+KEY_COUNTS = [10, 100, 1000]
+NUMBER = 200
+
+
+def build_keys(count: int) -> list[str]:
+    return [f"field_{i}_value_in_grams" for i in range(0, count)]
+
+
+def uncached_to_camel_case(key: str) -> str:
+    components = key.split('_')
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+
+def uncached_to_snake_case(key: str) -> str:
+    words = re.findall(r'[A-Z]?[a-z]+|[A-Z]{1,}(?=[A-Z][a-z]|\d|\W|$)|\d+', key)
+    return '_'.join(map(str.lower, words))
+
+
+def main():
+    print(f"{'keys':>6} {'uncached camel (ns)':>20} {'cached camel (ns)':>18} "
+          f"{'uncached snake (ns)':>20} {'cached snake (ns)':>18}")
+    for count in KEY_COUNTS:
+        snake_keys = build_keys(count)
+        camel_keys = [uncached_to_camel_case(key) for key in snake_keys]
+        key_case_cache = KeyCaseCache()
+        results = [
+            timeit.timeit(lambda: [uncached_to_camel_case(key) for key in snake_keys], number=NUMBER),
+            timeit.timeit(lambda: [key_case_cache.to_camel_case(key) for key in snake_keys], number=NUMBER),
+            timeit.timeit(lambda: [uncached_to_snake_case(key) for key in camel_keys], number=NUMBER),
+            timeit.timeit(lambda: [key_case_cache.to_snake_case(key) for key in camel_keys], number=NUMBER)
+        ]
+        per_key = [result / (NUMBER * count) * 1e9 for result in results]
+        print(f"{count:>6} {per_key[0]:>20.1f} {per_key[1]:>18.1f} {per_key[2]:>20.1f} {per_key[3]:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
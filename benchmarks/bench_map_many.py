@@ -0,0 +1,44 @@
+import time
+
+from benchmarks.fixtures import build_long_list, IngredientDto
+from formula_thoughts_web.crosscutting import ObjectMapper
+
+ITEM_COUNT = 10_000
+REPEAT = 5
+
+
+def throughput(run, count: int) -> float:
+    timings = []
+    for _ in range(0, REPEAT):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return count / min(timings)
+
+
+def main():
+    object_mapper = ObjectMapper()
+    items = build_long_list(ITEM_COUNT).dto.ingredients
+    dicts = object_mapper.map_to_dict_many(_from=items, to=IngredientDto)
+    runs = [
+        ("map",
+         lambda: [object_mapper.map(_from=item, to=IngredientDto) for item in items],
+         lambda: object_mapper.map_many(_from=items, to=IngredientDto),
+         lambda: object_mapper.map_many(_from=items, to=IngredientDto, lazy=True)),
+        ("map_from_dict",
+         lambda: [object_mapper.map_from_dict(_from=item, to=IngredientDto) for item in dicts],
+         lambda: object_mapper.map_from_dict_many(_from=dicts, to=IngredientDto),
+         lambda: object_mapper.map_from_dict_many(_from=dicts, to=IngredientDto, lazy=True)),
+        ("map_to_dict",
+         lambda: [object_mapper.map_to_dict(_from=item, to=IngredientDto) for item in items],
+         lambda: object_mapper.map_to_dict_many(_from=items, to=IngredientDto),
+         lambda: object_mapper.map_to_dict_many(_from=items, to=IngredientDto, lazy=True))
+    ]
+    print(f"{'operation':>14} {'per item (items/s)':>19} {'many (items/s)':>15} {'lazy (items/s)':>15}")
+    for name, per_item, many, lazy in runs:
+        print(f"{name:>14} {throughput(per_item, ITEM_COUNT):>19,.0f} {throughput(many, ITEM_COUNT):>15,.0f} "
+              f"{throughput(lambda: list(lazy()), ITEM_COUNT):>15,.0f}")
+
+
+if __name__ == '__main__':
+    main()
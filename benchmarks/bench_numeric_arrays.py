@@ -0,0 +1,63 @@
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from decimal import Decimal
+
+from formula_thoughts_web.crosscutting import ObjectMapper, JsonDtoEncoder, FloatArray
+
+SAMPLE_COUNTS = [10_000, 50_000]
+REPEAT = 3
+
+
+@dataclass
+class DecimalTelemetryDto:
+    lap: int = None
+    speeds: list[Decimal] = None
+
+
+@dataclass
+class ArrayTelemetryDto:
+    lap: int = None
+    speeds: FloatArray = None
+
+
+def best_time(run) -> float:
+    timings = []
+    for _ in range(0, REPEAT):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained_bytes(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current
+
+
+def main():
+    object_mapper = ObjectMapper()
+    dto_encoder = JsonDtoEncoder()
+    print(f"{'samples':>8} {'dto':>19} {'memory (KB)':>12} {'map_from_dict (ms)':>19} {'map_to_dict (ms)':>17} "
+          f"{'encode (ms)':>12}")
+    for count in SAMPLE_COUNTS:
+        source = json.loads(json.dumps({"lap": 1, "speeds": [300 + i / 1000 for i in range(0, count)]}))
+        for to in [DecimalTelemetryDto, ArrayTelemetryDto]:
+            dto = object_mapper.map_from_dict(_from=source, to=to)
+            memory = retained_bytes(lambda: object_mapper.map_from_dict(_from=source, to=to))
+            map_from_dict = best_time(lambda: object_mapper.map_from_dict(_from=source, to=to))
+            map_to_dict = best_time(lambda: object_mapper.map_to_dict(_from=dto, to=to))
+            encode = best_time(lambda: dto_encoder.encode(dto=dto, to=to))
+            print(f"{count:>8} {to.__name__:>19} {memory / 1024:>12.1f} {map_from_dict * 1e3:>19.2f} "
+                  f"{map_to_dict * 1e3:>17.2f} {encode * 1e3:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
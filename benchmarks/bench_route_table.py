@@ -0,0 +1,43 @@
+import timeit
+
+from formula_thoughts_web.web import RouteTable
+
+ROUTE_COUNTS = [10, 100, 1000]
+NUMBER = 20000
+
+
+class BenchmarkRouteHandler:
+
+    def __init__(self, route_key: str):
+        self.route_key = route_key
+
+
+def build_handlers(count: int) -> list[BenchmarkRouteHandler]:
+    handlers = []
+    for i in range(0, count):
+        if i % 2 == 0:
+            handlers.append(BenchmarkRouteHandler(f"GET /resource-{i}/items"))
+        else:
+            handlers.append(BenchmarkRouteHandler(f"GET /resource-{i}/items/{{item_id}}"))
+    return handlers
+
+
+def linear_lookup(handlers: list[BenchmarkRouteHandler], route_key: str):
+    return list(filter(lambda x: x.route_key == route_key, handlers))[0]
+
+
+def main():
+    print(f"{'routes':>8} {'linear exact (us)':>18} {'indexed exact (us)':>19} {'indexed template (us)':>22}")
+    for count in ROUTE_COUNTS:
+        handlers = build_handlers(count)
+        route_table = RouteTable(request_handlers=handlers)
+        last_exact = f"GET /resource-{count - 2}/items"
+        last_template = f"GET /resource-{count - 1}/items/1234"
+        linear = timeit.timeit(lambda: linear_lookup(handlers, last_exact), number=NUMBER)
+        exact = timeit.timeit(lambda: route_table.match(route_key=last_exact), number=NUMBER)
+        template = timeit.timeit(lambda: route_table.match(route_key=last_template), number=NUMBER)
+        print(f"{count:>8} {linear / NUMBER * 1e6:>18.3f} {exact / NUMBER * 1e6:>19.3f} {template / NUMBER * 1e6:>22.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from formula_thoughts_web.crosscutting import ObjectMapper
+
+ITEM_COUNT = 100_000
+
+
+@dataclass
+class ReadingDto:
+    sensor_id: str = None
+    reading: Decimal = None
+    recorded_at: datetime = None
+    healthy: bool = None
+
+
+@dataclass(slots=True)
+class SlottedReadingDto:
+    sensor_id: str = None
+    reading: Decimal = None
+    recorded_at: datetime = None
+    healthy: bool = None
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenReadingDto:
+    sensor_id: str = None
+    reading: Decimal = None
+    recorded_at: datetime = None
+    healthy: bool = None
+
+
+def build_items(count: int) -> list[dict]:
+    return [{"sensor_id": "sensor-1", "reading": "21.5", "recorded_at": "2024-01-01T12:00:00", "healthy": True}
+            for _ in range(0, count)]
+
+
+def measure(object_mapper: ObjectMapper, items: list[dict], to: type) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = [object_mapper.map_from_dict(_from=item, to=to) for item in items]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return elapsed, current
+
+
+def main():
+    object_mapper = ObjectMapper()
+    items = build_items(ITEM_COUNT)
+    print(f"{'dto':>18} {'map (ms)':>9} {'retained (MB)':>14} {'per object (B)':>15}")
+    for to in [ReadingDto, SlottedReadingDto, FrozenReadingDto]:
+        elapsed, retained = measure(object_mapper=object_mapper, items=items, to=to)
+        print(f"{to.__name__:>18} {elapsed * 1e3:>9.1f} {retained / 1024 / 1024:>14.1f} {retained / ITEM_COUNT:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import time
+
+from benchmarks import QuietLogger
+from benchmarks.bench_cold_start import ROUTES, ROUTE_COUNT
+from formula_thoughts_web.abstractions import Logger
+from formula_thoughts_web.application import USE_RESPONSE_ERROR
+from formula_thoughts_web.ioc import Container, LambdaApplication, LambdaRunner, register_web
+
+INVOCATIONS = 50
+EVENT = {"routeKey": ROUTES[0][0]}
+
+
+def register_dependencies(services: Container) -> None:
+    services.register(Logger, QuietLogger)
+    for route_key, request_handler, dependencies in ROUTES:
+        for dependency in dependencies:
+            services.register(dependency)
+        services.register_lazy_request_handler(route_key=route_key, implementation=request_handler)
+
+
+def handler(event: dict, context: dict) -> dict:
+    services = Container()
+    register_web(services=services, default_error_handling_strategy=USE_RESPONSE_ERROR)
+    register_dependencies(services=services)
+    return services.resolve(LambdaRunner).run(event=event, context=context)
+
+
+def measure(run) -> float:
+    start = time.perf_counter()
+    for _ in range(0, INVOCATIONS):
+        run(event=EVENT, context={})
+    return (time.perf_counter() - start) / INVOCATIONS
+
+
+def main():
+    application = LambdaApplication(register_dependencies=register_dependencies,
+                                    default_error_handling_strategy=USE_RESPONSE_ERROR)
+    application.run(event=EVENT, context={})
+    print(f"{ROUTE_COUNT} routes, {INVOCATIONS} warm invocations")
+    print(f"{'entry point':>18} {'per invocation (ms)':>20}")
+    print(f"{'handler':>18} {measure(handler) * 1e3:>20.3f}")
+    print(f"{'LambdaApplication':>18} {measure(application.run) * 1e3:>20.3f}")
+
+
+if __name__ == '__main__':
+    main()
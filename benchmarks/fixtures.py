@@ -0,0 +1,117 @@
+import dataclasses
+import typing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+
+WIDE = "wide"
+DEEP = "deep"
+LONG_LIST = "long_list"
+
+FIELD_TYPES = [str, int, float, Decimal, datetime]
+START_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class Unit(str, Enum):
+    GRAMS = "grams"
+    MILLILITRES = "millilitres"
+    PIECES = "pieces"
+
+
+@dataclass
+class IngredientDto:
+    ingredient_name: str = None
+    quantity: Decimal = None
+    unit: Unit = None
+    added_at: datetime = None
+    optional: bool = None
+
+
+@dataclass
+class RecipeDto:
+    recipe_id: str = None
+    recipe_name: str = None
+    oven_temperature_c: int = None
+    proving_hours: float = None
+    created_at: datetime = None
+    ingredients: list[IngredientDto] = None
+
+
+@dataclass
+class Fixture:
+    shape: str
+    size: int
+    dto_type: typing.Type
+    dto: typing.Any
+
+
+def build_value(_type: typing.Type, index: int) -> typing.Any:
+    if _type is str:
+        return f"value {index}"
+    if _type is int:
+        return index * 7
+    if _type is float:
+        return index / 8
+    if _type is Decimal:
+        return Decimal(index) / 4
+    return START_TIME + timedelta(minutes=index)
+
+
+def build_wide(size: int) -> Fixture:
+    field_types = [FIELD_TYPES[i % len(FIELD_TYPES)] for i in range(0, size)]
+    dto_type = dataclasses.make_dataclass(f"Wide{size}Dto",
+                                          [(f"field_{i}", _type, dataclasses.field(default=None))
+                                           for i, _type in enumerate(field_types)])
+    dto = dto_type(**{f"field_{i}": build_value(_type=_type, index=i) for i, _type in enumerate(field_types)})
+    return Fixture(shape=WIDE, size=size, dto_type=dto_type, dto=dto)
+
+
+def build_deep(size: int) -> Fixture:
+    dto_type = dataclasses.make_dataclass(f"Deep{size}Level{size}Dto",
+                                          [("level_name", str, dataclasses.field(default=None)),
+                                           ("level_weight", Decimal, dataclasses.field(default=None))])
+    dto = dto_type(level_name=f"level {size}", level_weight=Decimal(size) / 4)
+    for level in range(size - 1, -1, -1):
+        child_type = dto_type
+        dto_type = dataclasses.make_dataclass(f"Deep{size}Level{level}Dto",
+                                              [("level_name", str, dataclasses.field(default=None)),
+                                               ("level_weight", Decimal, dataclasses.field(default=None)),
+                                               ("child", child_type, dataclasses.field(default=None))])
+        dto = dto_type(level_name=f"level {level}", level_weight=Decimal(level) / 4, child=dto)
+    return Fixture(shape=DEEP, size=size, dto_type=dto_type, dto=dto)
+
+
+def build_long_list(size: int) -> Fixture:
+    units = list(Unit)
+    dto = RecipeDto(recipe_id="recipe-1",
+                    recipe_name="sourdough",
+                    oven_temperature_c=230,
+                    proving_hours=12.5,
+                    created_at=START_TIME,
+                    ingredients=[IngredientDto(ingredient_name=f"ingredient {i}",
+                                               quantity=Decimal(i) / 4,
+                                               unit=units[i % len(units)],
+                                               added_at=START_TIME + timedelta(seconds=i),
+                                               optional=i % 2 == 0)
+                                 for i in range(0, size)])
+    return Fixture(shape=LONG_LIST, size=size, dto_type=RecipeDto, dto=dto)
+
+
+FIXTURE_BUILDERS: dict[str, typing.Callable[[int], Fixture]] = {
+    WIDE: build_wide,
+    DEEP: build_deep,
+    LONG_LIST: build_long_list
+}
+
+FIXTURE_SIZES: dict[str, list[int]] = {
+    WIDE: [10, 50, 200],
+    DEEP: [2, 8, 32],
+    LONG_LIST: [10, 100, 1000]
+}
+
+
+def build_fixtures(shapes: list[str] = None) -> list[Fixture]:
+    return [FIXTURE_BUILDERS[shape](size)
+            for shape in (list(FIXTURE_BUILDERS) if shapes is None else shapes)
+            for size in FIXTURE_SIZES[shape]]
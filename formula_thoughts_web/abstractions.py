@@ -1,5 +1,7 @@
 import typing
-from dataclasses import field, dataclass
+from collections.abc import MutableMapping, Mapping
+from dataclasses import dataclass, field, InitVar
+from decimal import Decimal
 from typing import Protocol
 
 
@@ -11,13 +13,154 @@ class Error:
     message: str = None
 
 
+@dataclass
+class RequestValidationError(Error):
+    errors: list[str] = field(default_factory=lambda: [])
+
+
+@dataclass(unsafe_hash=True)
+class ResponseCachePolicy:
+    ttl_seconds: float = 60
+    vary_by_path_parameters: bool = True
+    vary_by_query_parameters: bool = True
+    vary_by_user: bool = False
+
+
 @dataclass(unsafe_hash=True)
-class ApplicationContext:
-    body: dict = None
+class PayloadLimits:
+    max_body_bytes: int = None
+    max_depth: int = None
+    max_elements: int = None
+
+
+@dataclass(unsafe_hash=True)
+class RouteOptions:
+    compress_response: bool = True
+    cache: ResponseCachePolicy = None
+    payload_limits: PayloadLimits = None
+    body_schema: dict = None
+    body_type: typing.Type = None
+
+
+@dataclass
+class EventOptions:
+    schema: dict = None
+    validate_event_type: bool = False
+    blob_store: 'BlobStore' = None
+    lazy_mapping: bool = False
+
+
+@dataclass
+class StreamingResponse:
+    items: typing.Iterable = None
+    item_type: typing.Type = None
+    status_code: int = 200
+
+
+VARIABLE_CONVERTERS: dict[typing.Type, typing.Callable[[str], typing.Any]] = {
+    int: int,
+    float: float,
+    Decimal: Decimal,
+    bool: lambda x: x.strip().lower() in ("true", "1", "yes")
+}
+
+
+def convert_variable(value: typing.Any, _type: typing.Type[TVar]) -> TVar:
+    if not isinstance(value, str) or _type not in VARIABLE_CONVERTERS:
+        return value
+    return VARIABLE_CONVERTERS[_type](value)
+
+
+class RequestVariables(MutableMapping):
+    __slots__ = ("__layers", "__overlay", "__deleted", "__converted")
+
+    def __init__(self, *layers: typing.Optional[Mapping]):
+        self.__layers = tuple(layer for layer in layers if layer)
+        self.__overlay = {}
+        self.__deleted = set()
+        self.__converted: dict[str, dict[typing.Type, typing.Any]] = {}
+
+    def __getitem__(self, key):
+        if key in self.__overlay:
+            return self.__overlay[key]
+        if key not in self.__deleted:
+            for layer in self.__layers:
+                if key in layer:
+                    return layer[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value) -> None:
+        self.__overlay[key] = value
+        self.__deleted.discard(key)
+        self.__converted.pop(key, None)
+
+    def __delitem__(self, key) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self.__overlay.pop(key, None)
+        self.__deleted.add(key)
+        self.__converted.pop(key, None)
+
+    def __iter__(self) -> typing.Iterator:
+        seen = set(self.__overlay)
+        yield from self.__overlay
+        for layer in self.__layers:
+            for key in layer:
+                if key not in seen and key not in self.__deleted:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"RequestVariables({dict(self.items())!r})"
+
+    def get_typed(self, name: str, _type: typing.Type[TVar]) -> TVar:
+        conversions = self.__converted.setdefault(name, {})
+        if _type not in conversions:
+            conversions[_type] = convert_variable(value=self[name], _type=_type)
+        return conversions[_type]
+
+
+class _DeferredBody:
+    __slots__ = ("_body_loader",)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name != "body" or self._body_loader is None:
+            raise AttributeError(name)
+        self.body = self._body_loader()
+        self._body_loader = None
+        return self.body
+
+
+@dataclass(unsafe_hash=True, slots=True)
+class ApplicationContext(_DeferredBody):
+    body: typing.Any = None
     auth_user_id: str = None
     variables: dict = None
     error_capsules: list[Error] = field(default_factory=lambda: [])
     response: typing.Any = None
+    version_tag: str = None
+    body_loader: InitVar[typing.Callable[[], typing.Any]] = None
+
+    def __post_init__(self, body_loader: typing.Callable[[], typing.Any]):
+        self._body_loader = body_loader
+        if body_loader is not None:
+            del self.body
+
+    @property
+    def body_loaded(self) -> bool:
+        try:
+            object.__getattribute__(self, "body")
+        except AttributeError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        body = self.body if self.body_loaded else "<not decoded>"
+        return f"ApplicationContext(body={body!r}, auth_user_id={self.auth_user_id!r}, variables={self.variables!r}, " \
+               f"error_capsules={self.error_capsules!r}, response={self.response!r}, version_tag={self.version_tag!r})"
 
     def get_var(self, name: str, _type: typing.Type[TVar]) -> TVar:
         return self.variables[name]
@@ -51,10 +194,14 @@ class ApiRequestHandler(Protocol):
     def route_key(self) -> str:
         ...
 
+    @property
+    def options(self) -> RouteOptions:
+        ...
+
 
 class EventHandler(Protocol):
 
-    def run(self, event: str) -> ApplicationContext:
+    def run(self, event: str, content_type: str = "application/json", content_encoding: str = None) -> ApplicationContext:
         ...
 
     @property
@@ -74,15 +221,56 @@ class SequenceBuilder(Protocol):
 SequenceComponent = typing.Union[SequenceBuilder, Command]
 
 
+class JsonCodec(Protocol):
+
+    def dumps(self, data: typing.Any, default: typing.Callable[[typing.Any], typing.Any] = None) -> str:
+        ...
+
+    def loads(self, data: typing.Union[str, bytes],
+              object_pairs_hook: typing.Callable[[list[tuple[str, typing.Any]]], typing.Any] = None) -> typing.Any:
+        ...
+
+
 class Serializer(Protocol):
 
     def serialize(self, data: typing.Union[dict, list]) -> str:
         ...
 
 
+class DtoEncoder(Protocol):
+
+    def encode(self, dto: typing.Any, to: typing.Type = None, preserve_decimal: bool = False) -> str:
+        ...
+
+
+class EventCodec(Protocol):
+
+    @property
+    def content_type(self) -> str:
+        ...
+
+    def supports(self, _type: typing.Type) -> bool:
+        ...
+
+    def encode(self, dto: typing.Any, to: typing.Type) -> str:
+        ...
+
+    def decode(self, data: str, to: typing.Type) -> dict:
+        ...
+
+
+class BlobStore(Protocol):
+
+    def put(self, key: str, data: bytes) -> None:
+        ...
+
+    def get(self, key: str) -> bytes:
+        ...
+
+
 class Deserializer(Protocol):
 
-    def deserialize(self, data: str) -> typing.Union[dict, list]:
+    def deserialize(self, data: typing.Union[str, bytes]) -> typing.Union[dict, list]:
         ...
 
 
@@ -91,6 +279,9 @@ class Logger(Protocol):
     def add_global_properties(self, properties: dict):
         ...
 
+    def clear_global_properties(self):
+        ...
+
     def log_error(self, message: str, properties: dict = None):
         ...
 
@@ -27,6 +27,7 @@ class FluentSequenceBuilder(ABC):
         return self
 
     def generate_sequence(self) -> list[Command]:
+        self.__components = []
         self.build()
         new_list = []
         for (name, component) in self.__components:
@@ -50,6 +51,7 @@ class FluentSequenceBuilder(ABC):
 class ErrorHandlingTypeState:
 
     def __init__(self, default_error_handling_strategy: str):
+        self.__default_error_handling_strategy = default_error_handling_strategy
         self.__error_handling_type: str = default_error_handling_strategy
 
     @property
@@ -60,6 +62,9 @@ class ErrorHandlingTypeState:
     def error_handling_type(self, value: str) -> None:
         self.__error_handling_type = value
 
+    def reset(self) -> None:
+        self.__error_handling_type = self.__default_error_handling_strategy
+
 
 class ExceptionErrorHandlingStrategy:
 
@@ -114,7 +119,8 @@ class TopLevelSequenceRunner:
             try:
                 self.__logger.log_event(message="command event", properties={"action": name})
                 self.__logger.log_info(f"begin command {name}")
-                self.__logger.log_trace(f"request {context.body}")
+                if context.body_loaded:
+                    self.__logger.log_trace(f"request {context.body}")
                 self.__logger.log_trace(f"response {context.response}")
                 command.run(context)
                 # for now, we throw on first error in top level sequence
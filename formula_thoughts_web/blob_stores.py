@@ -0,0 +1,28 @@
+import os
+
+from formula_thoughts_web.exceptions import BlobNotFoundException
+
+
+class FileSystemBlobStore:
+
+    def __init__(self, root_path: str):
+        self.__root_path = os.path.abspath(root_path)
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.__get_path(key=key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(data)
+
+    def get(self, key: str) -> bytes:
+        path = self.__get_path(key=key)
+        if not os.path.isfile(path):
+            raise BlobNotFoundException(f"blob {key} does not exist")
+        with open(path, 'rb') as file:
+            return file.read()
+
+    def __get_path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.__root_path, key))
+        if os.path.commonpath([self.__root_path, path]) != self.__root_path or path == self.__root_path:
+            raise BlobNotFoundException(f"blob key {key} is outside of the blob store")
+        return path
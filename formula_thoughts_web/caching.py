@@ -0,0 +1,116 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+from dataclasses import dataclass
+
+CacheKey = tuple[str, tuple, tuple, typing.Optional[str]]
+
+
+@dataclass
+class CachedResponse:
+    status_code: int = None
+    body: str = None
+    etag: str = None
+
+
+@dataclass
+class CacheStatistics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+
+class _CacheEntry:
+    __slots__ = ("response", "expires_at", "size_bytes")
+
+    def __init__(self, response: CachedResponse, expires_at: float, size_bytes: int):
+        self.response = response
+        self.expires_at = expires_at
+        self.size_bytes = size_bytes
+
+
+class ResponseCache:
+
+    def __init__(self, max_entries: int = 1024,
+                 max_bytes: int = 16 * 1024 * 1024,
+                 clock: typing.Callable[[], float] = time.monotonic):
+        self.__clock = clock
+        self.__max_bytes = max_bytes
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__size_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: CacheKey) -> typing.Optional[CachedResponse]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+                return None
+            if entry.expires_at <= self.__clock():
+                self.__remove(key=key)
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry.response
+
+    def set(self, key: CacheKey, response: CachedResponse, ttl_seconds: float) -> None:
+        size_bytes = len(response.body or "") + len(key[0])
+        if size_bytes > self.__max_bytes:
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key=key)
+            self.__entries[key] = _CacheEntry(response=response,
+                                              expires_at=self.__clock() + ttl_seconds,
+                                              size_bytes=size_bytes)
+            self.__size_bytes += size_bytes
+            while len(self.__entries) > self.__max_entries or self.__size_bytes > self.__max_bytes:
+                oldest_key = next(iter(self.__entries))
+                self.__remove(key=oldest_key)
+                self.__evictions += 1
+
+    def invalidate(self, route_key: str, path_parameters: dict = None) -> int:
+        with self.__lock:
+            keys = list(filter(lambda x: self.__matches(key=x, route_key=route_key, path_parameters=path_parameters),
+                               self.__entries.keys()))
+            for key in keys:
+                self.__remove(key=key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__size_bytes = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(hits=self.__hits,
+                                   misses=self.__misses,
+                                   evictions=self.__evictions,
+                                   entries=len(self.__entries),
+                                   size_bytes=self.__size_bytes)
+
+    def __remove(self, key: CacheKey) -> None:
+        entry = self.__entries.pop(key)
+        self.__size_bytes -= entry.size_bytes
+
+    @staticmethod
+    def __matches(key: CacheKey, route_key: str, path_parameters: typing.Optional[dict]) -> bool:
+        if key[0] != route_key:
+            return False
+        if path_parameters is None or len(key[1]) == 0:
+            return True
+        cached_path_parameters = dict(key[1])
+        return all(cached_path_parameters.get(name) == str(value) for name, value in path_parameters.items())
+
+
+NULL_RESPONSE_CACHE = ResponseCache(max_entries=0)
@@ -1,16 +1,33 @@
+import array
 import base64
+import functools
 import inspect
 import json
 import re
 import typing
+from dataclasses import is_dataclass, fields as dataclass_fields, MISSING
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from json.encoder import encode_basestring_ascii
 
 import dateutil
 
-from formula_thoughts_web.abstractions import Serializer
-from formula_thoughts_web.exceptions import MappingException
+from formula_thoughts_web.abstractions import Serializer, JsonCodec, Logger
+from formula_thoughts_web.exceptions import MappingException, PayloadTooComplexException, JsonCodecNotFoundException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+STDLIB_JSON_CODEC = "stdlib"
+ORJSON_JSON_CODEC = "orjson"
 
 
 class LogSeverity(Enum):
@@ -51,6 +68,9 @@ class JsonConsoleLogger:
     def add_global_properties(self, properties: dict):
         self.__request_props = properties
 
+    def clear_global_properties(self):
+        self.__request_props = {}
+
     def log_error(self, message: str, properties: dict = None):
         self.__log(_type=LogSeverity.ERROR, message=message, properties=properties)
 
@@ -70,6 +90,52 @@ class JsonConsoleLogger:
         self.__log(_type=LogSeverity.TRACE, message=message, properties=properties)
 
 
+class StdlibJsonCodec:
+
+    def dumps(self, data: typing.Any, default: typing.Callable[[typing.Any], typing.Any] = None) -> str:
+        return json.dumps(data, default=default)
+
+    def loads(self, data: typing.Union[str, bytes],
+              object_pairs_hook: typing.Callable[[list[tuple[str, typing.Any]]], typing.Any] = None) -> typing.Any:
+        return json.loads(data, object_pairs_hook=object_pairs_hook)
+
+
+class OrjsonJsonCodec:
+
+    def __init__(self):
+        self.__fallback = StdlibJsonCodec()
+
+    def dumps(self, data: typing.Any, default: typing.Callable[[typing.Any], typing.Any] = None) -> str:
+        try:
+            return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS |
+                                orjson.OPT_PASSTHROUGH_DATACLASS |
+                                orjson.OPT_PASSTHROUGH_DATETIME).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return self.__fallback.dumps(data=data, default=default)
+
+    def loads(self, data: typing.Union[str, bytes],
+              object_pairs_hook: typing.Callable[[list[tuple[str, typing.Any]]], typing.Any] = None) -> typing.Any:
+        # orjson has no object_pairs_hook, and applying one to its output in python is slower than the stdlib
+        # scanner calling it directly, so hooked loads always go through the stdlib codec
+        if object_pairs_hook is not None:
+            return self.__fallback.loads(data=data, object_pairs_hook=object_pairs_hook)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self.__fallback.loads(data=data)
+
+
+def create_json_codec(name: str = STDLIB_JSON_CODEC) -> JsonCodec:
+    if name == ORJSON_JSON_CODEC:
+        return StdlibJsonCodec() if orjson is None else OrjsonJsonCodec()
+    if name == STDLIB_JSON_CODEC:
+        return StdlibJsonCodec()
+    raise JsonCodecNotFoundException(f"json codec {name} not found")
+
+
+DEFAULT_JSON_CODEC = StdlibJsonCodec()
+
+
 def all_annotations(cls):
     d = {}
     for c in cls.mro():
@@ -81,17 +147,173 @@ def all_annotations(cls):
     return d
 
 
+LAZY_FIELDS = "__lazy_fields__"
+
+
+def identity(value):
+    return value
+
+
+class _PendingValue:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _LazyField:
+    __slots__ = ("name", "convert")
+
+    def __init__(self, name: str, convert: typing.Callable):
+        self.name = name
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        values = instance.__dict__
+        try:
+            value = values[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if type(value) is _PendingValue:
+            try:
+                value = self.convert(value.value, identity)
+            except Exception as e:
+                raise MappingException(str(e))
+            values[self.name] = value
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+def create_lazy_proxy_type(to: typing.Type, lazy_fields: dict[str, typing.Callable]) -> typing.Type:
+    namespace = {name: _LazyField(name=name, convert=convert) for name, convert in lazy_fields.items()}
+    namespace[LAZY_FIELDS] = tuple(lazy_fields)
+    namespace["__module__"] = to.__module__
+    namespace["__qualname__"] = to.__qualname__
+    if is_dataclass(to) and to.__dataclass_params__.eq:
+        compared = [field.name for field in dataclass_fields(to) if field.compare]
+
+        def __eq__(self, other):
+            if not isinstance(other, to):
+                return NotImplemented
+            return all(getattr(self, name) == getattr(other, name) for name in compared)
+        namespace["__eq__"] = __eq__
+        namespace["__hash__"] = to.__hash__
+
+    def __reduce__(self):
+        return restore_instance, (to, instance_values(self))
+    namespace["__reduce__"] = __reduce__
+    return type(to.__name__, (to,), namespace)
+
+
+def restore_instance(to: typing.Type, values: dict):
+    instance = to.__new__(to)
+    for name, value in values.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def defer(value, map_callback):
+    return _PendingValue(value)
+
+
+@functools.lru_cache(maxsize=None)
+def slot_names(cls) -> tuple[str, ...]:
+    names = []
+    for c in reversed(cls.mro()):
+        slots = c.__dict__.get("__slots__", ())
+        for name in [slots] if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+def instance_values(obj) -> dict:
+    lazy_fields = getattr(type(obj), LAZY_FIELDS, None)
+    if lazy_fields is not None:
+        names = slot_names(type(obj))
+        if len(names) > 0:
+            return {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+        for name in lazy_fields:
+            getattr(obj, name)
+    try:
+        return vars(obj)
+    except TypeError:
+        names = slot_names(type(obj))
+        if len(names) == 0:
+            raise
+        return {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+
+
 T = typing.TypeVar("T")
 
 
+class NullLogger:
+
+    def add_global_properties(self, properties: dict):
+        ...
+
+    def clear_global_properties(self):
+        ...
+
+    def log_error(self, message: str, properties: dict = None):
+        ...
+
+    def log_exception(self, exception: Exception, properties: dict = None):
+        ...
+
+    def log_info(self, message: str, properties: dict = None):
+        ...
+
+    def log_event(self, message: str, properties: dict = None):
+        ...
+
+    def log_debug(self, message: str, properties: dict = None):
+        ...
+
+    def log_trace(self, message: str, properties: dict = None):
+        ...
+
+
+NULL_LOGGER = NullLogger()
+
+MAP_FROM_OBJECT = "MAP_FROM_OBJECT"
+MAP_FROM_DICT = "MAP_FROM_DICT"
+MAP_TO_DICT = "MAP_TO_DICT"
+MAP_FROM_DICT_LAZILY = "MAP_FROM_DICT_LAZILY"
+SKIP = object()
+
+
+class _MappingPlan:
+    __slots__ = ("target", "converters", "use_constructor", "init_fields")
+
+    def __init__(self, target: typing.Type, converters: dict, use_constructor: bool, init_fields: frozenset):
+        self.target = target
+        self.converters = converters
+        self.use_constructor = use_constructor
+        self.init_fields = init_fields
+
+
 class ObjectMapper:
 
+    def __init__(self, json_codec: JsonCodec = DEFAULT_JSON_CODEC,
+                 logger: Logger = NULL_LOGGER,
+                 log_mappings: bool = False,
+                 max_plans: int = 1024):
+        self.__json_codec = json_codec
+        self.__logger = logger
+        self.__log_mappings = log_mappings
+        self.__get_plan = functools.lru_cache(maxsize=max_plans)(self.__compile_plan)
+
     def map_to_dict_and_ignore_none_fields(self, _from, to: typing.Type[T]) -> dict:
-        print(f"{vars(_from).items()}")
         mapped = self.__generic_map(_from=_from,
                                     to=to,
-                                    propValues=vars(_from).items())
-        new_dict = mapped.__dict__
+                                    prop_values=instance_values(_from).items(),
+                                    mode=MAP_FROM_OBJECT)
+        new_dict = instance_values(mapped)
         self.__to_dict_and_ignore_none_fields(new_dict=new_dict, mapped=mapped)
         return new_dict
 
@@ -103,34 +325,76 @@ class ObjectMapper:
                         new_dict=value,
                         mapped=getattr(mapped, property))
             except TypeError:
-                print(f"value {property} skipped")
+                if self.__log_mappings:
+                    self.__logger.log_debug(message=f"value {property} skipped")
             if value is None:
                 new_dict.pop(property)
 
     def map(self, _from, to: typing.Type[T]) -> T:
-        print(f"{vars(_from).items()}")
         return self.__generic_map(_from=_from,
                                   to=to,
-                                  propValues=vars(_from).items(),
-                                  map_to=lambda x, y: self.map(_from=x, to=y))
+                                  prop_values=instance_values(_from).items(),
+                                  mode=MAP_FROM_OBJECT)
 
     def map_from_dict(self, _from, to: typing.Type[T]) -> T:
-        print(_from.items())
         return self.__generic_map(_from=_from,
                                   to=to,
-                                  propValues=_from.items(),
-                                  map_to=lambda x, y: self.map_from_dict(_from=x, to=y))
+                                  prop_values=_from.items(),
+                                  mode=MAP_FROM_DICT)
 
     def map_to_dict(self, _from, to: typing.Type[T], preserve_decimal=False) -> dict:
-        print(f"{vars(_from).items()}")
         return self.__generic_map(_from=_from,
                                   to=to,
-                                  propValues=vars(_from).items(),
-                                  map_callback=lambda x: self.to_dict(x, preserve_decimal=preserve_decimal),
-                                  map_to=lambda x, y: self.map_to_dict(_from=x, to=y))
+                                  prop_values=instance_values(_from).items(),
+                                  mode=MAP_TO_DICT,
+                                  map_callback=lambda x: self.to_dict(x, preserve_decimal=preserve_decimal))
+
+    def map_from_dict_lazily(self, _from, to: typing.Type[T]) -> T:
+        return self.__generic_map(_from=_from,
+                                  to=to,
+                                  prop_values=_from.items(),
+                                  mode=MAP_FROM_DICT_LAZILY)
+
+    def map_many(self, _from: typing.Iterable, to: typing.Type[T],
+                 lazy: bool = False) -> typing.Union[list[T], typing.Iterator[T]]:
+        mapped = self.__generic_map_many(items=_from,
+                                         to=to,
+                                         get_prop_values=lambda x: instance_values(x).items(),
+                                         mode=MAP_FROM_OBJECT)
+        return mapped if lazy else list(mapped)
+
+    def map_from_dict_many(self, _from: typing.Iterable[dict], to: typing.Type[T],
+                           lazy: bool = False) -> typing.Union[list[T], typing.Iterator[T]]:
+        mapped = self.__generic_map_many(items=_from,
+                                         to=to,
+                                         get_prop_values=lambda x: x.items(),
+                                         mode=MAP_FROM_DICT)
+        return mapped if lazy else list(mapped)
+
+    def map_to_dict_many(self, _from: typing.Iterable, to: typing.Type[T], preserve_decimal=False,
+                         lazy: bool = False) -> typing.Union[list[dict], typing.Iterator[dict]]:
+        mapped = self.__generic_map_many(items=_from,
+                                         to=to,
+                                         get_prop_values=lambda x: instance_values(x).items(),
+                                         mode=MAP_TO_DICT)
+        if lazy:
+            return self.__to_dict_lazily(mapped=mapped, preserve_decimal=preserve_decimal)
+        mapped = list(mapped)
+        try:
+            return self.to_dict(mapped, preserve_decimal=preserve_decimal)
+        except Exception as e:
+            raise MappingException(str(e))
+
+    def __to_dict_lazily(self, mapped: typing.Iterator, preserve_decimal: bool) -> typing.Iterator[dict]:
+        for new_dto in mapped:
+            try:
+                yield self.to_dict(new_dto, preserve_decimal=preserve_decimal)
+            except Exception as e:
+                raise MappingException(str(e))
 
     def to_dict(self, obj, preserve_decimal):
-        return json.loads(json.dumps(obj, default=lambda o: self.default_json_converter(o, preserve_decimal)))
+        return self.__json_codec.loads(
+            data=self.__json_codec.dumps(data=obj, default=lambda o: self.default_json_converter(o, preserve_decimal)))
 
     @staticmethod
     def default_json_converter(object, preserve_decimal):
@@ -141,94 +405,520 @@ class ObjectMapper:
                 return float(str(object))
         elif type(object) == datetime:
             return object.isoformat()
+        elif isinstance(object, NUMERIC_ARRAY_TYPES):
+            return object.tolist()
         else:
-            return object.__dict__
+            return instance_values(object)
 
-    def __generic_map(self, _from, to, propValues, map_to, map_callback=lambda x: x):
+    def __generic_map(self, _from, to, prop_values, mode: str, map_callback=lambda x: x):
         try:
-            new_dto = to()
-            dict_to = all_annotations(to)
-            print("START MAPPING")
-            print(f"all annotations from DTO {dict_to}")
-            print(f"all props from _from {propValues}")
-            for property, value in propValues:
-                if property in dict_to:
-                    if bool(typing.get_type_hints(dict_to[property])):
-                        setattr(new_dto, property, map_callback(map_to(value, dict_to[property])))
-                    elif (typing.get_origin(dict_to[property]) is list and
-                          (bool(typing.get_type_hints(typing.get_args(dict_to[property])[0])))):
-                        collection = []
-                        sub_item_to = typing.get_args(dict_to[property])[0]
-                        for item in value:
-                            collection.append(map_callback(map_to(item, sub_item_to)))
-                        setattr(new_dto, property, collection)
-                    elif dict_to[property] is datetime and type(value) is str:
-                        new_dto.__dict__[property] = datetime.fromisoformat(value)
-                    elif dict_to[property] is Decimal:
-                        if type(value) is str:
-                            new_dto.__dict__[property] = Decimal(value)
-                        elif type(value) is float:
-                            new_dto.__dict__[property] = Decimal(str(value))
-                        else:
-                            new_dto.__dict__[property] = value
-                    elif dict_to[property] == list[Decimal]:
-                        decimals = []
-                        for item in value:
-                            if type(item) is str:
-                                decimals.append(Decimal(item))
-                            elif type(item) is float:
-                                decimals.append(Decimal(str(item)))
-                            else:
-                                decimals.append(item)
-                            new_dto.__dict__[property] = decimals
-                    else:
-                        new_dto.__dict__[property] = value
-            print(f"__generic_map from {type(_from)} {to} and mapped {_from} out -> {new_dto}")
+            new_dto = self.__map_with_plan(to=to,
+                                           plan=self.__get_plan(mode, to),
+                                           prop_values=prop_values,
+                                           map_callback=map_callback)
+            if self.__log_mappings:
+                self.__logger.log_debug(message=f"mapped {type(_from).__name__} to {to.__name__}",
+                                        properties={"source": repr(_from), "target": repr(new_dto)})
             return map_callback(new_dto)
         except Exception as e:
             raise MappingException(str(e))
 
+    def __generic_map_many(self, items: typing.Iterable, to, get_prop_values: typing.Callable,
+                           mode: str) -> typing.Iterator:
+        count = 0
+        try:
+            plan = self.__get_plan(mode, to)
+            for item in items:
+                yield self.__map_with_plan(to=to, plan=plan, prop_values=get_prop_values(item), map_callback=identity)
+                count += 1
+        except Exception as e:
+            raise MappingException(str(e))
+        if self.__log_mappings:
+            self.__logger.log_debug(message=f"mapped {count} items to {to.__name__}")
+
+    def __map_with_plan(self, to, plan: _MappingPlan, prop_values, map_callback):
+        if plan.use_constructor:
+            return self.__construct(to=plan.target, plan=plan, prop_values=prop_values, map_callback=map_callback)
+        new_dto = plan.target()
+        for property, value in prop_values:
+            converter = plan.converters.get(property)
+            if converter is None:
+                continue
+            convert, use_setattr = converter
+            value = convert(value, map_callback)
+            if value is SKIP:
+                continue
+            if use_setattr:
+                setattr(new_dto, property, value)
+            else:
+                new_dto.__dict__[property] = value
+        return new_dto
+
+    @staticmethod
+    def __construct(to, plan: _MappingPlan, prop_values, map_callback):
+        kwargs = {}
+        late_values = {}
+        for property, value in prop_values:
+            converter = plan.converters.get(property)
+            if converter is None:
+                continue
+            value = converter[0](value, map_callback)
+            if value is SKIP:
+                continue
+            if property in plan.init_fields:
+                kwargs[property] = value
+            else:
+                late_values[property] = value
+        new_dto = to(**kwargs)
+        for property, value in late_values.items():
+            object.__setattr__(new_dto, property, value)
+        return new_dto
+
+    def __compile_plan(self, mode: str, to: typing.Type) -> _MappingPlan:
+        if mode == MAP_FROM_DICT:
+            map_to = self.map_from_dict
+        elif mode == MAP_FROM_DICT_LAZILY:
+            map_to = self.map_from_dict_lazily
+        elif mode == MAP_TO_DICT:
+            map_to = self.map_to_dict
+        else:
+            map_to = self.map
+        use_constructor = is_dataclass(to) and (to.__dataclass_params__.frozen or "__slots__" in vars(to))
+        has_instance_dict = not use_constructor and "__dict__" in dir(to)
+        converters = {}
+        lazy_fields = {}
+        for property, annotation in all_annotations(to).items():
+            convert, is_nested = self.__compile_field(annotation=annotation, map_to=map_to)
+            if is_nested and mode == MAP_FROM_DICT_LAZILY:
+                lazy_fields[property] = convert
+                convert = defer
+            converters[property] = (convert, is_nested or not has_instance_dict)
+        init_fields = frozenset(field.name for field in dataclass_fields(to) if field.init) if use_constructor else frozenset()
+        target = to if len(lazy_fields) == 0 else create_lazy_proxy_type(to=to, lazy_fields=lazy_fields)
+        if self.__log_mappings:
+            self.__logger.log_debug(message=f"compiled {mode} plan for {to.__name__}",
+                                    properties={"fields": list(converters), "use_constructor": use_constructor,
+                                                "lazy_fields": list(lazy_fields)})
+        return _MappingPlan(target=target, converters=converters, use_constructor=use_constructor, init_fields=init_fields)
+
+    @staticmethod
+    def __compile_field(annotation, map_to: typing.Callable) -> tuple[typing.Callable, bool]:
+        try:
+            if bool(typing.get_type_hints(annotation)):
+                def convert_dto(value, map_callback):
+                    return map_callback(map_to(value, annotation))
+                return convert_dto, True
+            if typing.get_origin(annotation) is list and bool(typing.get_type_hints(typing.get_args(annotation)[0])):
+                sub_item_to = typing.get_args(annotation)[0]
+
+                def convert_dto_list(value, map_callback):
+                    return [map_callback(map_to(item, sub_item_to)) for item in value]
+                return convert_dto_list, True
+        except Exception as e:
+            message = str(e)
+
+            def raise_mapping_exception(value, map_callback):
+                raise MappingException(message)
+            return raise_mapping_exception, False
+        if isinstance(annotation, type) and issubclass(annotation, NumericArray):
+            def convert_numeric_array(value, map_callback):
+                if value is None or type(value) is annotation:
+                    return value
+                return to_numeric_array(values=value, to=annotation)
+            return convert_numeric_array, False
+        if numpy is not None and annotation is numpy.ndarray:
+            def convert_ndarray(value, map_callback):
+                return value if value is None else numpy.asarray(value)
+            return convert_ndarray, False
+        if annotation is datetime:
+            def convert_datetime(value, map_callback):
+                return datetime.fromisoformat(value) if type(value) is str else value
+            return convert_datetime, False
+        if annotation is Decimal:
+            def convert_decimal(value, map_callback):
+                return to_decimal(value)
+            return convert_decimal, False
+        if annotation == list[Decimal]:
+            def convert_decimal_list(value, map_callback):
+                decimals = [to_decimal(item) for item in value]
+                return decimals if len(decimals) > 0 else SKIP
+            return convert_decimal_list, False
+
+        def assign(value, map_callback):
+            return value
+        return assign, False
+
+
+class NumericArray(array.array):
+    TYPECODE = "d"
+
+    def __new__(cls, values: typing.Iterable = ()):
+        return super().__new__(cls, cls.TYPECODE, values)
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (self.tolist(),)
+
+
+class FloatArray(NumericArray):
+    TYPECODE = "d"
+
+
+class IntArray(NumericArray):
+    TYPECODE = "q"
+
+
+NUMERIC_ARRAY_TYPES = (array.array,) if numpy is None else (array.array, numpy.ndarray)
+
+
+def to_numeric_array(values, to: typing.Type[NumericArray]) -> NumericArray:
+    try:
+        return to(values)
+    except TypeError:
+        return to(map(float if to.TYPECODE == "d" else to_whole_number, values))
+
+
+def to_whole_number(value) -> int:
+    if type(value) is str:
+        return int(value)
+    whole_number = int(value)
+    if whole_number != value:
+        raise MappingException(f"{value!r} is not a whole number")
+    return whole_number
+
+
+def to_decimal(value):
+    if type(value) is str:
+        return Decimal(value)
+    if type(value) is float:
+        return Decimal(str(value))
+    return value
+
+
+CAMEL_CASE_WORD_REGEX = re.compile(r'[A-Z]?[a-z]+|[A-Z]{1,}(?=[A-Z][a-z]|\d|\W|$)|\d+')
+
+
+def snake_case_to_camel_case(key: str) -> str:
+    components = key.split('_')
+    return components[0] + ''.join(x.title() for x in components[1:])
+
+
+def camel_case_to_snake_case(key: str) -> str:
+    return '_'.join(map(str.lower, CAMEL_CASE_WORD_REGEX.findall(key)))
+
+
+class KeyCaseCache:
+
+    def __init__(self, max_entries: int = 4096):
+        self.__to_camel_case = functools.lru_cache(maxsize=max_entries)(snake_case_to_camel_case)
+        self.__to_snake_case = functools.lru_cache(maxsize=max_entries)(camel_case_to_snake_case)
+
+    def to_camel_case(self, key: str) -> str:
+        return self.__to_camel_case(key)
+
+    def to_snake_case(self, key: str) -> str:
+        return self.__to_snake_case(key)
+
+    def seed(self, types: list[typing.Type]) -> None:
+        for _type in types:
+            for name in all_annotations(_type):
+                self.__to_snake_case(self.__to_camel_case(name))
+
+    def clear(self) -> None:
+        self.__to_camel_case.cache_clear()
+        self.__to_snake_case.cache_clear()
+
+    @property
+    def entries(self) -> int:
+        return self.__to_camel_case.cache_info().currsize + self.__to_snake_case.cache_info().currsize
+
+
+DEFAULT_KEY_CASE_CACHE = KeyCaseCache()
+
 
 class JsonSnakeToCamelSerializer:
 
+    def __init__(self, key_case_cache: KeyCaseCache = DEFAULT_KEY_CASE_CACHE, json_codec: JsonCodec = DEFAULT_JSON_CODEC):
+        self.__json_codec = json_codec
+        self.__to_camel_case = key_case_cache.to_camel_case
+
     def serialize(self, data: typing.Union[dict, list]) -> str:
-        return json.dumps(self.__snake_case_to_camel_case_dict(d=data), default=str)
+        return self.__json_codec.dumps(data=self.__snake_case_to_camel_case_dict(d=data), default=str)
 
     def __snake_case_to_camel_case_dict(self, d):
         if isinstance(d, list):
             return [self.__snake_case_to_camel_case_dict(i) if isinstance(i, (dict, list)) else self.__format_value(i)
                     for i in d]
-        return {self.__snake_case_key_to_camel_case(a): self.__snake_case_to_camel_case_dict(b) if isinstance(b, (
+        return {self.__to_camel_case(a): self.__snake_case_to_camel_case_dict(b) if isinstance(b, (
             dict, list)) else self.__format_value(b) for a, b in d.items()}
 
     @staticmethod
     def __format_value(value) -> typing.Any:
         if (isinstance(value, Enum)):
             return value.value
+        if isinstance(value, NUMERIC_ARRAY_TYPES):
+            return value.tolist()
         return value
 
-    @staticmethod
-    def __snake_case_key_to_camel_case(key: str) -> str:
-        components = key.split('_')
-        return components[0] + ''.join(x.title() for x in components[1:])
-
 
 class JsonCamelToSnakeDeserializer:
 
-    def deserialize(self, data: str) -> typing.Union[dict, list]:
-        data_dict = json.loads(data)
-        return self.__camel_case_to_snake_case_dict(d=data_dict)
+    def __init__(self, key_case_cache: KeyCaseCache = DEFAULT_KEY_CASE_CACHE, json_codec: JsonCodec = DEFAULT_JSON_CODEC):
+        self.__json_codec = json_codec
+        self.__to_snake_case = key_case_cache.to_snake_case
 
-    def __camel_case_to_snake_case_dict(self, d):
-        if isinstance(d, list):
-            return [self.__camel_case_to_snake_case_dict(i) if isinstance(i, (dict, list)) else i for i in d]
-        return {self.__camel_case_key_to_snake_case(a): self.__camel_case_to_snake_case_dict(b) if isinstance(b, (
-            dict, list)) else b for a, b in d.items()}
+    def deserialize(self, data: typing.Union[str, bytes]) -> typing.Union[dict, list]:
+        return self.__json_codec.loads(data=data, object_pairs_hook=self.__camel_case_to_snake_case_dict)
+
+    def __camel_case_to_snake_case_dict(self, pairs: list[tuple[str, typing.Any]]) -> dict:
+        to_snake_case = self.__to_snake_case
+        return {to_snake_case(key): value for key, value in pairs}
+
+
+DTO = "DTO"
+DTO_LIST = "DTO_LIST"
+DATETIME = "DATETIME"
+DECIMAL = "DECIMAL"
+DECIMAL_LIST = "DECIMAL_LIST"
+RAW = "RAW"
+
+
+class _DtoPlan:
+    __slots__ = ("kinds", "prefixes", "fields", "use_instance_fields")
+
+    def __init__(self, kinds: dict, prefixes: dict, fields: list, use_instance_fields: bool):
+        self.kinds = kinds
+        self.prefixes = prefixes
+        self.fields = fields
+        self.use_instance_fields = use_instance_fields
+
+
+class JsonDtoEncoder:
+
+    def __init__(self, key_case_cache: KeyCaseCache = DEFAULT_KEY_CASE_CACHE):
+        self.__to_camel_case = key_case_cache.to_camel_case
+        self.__plans: dict[type, _DtoPlan] = {}
+
+    def encode(self, dto: typing.Any, to: typing.Type = None, preserve_decimal: bool = False) -> str:
+        chunks = []
+        try:
+            self.__write_dto(dto=dto, to=type(dto) if to is None else to, preserve_decimal=preserve_decimal,
+                             write=chunks.append)
+        except MappingException:
+            raise
+        except Exception as e:
+            raise MappingException(str(e))
+        return "".join(chunks)
+
+    def __write_dto(self, dto, to: typing.Type, preserve_decimal: bool, write: typing.Callable[[str], typing.Any]) -> None:
+        if dto is None:
+            write("null")
+            return
+        plan = self.__plans.get(to)
+        if plan is None:
+            plan = self.__build_plan(to=to)
+            self.__plans[to] = plan
+        values = instance_values(dto)
+        separator = "{"
+        if plan.use_instance_fields and (type(dto) is to or isinstance(dto, to)) and len(values) == len(plan.fields) and all(
+                name in values for name in plan.fields):
+            for name in plan.fields:
+                write(separator)
+                write(plan.prefixes[name])
+                kind, sub_type = plan.kinds[name]
+                self.__write_field(value=values[name], kind=kind, sub_type=sub_type, preserve_decimal=preserve_decimal,
+                                   write=write)
+                separator = ", "
+        else:
+            fields = {name: (RAW, None, value) for name, value in self.__default_values(to=to).items()}
+            for name, value in values.items():
+                if name in plan.kinds and not (plan.kinds[name][0] == DECIMAL_LIST and value is not None and len(value) == 0):
+                    fields[name] = (*plan.kinds[name], value)
+            for name, (kind, sub_type, value) in fields.items():
+                if value is MISSING:
+                    continue
+                write(separator)
+                prefix = plan.prefixes.get(name)
+                write(self.__encode_key(key=name) + ": " if prefix is None else prefix)
+                self.__write_field(value=value, kind=kind, sub_type=sub_type, preserve_decimal=preserve_decimal,
+                                   write=write)
+                separator = ", "
+        write("{}" if separator == "{" else "}")
+
+    def __write_field(self, value, kind: str, sub_type: typing.Optional[typing.Type], preserve_decimal: bool,
+                      write: typing.Callable[[str], typing.Any]) -> None:
+        if kind == RAW:
+            self.__write_value(value=value, preserve_decimal=preserve_decimal, write=write)
+        elif kind == DTO:
+            self.__write_dto(dto=value, to=sub_type, preserve_decimal=False, write=write)
+        elif kind == DTO_LIST:
+            if value is None:
+                write("null")
+                return
+            separator = "["
+            for item in value:
+                write(separator)
+                self.__write_dto(dto=item, to=sub_type, preserve_decimal=False, write=write)
+                separator = ", "
+            write("[]" if separator == "[" else "]")
+        elif kind == DATETIME and type(value) is str:
+            self.__write_value(value=datetime.fromisoformat(value), preserve_decimal=preserve_decimal, write=write)
+        elif kind == DECIMAL:
+            self.__write_value(value=to_decimal(value), preserve_decimal=preserve_decimal, write=write)
+        elif kind == DECIMAL_LIST and value is not None:
+            self.__write_value(value=[to_decimal(item) for item in value], preserve_decimal=preserve_decimal,
+                               write=write)
+        else:
+            self.__write_value(value=value, preserve_decimal=preserve_decimal, write=write)
+
+    def __write_value(self, value, preserve_decimal: bool, write: typing.Callable[[str], typing.Any]) -> None:
+        if isinstance(value, str):
+            write(encode_basestring_ascii(value))
+        elif value is None:
+            write("null")
+        elif value is True:
+            write("true")
+        elif value is False:
+            write("false")
+        elif isinstance(value, int):
+            write(int.__repr__(value))
+        elif isinstance(value, float):
+            write(self.__encode_float(value=value))
+        elif isinstance(value, NUMERIC_ARRAY_TYPES):
+            write(json.dumps(value.tolist()))
+        elif isinstance(value, (list, tuple)):
+            separator = "["
+            for item in value:
+                write(separator)
+                self.__write_value(value=item, preserve_decimal=preserve_decimal, write=write)
+                separator = ", "
+            write("[]" if separator == "[" else "]")
+        elif isinstance(value, dict):
+            separator = "{"
+            for key, item in value.items():
+                write(separator)
+                write(self.__encode_key(key=key))
+                write(": ")
+                self.__write_value(value=item, preserve_decimal=preserve_decimal, write=write)
+                separator = ", "
+            write("{}" if separator == "{" else "}")
+        elif isinstance(value, Enum):
+            self.__write_value(value=value.value, preserve_decimal=preserve_decimal, write=write)
+        elif type(value) == Decimal:
+            write(encode_basestring_ascii(str(value)) if preserve_decimal else self.__encode_float(value=float(str(value))))
+        elif type(value) == datetime:
+            write(encode_basestring_ascii(value.isoformat()))
+        else:
+            self.__write_value(value=instance_values(value), preserve_decimal=preserve_decimal, write=write)
+
+    def __encode_key(self, key) -> str:
+        if isinstance(key, str):
+            return encode_basestring_ascii(self.__to_camel_case(key))
+        if key is True:
+            return encode_basestring_ascii(self.__to_camel_case("true"))
+        if key is False:
+            return encode_basestring_ascii(self.__to_camel_case("false"))
+        if key is None:
+            return encode_basestring_ascii(self.__to_camel_case("null"))
+        if isinstance(key, int):
+            return encode_basestring_ascii(self.__to_camel_case(int.__repr__(key)))
+        if isinstance(key, float):
+            return encode_basestring_ascii(self.__to_camel_case(self.__encode_float(value=key)))
+        raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
 
     @staticmethod
-    def __camel_case_key_to_snake_case(key: str) -> str:
-        words = re.findall(r'[A-Z]?[a-z]+|[A-Z]{1,}(?=[A-Z][a-z]|\d|\W|$)|\d+', key)
-        return '_'.join(map(str.lower, words))
+    def __default_values(to: typing.Type) -> dict:
+        if not is_dataclass(to):
+            return instance_values(to())
+        defaults = {}
+        for field in dataclass_fields(to):
+            if field.default is not MISSING:
+                defaults[field.name] = field.default
+            elif field.default_factory is not MISSING:
+                defaults[field.name] = field.default_factory()
+            else:
+                defaults[field.name] = MISSING
+        return defaults
+
+    def __build_plan(self, to: typing.Type) -> _DtoPlan:
+        annotations = all_annotations(to)
+        kinds = {name: self.__get_kind(annotation=annotation) for name, annotation in annotations.items()}
+        prefixes = {name: self.__encode_key(key=name) + ": " for name in annotations}
+        use_instance_fields = is_dataclass(to) and not hasattr(to, "__post_init__") and \
+            all(kind != DECIMAL_LIST for kind, _ in kinds.values())
+        fields = [field.name for field in dataclass_fields(to)] if use_instance_fields else []
+        return _DtoPlan(kinds=kinds,
+                        prefixes=prefixes,
+                        fields=fields,
+                        use_instance_fields=use_instance_fields and all(name in kinds for name in fields))
+
+    @staticmethod
+    def __get_kind(annotation) -> tuple[str, typing.Optional[typing.Type]]:
+        if typing.get_origin(annotation) is typing.Union:
+            arguments = [argument for argument in typing.get_args(annotation) if argument is not type(None)]
+            if len(arguments) != 1:
+                return RAW, None
+            annotation = arguments[0]
+        if JsonDtoEncoder.__has_type_hints(annotation=annotation):
+            return DTO, annotation
+        if typing.get_origin(annotation) is list and len(typing.get_args(annotation)) == 1 and \
+                JsonDtoEncoder.__has_type_hints(annotation=typing.get_args(annotation)[0]):
+            return DTO_LIST, typing.get_args(annotation)[0]
+        if annotation is datetime:
+            return DATETIME, None
+        if annotation is Decimal:
+            return DECIMAL, None
+        if annotation == list[Decimal]:
+            return DECIMAL_LIST, None
+        return RAW, None
+
+    @staticmethod
+    def __has_type_hints(annotation) -> bool:
+        try:
+            return bool(typing.get_type_hints(annotation))
+        except TypeError:
+            return False
+
+    @staticmethod
+    def __encode_float(value: float) -> str:
+        if value != value:
+            return "NaN"
+        if value == float("inf"):
+            return "Infinity"
+        if value == -float("inf"):
+            return "-Infinity"
+        return float.__repr__(value)
+
+
+DEFAULT_DTO_ENCODER = JsonDtoEncoder()
+
+
+JSON_STRUCTURE_TABLE = {c: None if chr(c) in " \t\r\n" else "x" for c in range(128) if chr(c) not in "[]{},"}
+JSON_NESTING_TABLE = {ord("{"): "[", ord("}"): "]", ord(","): None, ord("x"): None}
+
+
+def check_json_limits(data: typing.Union[str, bytes], max_depth: int = None, max_elements: int = None) -> None:
+    if isinstance(data, (bytes, bytearray)):
+        try:
+            data = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return
+    if "\\" in data:
+        data = data.replace("\\\\", "").replace("\\\"", "")
+    structure = "x".join(data.split('"')[::2]).translate(JSON_STRUCTURE_TABLE)
+    if max_elements is not None:
+        elements = structure.count(",") + structure.count("[") + structure.count("{") - \
+            structure.count("[]") - structure.count("{}")
+        if elements > max_elements:
+            raise PayloadTooComplexException(f"payload has more than {max_elements} elements")
+    if max_depth is not None:
+        nesting = structure.translate(JSON_NESTING_TABLE)
+        for _ in range(max_depth):
+            reduced = nesting.replace("[]", "")
+            if len(reduced) == len(nesting):
+                return
+            nesting = reduced
+        if "[]" in nesting:
+            raise PayloadTooComplexException(f"payload is nested deeper than {max_depth} levels")
 
 
 def utc_now() -> datetime:
@@ -240,4 +930,12 @@ def base64encode(s: str) -> str:
 
 
 def base64decode(s: str) -> str:
-    return base64.b64decode(bytes(s, 'utf-8')).decode('utf-8')
\ No newline at end of file
+    return base64.b64decode(bytes(s, 'utf-8')).decode('utf-8')
+
+
+def base64encode_bytes(b: bytes) -> str:
+    return base64.b64encode(b).decode('utf-8')
+
+
+def base64decode_bytes(s: str) -> bytes:
+    return base64.b64decode(bytes(s, 'utf-8'))
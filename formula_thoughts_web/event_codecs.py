@@ -0,0 +1,208 @@
+import base64
+import dataclasses
+import functools
+import struct
+import typing
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from formula_thoughts_web.abstractions import EventCodec
+from formula_thoughts_web.crosscutting import instance_values, NUMERIC_ARRAY_TYPES
+from formula_thoughts_web.exceptions import EventCodecException
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/x-msgpack"
+STRUCT_CONTENT_TYPE = "application/x-formula-thoughts-struct"
+STRUCT_FORMAT_VERSION = 1
+
+INT = "INT"
+FLOAT = "FLOAT"
+BOOL = "BOOL"
+TEXT = "TEXT"
+DECIMAL = "DECIMAL"
+DATETIME = "DATETIME"
+
+INT_STRUCT = struct.Struct("<q")
+FLOAT_STRUCT = struct.Struct("<d")
+BOOL_STRUCT = struct.Struct("<?")
+LENGTH_STRUCT = struct.Struct("<I")
+HEADER_STRUCT = struct.Struct("<BI")
+
+
+def to_plain(value: typing.Any) -> typing.Any:
+    if value is None or isinstance(value, (str, int, float)) and not isinstance(value, Enum):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, NUMERIC_ARRAY_TYPES):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    return {key: to_plain(item) for key, item in instance_values(value).items()}
+
+
+class MessagePackEventCodec:
+
+    @property
+    def content_type(self) -> str:
+        return MSGPACK_CONTENT_TYPE
+
+    def supports(self, _type: typing.Type) -> bool:
+        return msgpack is not None
+
+    def encode(self, dto: typing.Any, to: typing.Type) -> str:
+        try:
+            return base64.b64encode(msgpack.packb(to_plain(dto), use_bin_type=True)).decode('ascii')
+        except (OverflowError, TypeError) as e:
+            raise EventCodecException(str(e))
+
+    def decode(self, data: str, to: typing.Type) -> dict:
+        if msgpack is None:
+            raise EventCodecException("msgpack is not installed")
+        return msgpack.unpackb(base64.b64decode(data), raw=False)
+
+
+class _StructLayout:
+    __slots__ = ("fields", "fingerprint", "bitmap_size")
+
+    def __init__(self, fields: list[tuple[str, str]]):
+        self.fields = fields
+        self.fingerprint = zlib.crc32(";".join(f"{name}:{kind}" for name, kind in fields).encode('utf-8'))
+        self.bitmap_size = (len(fields) + 7) // 8
+
+
+class StructEventCodec:
+
+    @property
+    def content_type(self) -> str:
+        return STRUCT_CONTENT_TYPE
+
+    def supports(self, _type: typing.Type) -> bool:
+        return get_struct_layout(_type=_type) is not None
+
+    def encode(self, dto: typing.Any, to: typing.Type) -> str:
+        layout = get_struct_layout(_type=to)
+        if layout is None:
+            raise EventCodecException(f"{to.__name__} is not a flat dataclass")
+        values = instance_values(dto)
+        bitmap = bytearray(layout.bitmap_size)
+        chunks = []
+        try:
+            for index, (name, kind) in enumerate(layout.fields):
+                value = values.get(name)
+                if value is None:
+                    continue
+                bitmap[index // 8] |= 1 << (index % 8)
+                if isinstance(value, Enum):
+                    value = value.value
+                if kind == INT:
+                    chunks.append(INT_STRUCT.pack(value))
+                elif kind == FLOAT:
+                    chunks.append(FLOAT_STRUCT.pack(value))
+                elif kind == BOOL:
+                    chunks.append(BOOL_STRUCT.pack(value))
+                else:
+                    text = (value.isoformat() if isinstance(value, datetime) else str(value)).encode('utf-8')
+                    chunks.append(LENGTH_STRUCT.pack(len(text)))
+                    chunks.append(text)
+        except struct.error as e:
+            raise EventCodecException(str(e))
+        header = HEADER_STRUCT.pack(STRUCT_FORMAT_VERSION, layout.fingerprint)
+        return base64.b64encode(header + bytes(bitmap) + b"".join(chunks)).decode('ascii')
+
+    def decode(self, data: str, to: typing.Type) -> dict:
+        layout = get_struct_layout(_type=to)
+        if layout is None:
+            raise EventCodecException(f"{to.__name__} is not a flat dataclass")
+        buffer = base64.b64decode(data)
+        version, fingerprint = HEADER_STRUCT.unpack_from(buffer, 0)
+        if version != STRUCT_FORMAT_VERSION or fingerprint != layout.fingerprint:
+            raise EventCodecException(f"message layout does not match {to.__name__}")
+        offset = HEADER_STRUCT.size
+        bitmap = buffer[offset:offset + layout.bitmap_size]
+        offset += layout.bitmap_size
+        event = {}
+        for index, (name, kind) in enumerate(layout.fields):
+            if not bitmap[index // 8] & (1 << (index % 8)):
+                event[name] = None
+            elif kind == INT:
+                event[name] = INT_STRUCT.unpack_from(buffer, offset)[0]
+                offset += INT_STRUCT.size
+            elif kind == FLOAT:
+                event[name] = FLOAT_STRUCT.unpack_from(buffer, offset)[0]
+                offset += FLOAT_STRUCT.size
+            elif kind == BOOL:
+                event[name] = BOOL_STRUCT.unpack_from(buffer, offset)[0]
+                offset += BOOL_STRUCT.size
+            else:
+                length = LENGTH_STRUCT.unpack_from(buffer, offset)[0]
+                offset += LENGTH_STRUCT.size
+                event[name] = buffer[offset:offset + length].decode('utf-8')
+                offset += length
+        return event
+
+
+@functools.lru_cache(maxsize=None)
+def get_struct_layout(_type: typing.Type) -> typing.Optional[_StructLayout]:
+    if not dataclasses.is_dataclass(_type):
+        return None
+    hints = typing.get_type_hints(_type)
+    fields = []
+    for field in dataclasses.fields(_type):
+        kind = _get_struct_kind(annotation=hints.get(field.name))
+        if kind is None:
+            return None
+        fields.append((field.name, kind))
+    return _StructLayout(fields=fields)
+
+
+def _get_struct_kind(annotation) -> typing.Optional[str]:
+    if typing.get_origin(annotation) is typing.Union:
+        arguments = [argument for argument in typing.get_args(annotation) if argument is not type(None)]
+        if len(arguments) != 1:
+            return None
+        annotation = arguments[0]
+    if annotation is bool:
+        return BOOL
+    if annotation is int:
+        return INT
+    if annotation is float:
+        return FLOAT
+    if annotation is str:
+        return TEXT
+    if annotation is Decimal:
+        return DECIMAL
+    if annotation is datetime:
+        return DATETIME
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        value_types = set(type(member.value) for member in annotation)
+        if value_types == {str}:
+            return TEXT
+        if value_types == {int}:
+            return INT
+    return None
+
+
+EVENT_CODECS: dict[str, EventCodec] = {
+    MSGPACK_CONTENT_TYPE: MessagePackEventCodec(),
+    STRUCT_CONTENT_TYPE: StructEventCodec()
+}
+
+
+def get_event_codec(content_type: str) -> EventCodec:
+    if content_type not in EVENT_CODECS:
+        raise EventCodecException(f"no event codec for content type {content_type}")
+    return EVENT_CODECS[content_type]
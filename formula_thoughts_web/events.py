@@ -1,46 +1,110 @@
+import gzip
 import typing
 import uuid
+import warnings
 from abc import ABC
-from typing import Type
+from dataclasses import dataclass
+from typing import Type, Callable, Optional
 
 from botocore.client import BaseClient
 
 from formula_thoughts_web.abstractions import SequenceBuilder, Deserializer, ApplicationContext, EventHandler, Logger, \
-    Serializer
+    DtoEncoder, EventOptions, EventCodec, BlobStore
 from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, USE_EXCEPTION_ERROR
-from formula_thoughts_web.crosscutting import ObjectMapper
-from formula_thoughts_web.exceptions import EventNotFoundException
+from formula_thoughts_web.crosscutting import ObjectMapper, DEFAULT_DTO_ENCODER, base64encode_bytes, base64decode_bytes
+from formula_thoughts_web.event_codecs import JSON_CONTENT_TYPE, get_event_codec
+from formula_thoughts_web.exceptions import EventNotFoundException, SchemaValidationException, EventCodecException, \
+    MessageTooLargeException, BlobNotFoundException
+from formula_thoughts_web.validation import create_schema_validator
 
 EVENT = "EVENT"
+GZIP_CONTENT_ENCODING = "gzip"
+BLOB_CONTENT_ENCODING = "blob+gzip"
+
+
+@dataclass
+class EventPublisherSettings:
+    compression_threshold: int = 64 * 1024
+    compression_level: int = 6
+    max_message_size: int = 256 * 1024
 
 
 class SQSEventPublisher:
 
     def __init__(self, sqs_client: BaseClient,
                  queue_name: str,
-                 serializer: Serializer,
-                 mapper: ObjectMapper):
-        self.__mapper = mapper
-        self.__serializer = serializer
+                 dto_encoder: DtoEncoder = DEFAULT_DTO_ENCODER,
+                 content_type: str = JSON_CONTENT_TYPE,
+                 settings: EventPublisherSettings = None,
+                 blob_store: BlobStore = None,
+                 serializer=None,
+                 mapper=None):
+        if isinstance(content_type, ObjectMapper):
+            # positional (sqs_client, queue_name, serializer, mapper) call from before dto_encoder existed
+            serializer, mapper, dto_encoder, content_type = dto_encoder, content_type, DEFAULT_DTO_ENCODER, JSON_CONTENT_TYPE
+        if serializer is not None or mapper is not None:
+            warnings.warn("SQSEventPublisher serializer and mapper are deprecated, pass dto_encoder instead",
+                          DeprecationWarning, stacklevel=2)
+        self.__blob_store = blob_store
+        self.__settings = EventPublisherSettings() if settings is None else settings
+        self.__event_codec: Optional[EventCodec] = None
+        if content_type != JSON_CONTENT_TYPE:
+            self.__event_codec = get_event_codec(content_type=content_type)
+        self.__dto_encoder = dto_encoder
         self.__sqs_client = sqs_client
         url = self.__sqs_client.get_queue_url(QueueName=queue_name)
         self.__queue_url = url["QueueUrl"]
 
     def send_sqs_message(self, message_group_id, payload: typing.Any):
+        body, content_type = self.__encode(payload=payload)
+        attributes = {
+            'messageType': {
+                'StringValue': type(payload).__name__,
+                'DataType': 'String'
+            },
+            'contentType': {
+                'StringValue': content_type,
+                'DataType': 'String'
+            }
+        }
+        if len(body.encode('utf-8')) > self.__settings.compression_threshold:
+            body, attributes = self.__compress(payload=payload, body=body, attributes=attributes)
         self.__sqs_client.send_message(
             QueueUrl=str(self.__queue_url),
-            MessageBody=self.__serializer.serialize(data=self.__mapper.map_to_dict(_from=payload,
-                                                                                   to=type(payload))),
+            MessageBody=body,
             MessageGroupId=message_group_id,
-            MessageAttributes={
-                'messageType': {
-                    'StringValue': type(payload).__name__,
-                    'DataType': 'String'
-                }
-            },
+            MessageAttributes=attributes,
             MessageDeduplicationId=str(uuid.uuid4())
         )
 
+    def __compress(self, payload: typing.Any, body: str, attributes: dict) -> tuple[str, dict]:
+        compressed = gzip.compress(body.encode('utf-8'), compresslevel=self.__settings.compression_level, mtime=0)
+        body = base64encode_bytes(compressed)
+        attributes = {**attributes, 'contentEncoding': {'StringValue': GZIP_CONTENT_ENCODING, 'DataType': 'String'}}
+        if self.__get_message_size(body=body, attributes=attributes) <= self.__settings.max_message_size:
+            return body, attributes
+        if self.__blob_store is None:
+            raise MessageTooLargeException(f"{type(payload).__name__} message exceeds {self.__settings.max_message_size} bytes after compression")
+        key = f"{type(payload).__name__}/{uuid.uuid4()}"
+        self.__blob_store.put(key=key, data=compressed)
+        attributes['contentEncoding'] = {'StringValue': BLOB_CONTENT_ENCODING, 'DataType': 'String'}
+        return key, attributes
+
+    @staticmethod
+    def __get_message_size(body: str, attributes: dict) -> int:
+        size = len(body.encode('utf-8'))
+        for name, attribute in attributes.items():
+            size += len(name.encode('utf-8')) + len(attribute['DataType']) + len(attribute['StringValue'].encode('utf-8'))
+        return size
+
+    def __encode(self, payload: typing.Any) -> tuple[str, str]:
+        if self.__event_codec is not None and self.__event_codec.supports(type(payload)):
+            try:
+                return self.__event_codec.encode(dto=payload, to=type(payload)), self.__event_codec.content_type
+            except EventCodecException:
+                pass
+        return self.__dto_encoder.encode(dto=payload, to=type(payload)), JSON_CONTENT_TYPE
+
 
 class EventRunner:
 
@@ -59,11 +123,14 @@ class EventRunner:
                 try:
                     event_type = message['messageAttributes']['messageType']['stringValue']
                     body = message['body']
+                    content_type = message['messageAttributes'].get('contentType', {}).get('stringValue', JSON_CONTENT_TYPE)
+                    content_encoding = message['messageAttributes'].get('contentEncoding', {}).get('stringValue')
                     self.__logger.add_global_properties(properties={"event_type": event_type})
                     matching_handlers = list(filter(lambda x: f"{x.event_type.__name__}" == event_type, self.__event_handlers))
                     if len(matching_handlers) == 0:
                         raise EventNotFoundException(f"{event_type} does not match any found handlers")
-                    matching_handlers[0].run(event=body)
+                    matching_handlers[0].run(event=body, **get_event_run_arguments(content_type=content_type,
+                                                                                  content_encoding=content_encoding))
                 except Exception as e:
                     self.__logger.log_error(message="event runner captured exception")
                     self.__logger.log_exception(exception=e)
@@ -77,27 +144,86 @@ class EventRunner:
         }
 
 
+class LazyEventHandler:
+
+    def __init__(self, event_type: Type, factory: Callable[[], EventHandler]):
+        self.__factory = factory
+        self.__event_type = event_type
+        self.__event_handler: Optional[EventHandler] = None
+
+    def run(self, event: str, content_type: str = JSON_CONTENT_TYPE, content_encoding: str = None):
+        return self.event_handler.run(event=event, **get_event_run_arguments(content_type=content_type,
+                                                                            content_encoding=content_encoding))
+
+    @property
+    def event_handler(self) -> EventHandler:
+        if self.__event_handler is None:
+            event_handler = self.__factory()
+            if event_handler.event_type is not self.__event_type:
+                raise EventNotFoundException(f"lazy event {self.__event_type.__name__} resolved a handler for event {event_handler.event_type.__name__}")
+            self.__event_handler = event_handler
+        return self.__event_handler
+
+    @property
+    def event_type(self) -> typing.Type:
+        return self.__event_type
+
+
 class EventHandlerBase(ABC):
 
     def __init__(self, event: Type,
                  sequence: SequenceBuilder,
                  command_pipeline: TopLevelSequenceRunner,
                  deserializer: Deserializer,
-                 object_mapper: ObjectMapper):
+                 object_mapper: ObjectMapper,
+                 options: EventOptions = None):
+        self.__options = EventOptions() if options is None else options
+        self.__validator = create_schema_validator(schema=self.__options.schema,
+                                                   _type=event if self.__options.validate_event_type else None)
         self.__object_mapper = object_mapper
         self.__deserializer = deserializer
         self.__command_pipeline = command_pipeline
         self.__sequence = sequence
         self.__event = event
 
-    def run(self, event: str):
-        event_dict = self.__deserializer.deserialize(event)
-        event_object = self.__object_mapper.map_from_dict(_from=event_dict, to=self.__event)
+    def run(self, event: str, content_type: str = JSON_CONTENT_TYPE, content_encoding: str = None):
+        if content_encoding is not None:
+            event = self.__decompress(event=event, content_encoding=content_encoding)
+        if content_type == JSON_CONTENT_TYPE:
+            event_dict = self.__deserializer.deserialize(event)
+        else:
+            event_dict = get_event_codec(content_type=content_type).decode(data=event, to=self.__event)
+        if self.__validator is not None:
+            errors = self.__validator.validate(data=event_dict)
+            if any(errors):
+                raise SchemaValidationException(errors=errors)
+        if self.__options.lazy_mapping:
+            event_object = self.__object_mapper.map_from_dict_lazily(_from=event_dict, to=self.__event)
+        else:
+            event_object = self.__object_mapper.map_from_dict(_from=event_dict, to=self.__event)
         self.__command_pipeline.run(context=ApplicationContext(body=event_dict,
                                                                variables={EVENT: event_object},
                                                                error_capsules=[]),
                                     top_level_sequence=self.__sequence)
 
+    def __decompress(self, event: str, content_encoding: str) -> str:
+        if content_encoding == GZIP_CONTENT_ENCODING:
+            return gzip.decompress(base64decode_bytes(event)).decode('utf-8')
+        if content_encoding == BLOB_CONTENT_ENCODING:
+            if self.__options.blob_store is None:
+                raise BlobNotFoundException(f"{self.__event.__name__} handler has no blob store to fetch {event}")
+            return gzip.decompress(self.__options.blob_store.get(key=event)).decode('utf-8')
+        raise EventCodecException(f"unsupported content encoding {content_encoding}")
+
     @property
     def event_type(self) -> typing.Type:
         return self.__event
+
+
+def get_event_run_arguments(content_type: str, content_encoding: Optional[str]) -> dict:
+    arguments = {}
+    if content_type != JSON_CONTENT_TYPE:
+        arguments["content_type"] = content_type
+    if content_encoding is not None:
+        arguments["content_encoding"] = content_encoding
+    return arguments
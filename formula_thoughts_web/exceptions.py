@@ -12,3 +12,53 @@ class MappingException(Exception):
 
 class StrategyNotFoundException(Exception):
     pass
+
+
+class JsonCodecNotFoundException(Exception):
+    pass
+
+
+class RouteConflictException(Exception):
+    pass
+
+
+class ResponseTooLargeException(Exception):
+    pass
+
+
+class PayloadTooLargeException(Exception):
+    pass
+
+
+class PayloadTooComplexException(Exception):
+    pass
+
+
+class InvalidBatchRequestException(Exception):
+    pass
+
+
+class EventCodecException(Exception):
+    pass
+
+
+class MessageTooLargeException(Exception):
+    pass
+
+
+class BlobNotFoundException(Exception):
+    pass
+
+
+class ContainerCompilationException(Exception):
+
+    def __init__(self, errors: list[str]):
+        super().__init__(f"container compilation failed: {'; '.join(errors)}")
+        self.errors = errors
+
+
+class SchemaValidationException(Exception):
+
+    def __init__(self, errors: list[str]):
+        super().__init__(f"schema validation failed: {'; '.join(errors)}")
+        self.errors = errors
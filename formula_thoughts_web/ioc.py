@@ -1,15 +1,20 @@
+import inspect
 import json
-from typing import TypeVar, Type, Any, Callable
+from dataclasses import dataclass, field
+from typing import TypeVar, Type, Any, Callable, get_origin
 
 import punq
 
-from formula_thoughts_web.abstractions import Serializer, Deserializer, Logger, ErrorHandlingStrategy
+from formula_thoughts_web.abstractions import Serializer, Deserializer, DtoEncoder, JsonCodec, Logger, ErrorHandlingStrategy, ApiRequestHandler, \
+    EventHandler
 from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, ExceptionErrorHandlingStrategy, \
     ResponseErrorHandlingStrategy, ErrorHandlingStrategyFactory
-from formula_thoughts_web.crosscutting import JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer, ObjectMapper, JsonConsoleLogger
-from formula_thoughts_web.events import EventRunner
-from formula_thoughts_web.exceptions import EventSchemaInvalidException
-from formula_thoughts_web.web import WebRunner, StatusCodeMapping
+from formula_thoughts_web.caching import ResponseCache
+from formula_thoughts_web.crosscutting import JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer, ObjectMapper, JsonConsoleLogger, \
+    KeyCaseCache, JsonDtoEncoder, STDLIB_JSON_CODEC, create_json_codec
+from formula_thoughts_web.events import EventRunner, LazyEventHandler
+from formula_thoughts_web.exceptions import EventSchemaInvalidException, ContainerCompilationException
+from formula_thoughts_web.web import WebRunner, StatusCodeMapping, LazyApiRequestHandler, WebRunnerSettings
 
 
 T = TypeVar('T')
@@ -38,36 +43,174 @@ class LambdaRunner:
             raise EventSchemaInvalidException("schema does not match SQS event or API gateway")
 
 
+@dataclass
+class _ServicePlan:
+    service: Any
+    builder: Callable
+    singleton: bool
+    arguments: dict = field(default_factory=dict)
+    dependencies: list[tuple[str, '_ServicePlan']] = field(default_factory=list)
+    collections: list[tuple[str, list['_ServicePlan']]] = field(default_factory=list)
+
+
+def get_default_arguments(builder: Callable) -> tuple[dict, list[str]]:
+    function = builder.__init__ if inspect.isclass(builder) else builder
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return {}, []
+    names = code.co_varnames[:code.co_argcount]
+    positional_defaults = function.__defaults__ or ()
+    defaults = dict(zip(names[len(names) - len(positional_defaults):], positional_defaults))
+    defaults.update(function.__kwdefaults__ or {})
+    names = names[1:] if inspect.isclass(builder) else names
+    names += code.co_varnames[code.co_argcount:code.co_argcount + code.co_kwonlyargcount]
+    return {k: v for k, v in defaults.items() if v is not None}, [x for x in names if x not in defaults]
+
+
+class _PlanCompiler:
+
+    def __init__(self, registry: Any):
+        self.__registry = registry
+        self.__plans = {}
+        self.__compiling = []
+        self.__errors = []
+
+    def compile(self, services: list) -> dict:
+        plans = {service: self.__compile(service=service, index=len(self.__registry[service]) - 1)
+                 for service in services}
+        if len(self.__errors) > 0:
+            raise ContainerCompilationException(errors=self.__errors)
+        return plans
+
+    def __compile(self, service: Any, index: int) -> _ServicePlan:
+        key = (service, index)
+        if key in self.__plans:
+            return self.__plans[key]
+        if key in self.__compiling:
+            cycle = self.__compiling[self.__compiling.index(key):] + [key]
+            self.__add_error(f"circular dependency {' -> '.join(get_service_name(x[0]) for x in cycle)}")
+            return None
+        self.__compiling.append(key)
+        registration = self.__registry[service][index]
+        defaults, required = get_default_arguments(builder=registration.builder)
+        plan = _ServicePlan(service=service,
+                            builder=registration.builder,
+                            singleton=registration.scope == punq.Scope.singleton)
+        for name, need in registration.needs.items():
+            if name == "return" or name in registration.args:
+                continue
+            if get_origin(need) is list:
+                plan.collections.append((name, [self.__compile(service=need.__args__[0], index=i)
+                                                for i in range(0, len(self.__registry[need.__args__[0]]))]))
+                continue
+            dependency_index = len(self.__registry[need]) - 1 if need != service else index - 1
+            if dependency_index >= 0:
+                plan.dependencies.append((name, self.__compile(service=need, index=dependency_index)))
+            elif name in defaults:
+                plan.arguments[name] = defaults[name]
+            else:
+                self.__add_error(f"{get_service_name(service)} requires {get_service_name(need)} "
+                                     f"for '{name}' which is not registered")
+        for name in required:
+            if name not in registration.needs and name not in registration.args:
+                self.__add_error(f"{get_service_name(service)} has no type annotation for '{name}'")
+        for name, value in defaults.items():
+            if name not in registration.needs:
+                plan.arguments[name] = value
+        plan.arguments.update(registration.args)
+        self.__compiling.pop()
+        self.__plans[key] = plan
+        return plan
+
+    def __add_error(self, error: str) -> None:
+        if error not in self.__errors:
+            self.__errors.append(error)
+
+
+def get_service_name(service: Any) -> str:
+    return getattr(service, "__name__", str(service))
+
+
 class Container:
 
     def __init__(self):
         self.__container = punq.Container()
+        self.__services = {}
+        self.__plans: dict = None
 
     def register(self, service: Type[T], implementation: Type[T] = None, scope: punq.Scope = punq.Scope.singleton) -> 'Container':
         if implementation is None:
-            self.__container.register(service=service, scope=scope)
+            self.__register(service=service, scope=scope)
         else:
-            self.__container.register(service, implementation, scope=scope)
+            self.__register(service=service, factory=implementation, scope=scope)
         return self
 
     def register_factory(self, service: Type[T],
                          factory: Callable[[], T] = None,
                          scope: punq.Scope = punq.Scope.singleton) -> 'Container':
-        self.__container.register(service=service, factory=factory, scope=scope)
+        self.__register(service=service, factory=factory, scope=scope)
+        return self
+
+    def compile(self) -> 'Container':
+        self.__plans = _PlanCompiler(registry=self.__container.registrations).compile(services=list(self.__services))
         return self
 
     def resolve(self, service: Type[T]) -> T:
-        return self.__container.resolve(service)
+        if self.__plans is None or service not in self.__plans:
+            return self.__container.resolve(service)
+        return self.__resolve_plan(plan=self.__plans[service], cache={})
+
+    def register_lazy_request_handler(self, route_key: str, implementation: Type[ApiRequestHandler]) -> 'Container':
+        self.__register(service=implementation, scope=punq.Scope.singleton)
+        self.__register(service=ApiRequestHandler,
+                        factory=lambda: LazyApiRequestHandler(route_key=route_key,
+                                                              factory=lambda: self.resolve(implementation)),
+                        scope=punq.Scope.singleton)
+        return self
+
+    def register_lazy_event_handler(self, event_type: Type, implementation: Type[EventHandler]) -> 'Container':
+        self.__register(service=implementation, scope=punq.Scope.singleton)
+        self.__register(service=EventHandler,
+                        factory=lambda: LazyEventHandler(event_type=event_type,
+                                                         factory=lambda: self.resolve(implementation)),
+                        scope=punq.Scope.singleton)
+        return self
 
     def register_status_code_mappings(self, mappings: dict) -> 'Container':
-        self.__container.register(service=StatusCodeMapping, scope=punq.Scope.singleton)
-        status_mapping: StatusCodeMapping = self.__container.resolve(StatusCodeMapping)
+        self.__register(service=StatusCodeMapping, scope=punq.Scope.singleton)
+        status_mapping: StatusCodeMapping = self.resolve(StatusCodeMapping)
         for code in mappings.keys():
             status_mapping.add_mapping(_type=code, status_code=mappings[code])
         return self
 
+    def __register(self, service: Any, **kwargs) -> None:
+        self.__container.register(service, **kwargs)
+        self.__services[service] = None
+        self.__plans = None
+
+    def __resolve_plan(self, plan: _ServicePlan, cache: dict) -> Any:
+        singletons = self.__container._singletons
+        if plan.singleton and plan.service in singletons:
+            return singletons[plan.service]
+        if plan.service in cache:
+            return cache[plan.service]
+        return self.__build(plan=plan, cache=cache)
+
+    def __build(self, plan: _ServicePlan, cache: dict) -> Any:
+        arguments = dict(plan.arguments)
+        for name, dependency in plan.dependencies:
+            arguments[name] = self.__resolve_plan(plan=dependency, cache=cache)
+        for name, collection in plan.collections:
+            collection_cache = {}
+            arguments[name] = [self.__build(plan=x, cache=collection_cache) for x in collection]
+        instance = plan.builder(**arguments)
+        if plan.singleton:
+            self.__container._singletons[plan.service] = instance
+        cache[plan.service] = instance
+        return instance
+
 
-def register_web(services: Container, default_error_handling_strategy: str):
+def register_web(services: Container, default_error_handling_strategy: str, json_codec: str = STDLIB_JSON_CODEC):
     services.register(service=ErrorHandlingStrategy, implementation=ExceptionErrorHandlingStrategy)
     services.register(service=ErrorHandlingStrategy, implementation=ResponseErrorHandlingStrategy)
     services.register(service=ErrorHandlingStrategyFactory)
@@ -78,10 +221,51 @@ def register_web(services: Container, default_error_handling_strategy: str):
                               scope=punq.Scope.singleton)
     services.register(service=LambdaRunner)
     services.register(service=EventRunner)
+    services.register_factory(service=KeyCaseCache, factory=lambda: KeyCaseCache())
+    services.register_factory(service=JsonCodec, factory=lambda: create_json_codec(name=json_codec))
     services.register(service=Serializer, implementation=JsonSnakeToCamelSerializer)
     services.register(service=Deserializer, implementation=JsonCamelToSnakeDeserializer)
+    services.register(service=DtoEncoder, implementation=JsonDtoEncoder)
     services.register(service=TopLevelSequenceRunner)
     services.register(service=WebRunner)
+    services.register_factory(service=WebRunnerSettings, factory=lambda: WebRunnerSettings())
+    services.register_factory(service=ResponseCache, factory=lambda: ResponseCache())
     services.register(service=ObjectMapper)
     services.register(service=Logger, implementation=JsonConsoleLogger)
     services.register(service=StatusCodeMapping, scope=punq.Scope.singleton)
+
+
+class LambdaApplication:
+
+    def __init__(self, register_dependencies: Callable[[Container], None],
+                 default_error_handling_strategy: str,
+                 json_codec: str = STDLIB_JSON_CODEC):
+        self.__register_dependencies = register_dependencies
+        self.__default_error_handling_strategy = default_error_handling_strategy
+        self.__json_codec = json_codec
+        self.__services: Container = None
+        self.__lambda_runner: LambdaRunner = None
+        self.__error_handling_state: ErrorHandlingTypeState = None
+        self.__logger: Logger = None
+
+    @property
+    def services(self) -> Container:
+        if self.__services is None:
+            services = Container()
+            register_web(services=services,
+                         default_error_handling_strategy=self.__default_error_handling_strategy,
+                         json_codec=self.__json_codec)
+            self.__register_dependencies(services)
+            self.__services = services.compile()
+        return self.__services
+
+    def run(self, event: dict, context: dict) -> dict:
+        if self.__lambda_runner is None:
+            self.__error_handling_state = self.services.resolve(ErrorHandlingTypeState)
+            self.__logger = self.services.resolve(Logger)
+            self.__lambda_runner = self.services.resolve(LambdaRunner)
+        try:
+            return self.__lambda_runner.run(event=event, context=context)
+        finally:
+            self.__error_handling_state.reset()
+            self.__logger.clear_global_properties()
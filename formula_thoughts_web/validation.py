@@ -0,0 +1,115 @@
+import dataclasses
+import functools
+import typing
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import validator_for
+
+from formula_thoughts_web.crosscutting import all_annotations, NumericArray
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+JSON_SCHEMA_TYPES: dict[typing.Type, dict] = {
+    str: {"type": "string"},
+    bool: {"type": "boolean"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    Decimal: {"anyOf": [{"type": "number"}, {"type": "string", "pattern": r"^[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?$"}]},
+    datetime: {"type": "string"},
+    dict: {"type": "object"},
+    list: {"type": "array"},
+    typing.Any: {}
+}
+
+
+class SchemaValidator:
+
+    def __init__(self, schema: dict):
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self.__validator = validator_class(schema)
+
+    def validate(self, data: typing.Any) -> list[str]:
+        if self.__validator.is_valid(data):
+            return []
+        errors = sorted(self.__validator.iter_errors(data), key=lambda x: list(map(str, x.absolute_path)))
+        return [self.__format_error(error=error) for error in errors]
+
+    @staticmethod
+    def __format_error(error: ValidationError) -> str:
+        path = ".".join(map(str, error.absolute_path))
+        return error.message if path == "" else f"{path}: {error.message}"
+
+
+def derive_json_schema(_type: typing.Type) -> dict:
+    return {"$schema": JSON_SCHEMA_DIALECT, **_derive_type_schema(annotation=_type, visiting=set())}
+
+
+def _derive_type_schema(annotation, visiting: set) -> dict:
+    if annotation in JSON_SCHEMA_TYPES:
+        return JSON_SCHEMA_TYPES[annotation]
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        return {"anyOf": [{"type": "null"} if argument is type(None) else _derive_type_schema(annotation=argument, visiting=visiting)
+                          for argument in typing.get_args(annotation)]}
+    if origin is list:
+        arguments = typing.get_args(annotation)
+        if len(arguments) == 0:
+            return {"type": "array"}
+        return {"type": "array", "items": _derive_type_schema(annotation=arguments[0], visiting=visiting)}
+    if origin is dict:
+        return {"type": "object"}
+    if isinstance(annotation, type) and issubclass(annotation, NumericArray):
+        return {"type": "array", "items": {"type": "number" if annotation.TYPECODE == "d" else "integer"}}
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return {"enum": [member.value for member in annotation]}
+    if isinstance(annotation, type) and dataclasses.is_dataclass(annotation):
+        if annotation in visiting:
+            return {"type": "object"}
+        visiting = visiting | {annotation}
+        fields = {field.name: field for field in dataclasses.fields(annotation)}
+        properties = {}
+        required = []
+        for name, field_annotation in all_annotations(annotation).items():
+            if name not in fields:
+                continue
+            schema = _derive_type_schema(annotation=field_annotation, visiting=visiting)
+            if fields[name].default is dataclasses.MISSING and fields[name].default_factory is dataclasses.MISSING:
+                required.append(name)
+            elif fields[name].default is None and not dataclasses.is_dataclass(field_annotation) and \
+                    typing.get_origin(field_annotation) is not list:
+                schema = _nullable(schema)
+            properties[name] = schema
+        schema = {"type": "object", "properties": properties}
+        if any(required):
+            schema["required"] = required
+        return schema
+    return {}
+
+
+def _nullable(schema: dict) -> dict:
+    if schema == {}:
+        return schema
+    if isinstance(schema.get("type"), str):
+        return {**schema, "type": ["null", schema["type"]]}
+    if "enum" in schema:
+        return {**schema, "enum": [None, *schema["enum"]]}
+    if "anyOf" in schema and {"type": "null"} not in schema["anyOf"]:
+        return {**schema, "anyOf": [{"type": "null"}, *schema["anyOf"]]}
+    return schema
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_validator(_type: typing.Type) -> SchemaValidator:
+    return SchemaValidator(schema=derive_json_schema(_type=_type))
+
+
+def create_schema_validator(schema: typing.Optional[dict] = None,
+                            _type: typing.Optional[typing.Type] = None) -> typing.Optional[SchemaValidator]:
+    if schema is not None:
+        return SchemaValidator(schema=schema)
+    if _type is not None:
+        return get_type_validator(_type=_type)
+    return None
@@ -1,15 +1,40 @@
+import base64
+import binascii
+import gzip
+import hashlib
+import io
+import json
+import warnings
+import zlib
 from abc import ABC
-from typing import Type
+from dataclasses import dataclass, field
+from typing import Type, Optional, Callable, Iterator, Any
 
-from formula_thoughts_web.abstractions import SequenceBuilder, ApplicationContext, ApiRequestHandler, Serializer, Logger, Deserializer
+from formula_thoughts_web.abstractions import SequenceBuilder, ApplicationContext, ApiRequestHandler, Serializer, Logger, \
+    Deserializer, DtoEncoder, RouteOptions, ResponseCachePolicy, StreamingResponse, RequestVariables, PayloadLimits, \
+    RequestValidationError
 from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, USE_RESPONSE_ERROR
-from formula_thoughts_web.crosscutting import ObjectMapper
+from formula_thoughts_web.caching import ResponseCache, CacheKey, CachedResponse, NULL_RESPONSE_CACHE
+from formula_thoughts_web.crosscutting import check_json_limits, ObjectMapper, DEFAULT_DTO_ENCODER, NULL_LOGGER
+from formula_thoughts_web.exceptions import RouteConflictException, ResponseTooLargeException, PayloadTooLargeException, \
+    PayloadTooComplexException, InvalidBatchRequestException
+from formula_thoughts_web.validation import create_schema_validator
+
+ANY_METHOD = "ANY"
+DEFAULT_ROUTE = "$default"
+GZIP = "gzip"
+DEFLATE = "deflate"
+SUPPORTED_ENCODINGS = [GZIP, DEFLATE]
+CACHEABLE_METHODS = ["GET", "HEAD"]
+PAYLOAD_TOO_DEEP_MESSAGE = "payload is nested too deeply"
+BATCH_EXCLUDED_HEADERS = ["accept-encoding", "if-none-match", "content-length", "content-type"]
 
 
 class StatusCodeMapping:
 
     def __init__(self):
         self.__mappings = {}
+        self.add_mapping(_type=RequestValidationError, status_code=400)
 
     def add_mapping(self, _type, status_code: int) -> None:
         self.__mappings[f"{_type.__module__}.{_type.__name__}"] = status_code
@@ -18,6 +43,200 @@ class StatusCodeMapping:
         return self.__mappings[f"{response.__module__}.{response.__name__}"]
 
 
+@dataclass
+class WebRunnerSettings:
+    compression_level: int = 6
+    compression_min_size: int = 1024
+    generate_etags: bool = True
+    stream_chunk_size: int = 64 * 1024
+    max_buffered_stream_size: int = 6 * 1024 * 1024
+    payload_limits: PayloadLimits = field(default_factory=lambda: PayloadLimits())
+    batch_route_key: Optional[str] = None
+    batch_route_keys: list[str] = field(default_factory=lambda: [])
+    batch_max_requests: int = 20
+    batch_stop_on_error: bool = False
+
+
+DEFAULT_WEB_RUNNER_SETTINGS = WebRunnerSettings()
+
+
+@dataclass
+class RouteMatch:
+    request_handler: ApiRequestHandler = None
+    path_parameters: dict = field(default_factory=lambda: {})
+
+
+class _RouteNode:
+    __slots__ = ("literals", "parameter", "proxy", "request_handler")
+
+    def __init__(self):
+        self.literals: dict[str, _RouteNode] = {}
+        self.parameter: Optional[tuple[str, _RouteNode]] = None
+        self.proxy: Optional[tuple[str, ApiRequestHandler]] = None
+        self.request_handler: Optional[ApiRequestHandler] = None
+
+
+class LazyApiRequestHandler:
+
+    def __init__(self, route_key: str, factory: Callable[[], ApiRequestHandler]):
+        self.__factory = factory
+        self.__route_key = route_key
+        self.__request_handler: Optional[ApiRequestHandler] = None
+
+    def run(self, event: dict) -> ApplicationContext:
+        return self.request_handler.run(event=event)
+
+    @property
+    def request_handler(self) -> ApiRequestHandler:
+        if self.__request_handler is None:
+            request_handler = self.__factory()
+            if request_handler.route_key != self.__route_key:
+                raise RouteConflictException(f"lazy route {self.__route_key} resolved a handler for route {request_handler.route_key}")
+            self.__request_handler = request_handler
+        return self.__request_handler
+
+    @property
+    def route_key(self) -> str:
+        return self.__route_key
+
+    @property
+    def options(self) -> RouteOptions:
+        return self.request_handler.options
+
+
+class RouteTable:
+
+    def __init__(self, request_handlers: list[ApiRequestHandler]):
+        self.__exact_routes: dict[str, ApiRequestHandler] = {}
+        self.__template_routes: dict[str, _RouteNode] = {}
+        for request_handler in request_handlers:
+            self.__add_route(request_handler=request_handler)
+
+    def match(self, route_key: str) -> Optional[RouteMatch]:
+        request_handler = self.__exact_routes.get(route_key)
+        if request_handler is not None:
+            return RouteMatch(request_handler=request_handler)
+        method, _, path = route_key.partition(" ")
+        segments = self.__split_path(path)
+        for candidate_method in (method, ANY_METHOD):
+            root = self.__template_routes.get(candidate_method)
+            if root is None:
+                continue
+            path_parameters = {}
+            request_handler = self.__search(node=root, segments=segments, index=0, path_parameters=path_parameters)
+            if request_handler is not None:
+                return RouteMatch(request_handler=request_handler, path_parameters=path_parameters)
+        request_handler = self.__exact_routes.get(DEFAULT_ROUTE)
+        if request_handler is not None:
+            return RouteMatch(request_handler=request_handler)
+        return None
+
+    def __add_route(self, request_handler: ApiRequestHandler) -> None:
+        route_key = request_handler.route_key
+        if route_key in self.__exact_routes:
+            raise RouteConflictException(f"route {route_key} is registered more than once")
+        self.__exact_routes[route_key] = request_handler
+        if route_key == DEFAULT_ROUTE:
+            return
+        method, _, path = route_key.partition(" ")
+        node = self.__template_routes.setdefault(method, _RouteNode())
+        segments = self.__split_path(path)
+        for index, segment in enumerate(segments):
+            if segment.startswith("{") and segment.endswith("+}"):
+                if index != len(segments) - 1:
+                    raise RouteConflictException(f"greedy path variable {segment} in route {route_key} must be the last segment")
+                if node.proxy is not None:
+                    raise RouteConflictException(f"route {route_key} is ambiguous with route {node.proxy[1].route_key}")
+                node.proxy = (segment[1:-2], request_handler)
+                return
+            if segment.startswith("{") and segment.endswith("}"):
+                name = segment[1:-1]
+                if node.parameter is None:
+                    node.parameter = (name, _RouteNode())
+                elif node.parameter[0] != name:
+                    raise RouteConflictException(f"path variable {segment} in route {route_key} is ambiguous with {{{node.parameter[0]}}}")
+                node = node.parameter[1]
+            else:
+                node = node.literals.setdefault(segment, _RouteNode())
+        if node.request_handler is not None:
+            raise RouteConflictException(f"route {route_key} is ambiguous with route {node.request_handler.route_key}")
+        node.request_handler = request_handler
+
+    def __search(self, node: _RouteNode, segments: list[str], index: int, path_parameters: dict) -> Optional[ApiRequestHandler]:
+        if index == len(segments):
+            return node.request_handler
+        segment = segments[index]
+        literal = node.literals.get(segment)
+        if literal is not None:
+            request_handler = self.__search(node=literal, segments=segments, index=index + 1, path_parameters=path_parameters)
+            if request_handler is not None:
+                return request_handler
+        if node.parameter is not None and segment != "":
+            name, parameter = node.parameter
+            request_handler = self.__search(node=parameter, segments=segments, index=index + 1, path_parameters=path_parameters)
+            if request_handler is not None:
+                path_parameters[name] = segment
+                return request_handler
+        if node.proxy is not None and segment != "":
+            name, request_handler = node.proxy
+            path_parameters[name] = "/".join(segments[index:])
+            return request_handler
+        return None
+
+    @staticmethod
+    def __split_path(path: str) -> list[str]:
+        return path.strip("/").split("/")
+
+
+def get_header(event: dict, name: str) -> Optional[str]:
+    headers = event.get('headers') or {}
+    lower_name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == lower_name:
+            return value
+    return None
+
+
+def is_json_content_type(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def negotiate_content_encoding(accept_encoding: str) -> Optional[str]:
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.strip().partition(";")
+        weight = 1.0
+        parameter_name, _, parameter_value = parameters.strip().partition("=")
+        if parameter_name.strip() == "q":
+            try:
+                weight = float(parameter_value)
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    best_encoding = None
+    best_weight = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best_encoding = encoding
+            best_weight = weight
+    return best_encoding
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        for encoding in SUPPORTED_ENCODINGS:
+            candidate = candidate.removesuffix(f"-{encoding}")
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
 class WebRunner:
 
     def __init__(self,
@@ -25,37 +244,107 @@ class WebRunner:
                  serializer: Serializer,
                  status_code_mappings: StatusCodeMapping,
                  error_handling_state: ErrorHandlingTypeState,
-                 object_mapper: ObjectMapper,
-                 logger: Logger):
-        self.__object_mapper = object_mapper
+                 dto_encoder: DtoEncoder = DEFAULT_DTO_ENCODER,
+                 settings: WebRunnerSettings = DEFAULT_WEB_RUNNER_SETTINGS,
+                 response_cache: ResponseCache = NULL_RESPONSE_CACHE,
+                 logger: Logger = NULL_LOGGER,
+                 object_mapper=None):
+        if isinstance(dto_encoder, ObjectMapper):
+            # positional (..., error_handling_state, object_mapper, logger) call from before dto_encoder existed
+            object_mapper, logger, dto_encoder, settings = dto_encoder, settings, DEFAULT_DTO_ENCODER, DEFAULT_WEB_RUNNER_SETTINGS
+        if object_mapper is not None:
+            warnings.warn("WebRunner object_mapper is deprecated, pass dto_encoder instead",
+                          DeprecationWarning, stacklevel=2)
+        self.__response_cache = response_cache
+        self.__settings = settings
+        self.__dto_encoder = dto_encoder
         self.__error_handling_state = error_handling_state
         self.__status_code_mappings = status_code_mappings
         self.__logger = logger
         self.__serializer = serializer
-        self.__request_handlers = request_handlers
+        self.__route_table = RouteTable(request_handlers=request_handlers)
 
     def run(self, event) -> dict:
+        if self.__is_batch(event=event):
+            return self.__run_batch(event=event)
+        return self.__run(event=event, stream=False)
+
+    def run_streaming(self, event) -> dict:
+        if self.__is_batch(event=event):
+            response = self.__run_batch(event=event)
+        else:
+            response = self.__run(event=event, stream=True)
+        if isinstance(response['body'], str):
+            return {**response, "body": iter([response['body']])}
+        if response['body'] is None:
+            return {**response, "body": iter([])}
+        return response
+
+    def __run(self, event: dict, stream: bool) -> dict:
         self.__error_handling_state.error_handling_type = USE_RESPONSE_ERROR
         headers = {"Content-Type": "application/json"}
         self.__logger.add_global_properties(properties={"route_key": event['routeKey']})
-        request_handler_matches = list(filter(lambda x: x.route_key == event['routeKey'], self.__request_handlers))
-        if len(request_handler_matches) == 0:
+        route_match = self.__route_table.match(route_key=self.__get_route_key(event=event))
+        if route_match is None:
             return {
                 "headers": headers,
                 "body": self.__serializer.serialize(data={"message": f"route {event['routeKey']} not found"}),
                 "statusCode": 404
             }
+        if any(route_match.path_parameters):
+            event = {**event, "pathParameters": {**route_match.path_parameters, **(event.get('pathParameters') or {})}}
+        request_handler = route_match.request_handler
         try:
-            context: ApplicationContext = request_handler_matches[0].run(event=event)
-            body = None
-            status_code = 204
-            if context.response is not None:
-                body = self.__serializer.serialize(data=self.__object_mapper.map_to_dict(_from=context.response, to=type(context.response)))
-                status_code = self.__status_code_mappings.get_mappings(response=type(context.response))
+            options = getattr(request_handler, "options", None) or RouteOptions()
+            self.__check_payload_limits(event=event, options=options)
+            cache_policy = self.__get_cache_policy(event=event, options=options)
+            cache_key = None
+            if cache_policy is not None:
+                cache_key = self.__get_cache_key(event=event, request_handler=request_handler, cache_policy=cache_policy)
+                cached_response = self.__response_cache.get(key=cache_key)
+                if cached_response is not None:
+                    return self.__encode_response(event=event,
+                                                  status_code=cached_response.status_code,
+                                                  body=cached_response.body,
+                                                  etag=cached_response.etag,
+                                                  options=options,
+                                                  headers=headers)
+            context: ApplicationContext = request_handler.run(event=event)
+            if stream and isinstance(context.response, StreamingResponse):
+                return {
+                    "headers": headers,
+                    "body": self.__log_stream_errors(chunks=self.__stream_chunks(response=context.response)),
+                    "statusCode": context.response.status_code
+                }
+            response = self.__build_response(event=event,
+                                             context=context,
+                                             request_handler=request_handler,
+                                             headers=headers)
+            if cache_key is not None and response.body is not None and 200 <= response.status_code < 300:
+                self.__response_cache.set(key=cache_key, response=response, ttl_seconds=cache_policy.ttl_seconds)
+            return self.__encode_response(event=event,
+                                          status_code=response.status_code,
+                                          body=response.body,
+                                          etag=response.etag,
+                                          options=options,
+                                          headers=headers)
+        except PayloadTooLargeException as e:
             return {
                 "headers": headers,
-                "body": body,
-                "statusCode": status_code
+                "body": self.__serializer.serialize(data={"message": str(e)}),
+                "statusCode": 413
+            }
+        except PayloadTooComplexException as e:
+            return {
+                "headers": headers,
+                "body": self.__serializer.serialize(data={"message": str(e)}),
+                "statusCode": 400
+            }
+        except RecursionError:
+            return {
+                "headers": headers,
+                "body": self.__serializer.serialize(data={"message": PAYLOAD_TOO_DEEP_MESSAGE}),
+                "statusCode": 400
             }
         except Exception as e:
             self.__logger.log_exception(exception=e)
@@ -65,6 +354,280 @@ class WebRunner:
                 "statusCode": 500
             }
 
+    def __is_batch(self, event: dict) -> bool:
+        return self.__settings.batch_route_key is not None and \
+            self.__get_route_key(event=event) == self.__settings.batch_route_key
+
+    def __run_batch(self, event: dict) -> dict:
+        headers = {"Content-Type": "application/json"}
+        self.__logger.add_global_properties(properties={"route_key": event['routeKey']})
+        options = RouteOptions()
+        try:
+            self.__check_payload_limits(event=event, options=options)
+            entries = self.__get_batch_entries(event=event)
+            query_parameters = event.get('queryStringParameters') or {}
+            stop_on_error = str(query_parameters.get('stopOnError', self.__settings.batch_stop_on_error)).lower() == "true"
+        except PayloadTooLargeException as e:
+            return {
+                "headers": headers,
+                "body": self.__serializer.serialize(data={"message": str(e)}),
+                "statusCode": 413
+            }
+        except (PayloadTooComplexException, InvalidBatchRequestException) as e:
+            return {
+                "headers": headers,
+                "body": self.__serializer.serialize(data={"message": str(e)}),
+                "statusCode": 400
+            }
+        responses = []
+        stopped = False
+        for entry in entries:
+            if stopped:
+                responses.append({
+                    "body": self.__serializer.serialize(data={"message": "skipped after an earlier request failed"}),
+                    "statusCode": 424
+                })
+                continue
+            response = self.__run_batch_entry(event=event, entry=entry)
+            stopped = stop_on_error and response['statusCode'] >= 400
+            responses.append(response)
+        body = "[" + ", ".join(self.__serialize_batch_response(response=response) for response in responses) + "]"
+        return self.__encode_response(event=event, status_code=200, body=body, etag=None, options=options, headers=headers)
+
+    def __get_batch_entries(self, event: dict) -> list[dict]:
+        body = event.get('body')
+        if body is None:
+            raise InvalidBatchRequestException("batch request body is missing")
+        try:
+            entries = json.loads(binascii.a2b_base64(body) if event.get('isBase64Encoded', False) else body)
+        except (ValueError, binascii.Error):
+            raise InvalidBatchRequestException("batch request body is not valid json")
+        except RecursionError:
+            raise PayloadTooComplexException(PAYLOAD_TOO_DEEP_MESSAGE)
+        if not isinstance(entries, list):
+            raise InvalidBatchRequestException("batch request body must be an array")
+        if len(entries) > self.__settings.batch_max_requests:
+            raise InvalidBatchRequestException(f"batch request exceeds {self.__settings.batch_max_requests} requests")
+        for entry in entries:
+            if not isinstance(entry, dict) or not isinstance(entry.get('routeKey'), str):
+                raise InvalidBatchRequestException("batch request entries must have a routeKey")
+        return entries
+
+    def __run_batch_entry(self, event: dict, entry: dict) -> dict:
+        if entry['routeKey'] == self.__settings.batch_route_key:
+            return {
+                "body": self.__serializer.serialize(data={"message": "batch requests cannot be nested"}),
+                "statusCode": 400
+            }
+        route_match = self.__route_table.match(route_key=entry['routeKey'])
+        if route_match is not None and route_match.request_handler.route_key not in self.__settings.batch_route_keys:
+            return {
+                "body": self.__serializer.serialize(data={"message": f"route {entry['routeKey']} cannot be batched"}),
+                "statusCode": 403
+            }
+        return self.__run(event=self.__get_batch_entry_event(event=event, entry=entry), stream=False)
+
+    @staticmethod
+    def __serialize_batch_response(response: dict) -> str:
+        body = "null" if response['body'] is None else response['body']
+        return f"{{\"statusCode\": {response['statusCode']}, \"body\": {body}}}"
+
+    @staticmethod
+    def __get_batch_entry_event(event: dict, entry: dict) -> dict:
+        headers = {key: value for key, value in (event.get('headers') or {}).items()
+                   if key.lower() not in BATCH_EXCLUDED_HEADERS}
+        entry_event = {
+            "routeKey": entry['routeKey'],
+            "pathParameters": entry.get('pathParameters'),
+            "queryStringParameters": entry.get('queryStringParameters'),
+            "headers": {**headers, "content-type": "application/json"},
+            "body": None if entry.get('body') is None else json.dumps(entry['body']),
+            "isBase64Encoded": False
+        }
+        if 'requestContext' in event:
+            entry_event['requestContext'] = event['requestContext']
+        return entry_event
+
+    def __check_payload_limits(self, event: dict, options: RouteOptions) -> None:
+        body = event.get('body')
+        if body is None:
+            return
+        limits = self.__get_payload_limits(options=options)
+        is_base64_encoded = event.get('isBase64Encoded', False)
+        if limits.max_body_bytes is not None and \
+                self.__get_body_size(body=body, is_base64_encoded=is_base64_encoded, max_body_bytes=limits.max_body_bytes) > limits.max_body_bytes:
+            raise PayloadTooLargeException(f"request body exceeds {limits.max_body_bytes} bytes")
+        if limits.max_depth is None and limits.max_elements is None:
+            return
+        content_type = get_header(event=event, name="Content-Type")
+        if content_type is not None and not is_json_content_type(content_type=content_type):
+            return
+        check_json_limits(data=binascii.a2b_base64(body) if is_base64_encoded else body,
+                          max_depth=limits.max_depth,
+                          max_elements=limits.max_elements)
+
+    def __get_payload_limits(self, options: RouteOptions) -> PayloadLimits:
+        global_limits = self.__settings.payload_limits
+        route_limits = options.payload_limits
+        if route_limits is None:
+            return global_limits
+        return PayloadLimits(
+            max_body_bytes=global_limits.max_body_bytes if route_limits.max_body_bytes is None else route_limits.max_body_bytes,
+            max_depth=global_limits.max_depth if route_limits.max_depth is None else route_limits.max_depth,
+            max_elements=global_limits.max_elements if route_limits.max_elements is None else route_limits.max_elements)
+
+    @staticmethod
+    def __get_body_size(body: str, is_base64_encoded: bool, max_body_bytes: int) -> int:
+        if is_base64_encoded:
+            return len(body) // 4 * 3 - (len(body) - len(body.rstrip("=")))
+        if len(body) > max_body_bytes or len(body) * 4 <= max_body_bytes:
+            return len(body)
+        return len(body.encode('utf-8'))
+
+    def __build_response(self, event: dict, context: ApplicationContext, request_handler: ApiRequestHandler,
+                         headers: dict) -> CachedResponse:
+        if context.response is None:
+            return CachedResponse(status_code=204)
+        if isinstance(context.response, StreamingResponse):
+            status_code = context.response.status_code
+        else:
+            status_code = self.__status_code_mappings.get_mappings(response=type(context.response))
+        use_etag = self.__use_etag(event=event, status_code=status_code)
+        etag = None
+        if use_etag and context.version_tag is not None:
+            etag = f"\"{context.version_tag}\""
+            if self.__is_not_modified(event=event, etag=etag):
+                return CachedResponse(status_code=status_code, etag=etag)
+        body = self.__serialize(response=context.response)
+        if use_etag and etag is None:
+            etag = f"\"{hashlib.blake2b(body.encode('utf-8'), digest_size=16).hexdigest()}\""
+        return CachedResponse(status_code=status_code, body=body, etag=etag)
+
+    def __serialize(self, response) -> str:
+        if not isinstance(response, StreamingResponse):
+            return self.__dto_encoder.encode(dto=response, to=type(response))
+        buffer = io.StringIO()
+        size = 0
+        for chunk in self.__stream_chunks(response=response):
+            size += len(chunk)
+            if size > self.__settings.max_buffered_stream_size:
+                raise ResponseTooLargeException(f"streamed response exceeds {self.__settings.max_buffered_stream_size} characters")
+            buffer.write(chunk)
+        return buffer.getvalue()
+
+    def __stream_chunks(self, response: StreamingResponse) -> Iterator[str]:
+        chunk = ["["]
+        chunk_size = 1
+        separator = ""
+        for item in response.items:
+            item_type = type(item) if response.item_type is None else response.item_type
+            serialized = self.__dto_encoder.encode(dto=item, to=item_type)
+            chunk.append(separator)
+            chunk.append(serialized)
+            chunk_size += len(separator) + len(serialized)
+            separator = ", "
+            if chunk_size >= self.__settings.stream_chunk_size:
+                yield "".join(chunk)
+                chunk = []
+                chunk_size = 0
+        chunk.append("]")
+        yield "".join(chunk)
+
+    def __log_stream_errors(self, chunks: Iterator[str]) -> Iterator[str]:
+        try:
+            yield from chunks
+        except Exception as e:
+            self.__logger.log_error(message="streamed response failed after it started")
+            self.__logger.log_exception(exception=e)
+            raise
+
+    def __encode_response(self, event: dict, status_code: int, body: Optional[str], etag: Optional[str],
+                          options: RouteOptions, headers: dict) -> dict:
+        if etag is not None and self.__is_not_modified(event=event, etag=etag):
+            return self.__not_modified(etag=etag)
+        if etag is not None:
+            headers = {**headers, "ETag": etag}
+        encoding = self.__get_content_encoding(event=event, body=body, options=options)
+        if encoding is not None:
+            if etag is not None:
+                headers = {**headers, "ETag": f"{etag[:-1]}-{encoding}\""}
+            return {
+                "headers": {**headers, "Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                "body": self.__compress(body=body, encoding=encoding),
+                "isBase64Encoded": True,
+                "statusCode": status_code
+            }
+        return {
+            "headers": headers,
+            "body": body,
+            "statusCode": status_code
+        }
+
+    def __get_cache_policy(self, event: dict, options: RouteOptions) -> Optional[ResponseCachePolicy]:
+        method = self.__get_route_key(event=event).partition(" ")[0]
+        if method not in CACHEABLE_METHODS:
+            return None
+        return options.cache
+
+    @staticmethod
+    def __get_cache_key(event: dict, request_handler: ApiRequestHandler, cache_policy: ResponseCachePolicy) -> CacheKey:
+        path_parameters = ()
+        query_parameters = ()
+        auth_user_id = None
+        if cache_policy.vary_by_path_parameters:
+            path_parameters = tuple(sorted((k, str(v)) for k, v in (event.get('pathParameters') or {}).items()))
+        if cache_policy.vary_by_query_parameters:
+            query_parameters = tuple(sorted((k, str(v)) for k, v in (event.get('queryStringParameters') or {}).items()))
+        if cache_policy.vary_by_user:
+            try:
+                auth_user_id = event['requestContext']['authorizer']['jwt']['claims']['username']
+            except KeyError:
+                pass
+        return request_handler.route_key, path_parameters, query_parameters, auth_user_id
+
+    def __use_etag(self, event: dict, status_code: int) -> bool:
+        method = self.__get_route_key(event=event).partition(" ")[0]
+        return self.__settings.generate_etags and 200 <= status_code < 300 and method in CACHEABLE_METHODS
+
+    @staticmethod
+    def __is_not_modified(event: dict, etag: str) -> bool:
+        if_none_match = get_header(event=event, name="If-None-Match")
+        return if_none_match is not None and etag_matches(if_none_match=if_none_match, etag=etag)
+
+    @staticmethod
+    def __not_modified(etag: str) -> dict:
+        return {
+            "headers": {"ETag": etag},
+            "body": None,
+            "statusCode": 304
+        }
+
+    def __get_content_encoding(self, event: dict, body: Optional[str], options: RouteOptions) -> Optional[str]:
+        if body is None or len(body) < self.__settings.compression_min_size:
+            return None
+        accept_encoding = get_header(event=event, name="Accept-Encoding")
+        if accept_encoding is None or not options.compress_response:
+            return None
+        return negotiate_content_encoding(accept_encoding=accept_encoding)
+
+    def __compress(self, body: str, encoding: str) -> str:
+        data = body.encode('utf-8')
+        if encoding == GZIP:
+            compressed = gzip.compress(data, compresslevel=self.__settings.compression_level, mtime=0)
+        else:
+            compressed = zlib.compress(data, self.__settings.compression_level)
+        return base64.b64encode(compressed).decode('utf-8')
+
+    @staticmethod
+    def __get_route_key(event: dict) -> str:
+        route_key = event['routeKey']
+        if route_key != DEFAULT_ROUTE:
+            return route_key
+        try:
+            return f"{event['requestContext']['http']['method']} {event['rawPath']}"
+        except KeyError:
+            return route_key
+
 
 class ApiRequestHandlerBase(ABC):
 
@@ -72,7 +635,10 @@ class ApiRequestHandlerBase(ABC):
                  sequence: SequenceBuilder,
                  command_pipeline: TopLevelSequenceRunner,
                  deserializer: Deserializer,
-                 logger: Logger):
+                 logger: Logger,
+                 options: RouteOptions = None):
+        self.__options = RouteOptions() if options is None else options
+        self.__body_validator = create_schema_validator(schema=self.__options.body_schema, _type=self.__options.body_type)
         self.__logger = logger
         self.__deserializer = deserializer
         self.__command_pipeline = command_pipeline
@@ -80,40 +646,32 @@ class ApiRequestHandlerBase(ABC):
         self.__sequence = sequence
 
     def run(self, event: dict) -> ApplicationContext:
-        body = None
+        path_parameters = event.get('pathParameters')
+        query_parameters = event.get('queryStringParameters')
+        claims = None
         auth_user_id = None
-        parameters = {}
-        if 'pathParameters' in event:
-            path_parameters = event['pathParameters']
-            if path_parameters is None:
-                pass
-            parameters = {**parameters, **path_parameters}
-            self.__logger.add_global_properties(properties={"path_params": path_parameters})
-        if 'queryStringParameters' in event:
-            query_parameters = event['queryStringParameters']
-            if query_parameters is None:
-                pass
-            parameters = {**parameters, **query_parameters}
-            self.__logger.add_global_properties(properties={"query_params": query_parameters})
         try:
-            claims = auth_user_id = event['requestContext']['authorizer']['jwt']['claims']
-            parameters = {**parameters, **claims}
+            claims = event['requestContext']['authorizer']['jwt']['claims']
             auth_user_id = claims['username']
-            self.__logger.add_global_properties(properties={"auth_user_id": auth_user_id})
-            self.__logger.add_global_properties(properties={"user_claims": claims})
         except KeyError:
             pass
+        self.__logger.add_global_properties(properties={"path_params": path_parameters,
+                                                        "query_params": query_parameters,
+                                                        "auth_user_id": auth_user_id})
+        parameters = RequestVariables(claims, query_parameters, path_parameters, event.get('headers'))
+        body_loader = None
         if 'body' in event:
-            try:
-                json_body = self.__deserializer.deserialize(event['body'])
-                body = json_body
-            except ValueError:
-                self.__logger.log_info("Cannot serialize to dictionary, using string instead")
-                body = event['body']
-        context = ApplicationContext(body=body,
-                                     auth_user_id=auth_user_id,
+            body_loader = lambda: self.__decode_body(event=event)
+        context = ApplicationContext(auth_user_id=auth_user_id,
                                      variables=parameters,
-                                     error_capsules=[])
+                                     error_capsules=[],
+                                     body_loader=body_loader)
+        if self.__body_validator is not None:
+            errors = self.__body_validator.validate(data=context.body)
+            if any(errors):
+                self.__logger.log_info(message="request body failed schema validation", properties={"errors": errors})
+                context.response = RequestValidationError(message="request body failed validation", errors=errors)
+                return context
         self.__command_pipeline.run(context=context,
                                     top_level_sequence=self.__sequence)
         return context
@@ -121,3 +679,22 @@ class ApiRequestHandlerBase(ABC):
     @property
     def route_key(self) -> str:
         return self.__route_key
+
+    @property
+    def options(self) -> RouteOptions:
+        return self.__options
+
+    def __decode_body(self, event: dict) -> Any:
+        body = event['body']
+        if body is None:
+            return None
+        if event.get('isBase64Encoded', False):
+            body = binascii.a2b_base64(body)
+        content_type = get_header(event=event, name="Content-Type")
+        if content_type is not None and not is_json_content_type(content_type=content_type):
+            return body
+        try:
+            return self.__deserializer.deserialize(body)
+        except ValueError:
+            self.__logger.log_info("Cannot serialize to dictionary, using string instead")
+            return body
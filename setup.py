@@ -13,8 +13,9 @@ setup(
     description=DESCRIPTION,
     long_description_content_type="text/markdown",
     long_description=LONG_DESCRIPTION,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     install_requires=REQUIREMENTS,
+    extras_require={"orjson": ["orjson"], "msgpack": ["msgpack"]},
     keywords=['python', 'lambda', 'api gateway', 'sqs'],
     classifiers=[
         "Development Status :: 1 - Planning",
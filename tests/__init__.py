@@ -3,6 +3,9 @@ class DummyLogger:
     def add_global_properties(self, properties: dict):
         ...
 
+    def clear_global_properties(self):
+        ...
+
     def log_error(self, message: str, properties: dict = None):
         ...
 
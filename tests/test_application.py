@@ -1,9 +1,10 @@
+import dataclasses
 from unittest import TestCase
 from unittest.mock import Mock, MagicMock
 
 from autofixture import AutoFixture
 
-from formula_thoughts_web.abstractions import Error, ErrorHandlingStrategy
+from formula_thoughts_web.abstractions import Error, ErrorHandlingStrategy, RequestVariables
 from formula_thoughts_web.application import FluentSequenceBuilder, ApplicationContext, TopLevelSequenceRunner, \
     Command, ErrorHandlingStrategyFactory, ErrorHandlingTypeState, ResponseErrorHandlingStrategy, \
     ExceptionErrorHandlingStrategy
@@ -114,6 +115,22 @@ class TestSequenceBuilder(TestCase):
         # assert
         self.assertEqual(context.body["trail"], ["command 3", "command 4", "command 5"])
 
+    def test_sequence_when_run_again(self):
+        # arrange
+        sut = DummyNested2SequenceBuilder()
+        self.__error_handling_strategy_factory.get_error_handling_strategy = MagicMock(
+            return_value=self.__error_handling_strategy)
+        self.__top_level_sequence_runner.run(context=ApplicationContext(body={"trail": []}),
+                                             top_level_sequence=sut)
+        context = ApplicationContext(body={"trail": []})
+
+        # act
+        self.__top_level_sequence_runner.run(context=context,
+                                             top_level_sequence=sut)
+
+        # assert
+        self.assertEqual(context.body["trail"], ["command 3", "command 4", "command 5"])
+
     def test_sequence_with_short_circuit(self):
         # arrange
         sut = DummyNestedErrorSequenceBuilder()
@@ -265,4 +282,134 @@ class TestExceptionErrorHandlingStrategy(TestCase):
 
         # assert
         with self.subTest(msg="assert response is set"):
-            self.assertEqual(strategy, "USE_EXCEPTION_ERROR")
\ No newline at end of file
+            self.assertEqual(strategy, "USE_EXCEPTION_ERROR")
+
+
+class TestRequestVariables(TestCase):
+
+    def setUp(self):
+        self.__path_parameters = {"id": "42", "shared": "path"}
+        self.__query_parameters = {"page": "2", "shared": "query"}
+        self.__claims = {"username": "bob132"}
+        self.__sut = RequestVariables(self.__claims, self.__query_parameters, self.__path_parameters, None)
+
+    def test_read_through_layers(self):
+        # act
+        variables = dict(self.__sut.items())
+
+        # assert
+        with self.subTest(msg="earlier layers take precedence"):
+            self.assertEqual(variables, {"id": "42", "shared": "query", "page": "2", "username": "bob132"})
+
+        # assert
+        with self.subTest(msg="view compares equal to a dict"):
+            self.assertEqual(self.__sut, {"id": "42", "shared": "query", "page": "2", "username": "bob132"})
+
+    def test_write_goes_to_overlay(self):
+        # act
+        self.__sut["id"] = "43"
+
+        # assert
+        with self.subTest(msg="overlay value is returned"):
+            self.assertEqual(self.__sut["id"], "43")
+
+        # assert
+        with self.subTest(msg="raw layer is untouched"):
+            self.assertEqual(self.__path_parameters["id"], "42")
+
+    def test_delete_hides_layer_value(self):
+        # act
+        del self.__sut["page"]
+
+        # assert
+        with self.subTest(msg="key is removed from view"):
+            self.assertNotIn("page", self.__sut)
+
+        # assert
+        with self.subTest(msg="raw layer is untouched"):
+            self.assertEqual(self.__query_parameters["page"], "2")
+
+    def test_get_typed_converts_and_caches(self):
+        # act
+        first = self.__sut.get_typed(name="id", _type=int)
+        second = self.__sut.get_typed(name="id", _type=int)
+
+        # assert
+        with self.subTest(msg="value is converted"):
+            self.assertEqual(first, 42)
+
+        # assert
+        with self.subTest(msg="converted value is cached"):
+            self.assertIs(first, second)
+
+    def test_get_typed_after_write(self):
+        # arrange
+        self.__sut.get_typed(name="id", _type=int)
+
+        # act
+        self.__sut["id"] = "7"
+
+        # assert
+        self.assertEqual(self.__sut.get_typed(name="id", _type=int), 7)
+
+    def test_get_var_with_request_variables(self):
+        # arrange
+        context = ApplicationContext(variables=self.__sut)
+
+        # act
+        page = context.get_var("page", int)
+
+        # assert
+        self.assertEqual(page, "2")
+
+
+class TestApplicationContext(TestCase):
+
+    def setUp(self):
+        self.__sut = ApplicationContext(auth_user_id="bob132",
+                                        variables={"id": "42"},
+                                        body_loader=lambda: {"field_1": "value1"})
+
+    def test_body_is_deferred(self):
+        # assert
+        with self.subTest(msg="body is not loaded before access"):
+            self.assertFalse(self.__sut.body_loaded)
+
+        # assert
+        with self.subTest(msg="body is loaded on access"):
+            self.assertEqual(self.__sut.body, {"field_1": "value1"})
+
+        # assert
+        with self.subTest(msg="body is marked as loaded"):
+            self.assertTrue(self.__sut.body_loaded)
+
+    def test_replace(self):
+        # act
+        context = dataclasses.replace(self.__sut, response="response")
+
+        # assert
+        with self.subTest(msg="deferred body is carried over"):
+            self.assertEqual(context.body, {"field_1": "value1"})
+
+        # assert
+        with self.subTest(msg="replaced field is set"):
+            self.assertEqual(context.response, "response")
+
+    def test_asdict(self):
+        # act
+        context_dict = dataclasses.asdict(self.__sut)
+
+        # assert
+        self.assertEqual(context_dict, {"body": {"field_1": "value1"},
+                                        "auth_user_id": "bob132",
+                                        "variables": {"id": "42"},
+                                        "error_capsules": [],
+                                        "response": None,
+                                        "version_tag": None})
+
+    def test_get_var_does_not_convert(self):
+        # act
+        _id = self.__sut.get_var("id", int)
+
+        # assert
+        self.assertEqual(_id, "42")
@@ -0,0 +1,33 @@
+import tempfile
+from unittest import TestCase
+
+from formula_thoughts_web.blob_stores import FileSystemBlobStore
+from formula_thoughts_web.exceptions import BlobNotFoundException
+
+
+class TestFileSystemBlobStore(TestCase):
+
+    def setUp(self):
+        self.__directory = tempfile.TemporaryDirectory()
+        self.__sut = FileSystemBlobStore(root_path=self.__directory.name)
+
+    def tearDown(self):
+        self.__directory.cleanup()
+
+    def test_put_and_get(self):
+        # act
+        self.__sut.put(key="Model/1", data=b"payload")
+
+        # assert
+        self.assertEqual(self.__sut.get(key="Model/1"), b"payload")
+
+    def test_get_when_missing(self):
+        # act
+        with self.assertRaises(BlobNotFoundException):
+            self.__sut.get(key="Model/2")
+
+    def test_keys_outside_root_are_rejected(self):
+        for key in ["../escape", "/etc/passwd", ""]:
+            with self.subTest(msg=f"key {key!r} is rejected"):
+                with self.assertRaises(BlobNotFoundException):
+                    self.__sut.get(key=key)
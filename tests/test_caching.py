@@ -0,0 +1,142 @@
+from unittest import TestCase
+
+from formula_thoughts_web.caching import ResponseCache, CachedResponse
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache(TestCase):
+
+    def setUp(self):
+        self.__clock = FakeClock()
+        self.__sut = ResponseCache(max_entries=2, max_bytes=100, clock=self.__clock)
+
+    def test_get_when_entry_is_cached(self):
+        # arrange
+        key = ("GET /items/{id}", (("id", "1"),), (), None)
+        response = CachedResponse(status_code=200, body="{}", etag="\"1\"")
+        self.__sut.set(key=key, response=response, ttl_seconds=10)
+
+        # act
+        cached = self.__sut.get(key=key)
+
+        # assert
+        with self.subTest(msg="cached response is returned"):
+            self.assertEqual(cached, response)
+
+        # assert
+        with self.subTest(msg="hit is counted"):
+            self.assertEqual(self.__sut.statistics.hits, 1)
+
+    def test_get_when_entry_is_missing(self):
+        # act
+        cached = self.__sut.get(key=("GET /items", (), (), None))
+
+        # assert
+        with self.subTest(msg="nothing is returned"):
+            self.assertIsNone(cached)
+
+        # assert
+        with self.subTest(msg="miss is counted"):
+            self.assertEqual(self.__sut.statistics.misses, 1)
+
+    def test_get_when_entry_has_expired(self):
+        # arrange
+        key = ("GET /items", (), (), None)
+        self.__sut.set(key=key, response=CachedResponse(status_code=200, body="{}"), ttl_seconds=10)
+        self.__clock.now = 10.0
+
+        # act
+        cached = self.__sut.get(key=key)
+
+        # assert
+        with self.subTest(msg="nothing is returned"):
+            self.assertIsNone(cached)
+
+        # assert
+        with self.subTest(msg="expired entry is removed"):
+            self.assertEqual(self.__sut.statistics.entries, 0)
+
+    def test_set_evicts_least_recently_used_entry_by_count(self):
+        # arrange
+        key_1 = ("GET /items/1", (), (), None)
+        key_2 = ("GET /items/2", (), (), None)
+        key_3 = ("GET /items/3", (), (), None)
+        self.__sut.set(key=key_1, response=CachedResponse(status_code=200, body="1"), ttl_seconds=10)
+        self.__sut.set(key=key_2, response=CachedResponse(status_code=200, body="2"), ttl_seconds=10)
+        self.__sut.get(key=key_1)
+
+        # act
+        self.__sut.set(key=key_3, response=CachedResponse(status_code=200, body="3"), ttl_seconds=10)
+
+        # assert
+        with self.subTest(msg="least recently used entry is evicted"):
+            self.assertIsNone(self.__sut.get(key=key_2))
+
+        # assert
+        with self.subTest(msg="recently used entry is kept"):
+            self.assertIsNotNone(self.__sut.get(key=key_1))
+
+        # assert
+        with self.subTest(msg="eviction is counted"):
+            self.assertEqual(self.__sut.statistics.evictions, 1)
+
+    def test_set_evicts_entries_by_size(self):
+        # arrange
+        key_1 = ("GET /items/1", (), (), None)
+        key_2 = ("GET /items/2", (), (), None)
+        self.__sut.set(key=key_1, response=CachedResponse(status_code=200, body="a" * 50), ttl_seconds=10)
+
+        # act
+        self.__sut.set(key=key_2, response=CachedResponse(status_code=200, body="b" * 50), ttl_seconds=10)
+
+        # assert
+        with self.subTest(msg="oldest entry is evicted"):
+            self.assertIsNone(self.__sut.get(key=key_1))
+
+        # assert
+        with self.subTest(msg="size stays within bounds"):
+            self.assertLessEqual(self.__sut.statistics.size_bytes, 100)
+
+    def test_invalidate_by_path_parameters(self):
+        # arrange
+        key_1 = ("GET /items/{id}", (("id", "1"),), (), None)
+        key_2 = ("GET /items/{id}", (("id", "2"),), (), None)
+        self.__sut.set(key=key_1, response=CachedResponse(status_code=200, body="1"), ttl_seconds=10)
+        self.__sut.set(key=key_2, response=CachedResponse(status_code=200, body="2"), ttl_seconds=10)
+
+        # act
+        evicted = self.__sut.invalidate(route_key="GET /items/{id}", path_parameters={"id": "1"})
+
+        # assert
+        with self.subTest(msg="one entry is evicted"):
+            self.assertEqual(evicted, 1)
+
+        # assert
+        with self.subTest(msg="other entries are kept"):
+            self.assertIsNotNone(self.__sut.get(key=key_2))
+
+    def test_invalidate_route(self):
+        # arrange
+        key_1 = ("GET /items/{id}", (("id", "1"),), (), None)
+        key_2 = ("GET /items/{id}", (("id", "2"),), (), None)
+        self.__sut.set(key=key_1, response=CachedResponse(status_code=200, body="1"), ttl_seconds=10)
+        self.__sut.set(key=key_2, response=CachedResponse(status_code=200, body="2"), ttl_seconds=10)
+
+        # act
+        evicted = self.__sut.invalidate(route_key="GET /items/{id}")
+
+        # assert
+        with self.subTest(msg="all route entries are evicted"):
+            self.assertEqual(evicted, 2)
+
+        # assert
+        with self.subTest(msg="cache is empty"):
+            self.assertEqual(self.__sut.statistics.entries, 0)
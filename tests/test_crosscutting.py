@@ -1,15 +1,21 @@
+import copy
 import datetime
+import json
+import pickle
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
 from typing import get_args, Union
-from unittest import TestCase
+from unittest import TestCase, skipIf
+from unittest.mock import Mock
 
 import ddt
 from autofixture import AutoFixture
 
 from formula_thoughts_web.crosscutting import ObjectMapper, JsonCamelToSnakeDeserializer, JsonSnakeToCamelSerializer, \
-    base64encode, base64decode
+    base64encode, base64decode, check_json_limits, KeyCaseCache, all_annotations, JsonDtoEncoder, StdlibJsonCodec, \
+    OrjsonJsonCodec, create_json_codec, orjson, ORJSON_JSON_CODEC, STDLIB_JSON_CODEC, FloatArray, IntArray
+from formula_thoughts_web.exceptions import PayloadTooComplexException, MappingException, JsonCodecNotFoundException
 
 TEST_DICT_JSON = "{\"name\": \"adam raymond\", \"snakeInValue\": \"snake_in_value\", \"value2To3Values\": 2, \"yeastG\": 24.2}"
 TEST_LIST_SERIALIZATION_JSON = "[{\"name\": \"adam raymond\", \"snakeInValue\": \"snake_in_value\", \"value2To3Values\": 2}, {\"name\": \"adam raymond\", \"snakeInValue\": \"snake_in_value\", \"value2To3Values\": 2}, {\"name\": \"adam raymond\", \"snakeInValue\": \"snake_in_value\", \"value2To3Values\": 2}]"
@@ -176,6 +182,41 @@ class TestDto(InheritedDto):
     nested_list: list[NestedTestDto] = None
 
 
+@dataclass(slots=True)
+class SlottedNestedDto:
+    id: str = None
+    weight: Decimal = None
+
+
+@dataclass(slots=True)
+class SlottedDto:
+    id: str
+    date: datetime.datetime = None
+    nested: SlottedNestedDto = None
+    nested_list: list[SlottedNestedDto] = None
+
+
+@dataclass(frozen=True)
+class FrozenNestedDto:
+    id: str = None
+    weight: Decimal = None
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDto:
+    id: str
+    date: datetime.datetime = None
+    nested: FrozenNestedDto = None
+    nested_list: list[FrozenNestedDto] = None
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenDecimalListDto:
+    id: str
+    weights: list[Decimal] = field(default_factory=lambda: [])
+    total: Decimal = None
+
+
 class TestMapper(TestCase):
 
     def test_map(self):
@@ -292,6 +333,242 @@ class TestMapper(TestCase):
             self.assertEqual(test_other_dto.date.month, 7)
             self.assertEqual(test_other_dto.date.year, 2024)
 
+    def test_map_from_dict_with_unsupported_annotation(self):
+        # arrange
+        @dataclass
+        class OptionalDto:
+            id: str = None
+            nested: Union[NestedTestDto, None] = None
+
+        sut = ObjectMapper()
+
+        # act
+        mapped = sut.map_from_dict(_from={"id": "test_id"}, to=OptionalDto)
+
+        # assert
+        with self.subTest(msg="fields without the unsupported annotation are mapped"):
+            self.assertEqual(mapped.id, "test_id")
+
+        # assert
+        with self.subTest(msg="mapping the unsupported annotation raises"):
+            with self.assertRaises(MappingException):
+                sut.map_from_dict(_from={"nested": {"id": "test_id"}}, to=OptionalDto)
+
+    def test_map_with_slotted_and_frozen_dtos(self):
+        # arrange
+        sut = ObjectMapper()
+        source = {"id": "test_id", "date": "2024-07-03T23:45:09", "nested": {"id": "nested_id", "weight": "1.5"},
+                  "nested_list": [{"id": "item_id", "weight": 2.5}]}
+
+        # act
+        slotted: SlottedDto = sut.map_from_dict(_from=source, to=SlottedDto)
+        frozen: FrozenDto = sut.map(_from=slotted, to=FrozenDto)
+        mapped_back: SlottedDto = sut.map(_from=frozen, to=SlottedDto)
+        as_dict = sut.map_to_dict(_from=frozen, to=FrozenDto)
+
+        # assert
+        with self.subTest(msg="slotted dto is mapped from dict"):
+            self.assertEqual(slotted, SlottedDto(id="test_id",
+                                                 date=datetime.datetime(2024, 7, 3, 23, 45, 9),
+                                                 nested=SlottedNestedDto(id="nested_id", weight=Decimal("1.5")),
+                                                 nested_list=[SlottedNestedDto(id="item_id", weight=Decimal("2.5"))]))
+
+        # assert
+        with self.subTest(msg="frozen dto is mapped from slotted dto"):
+            self.assertEqual(frozen, FrozenDto(id="test_id",
+                                               date=datetime.datetime(2024, 7, 3, 23, 45, 9),
+                                               nested=FrozenNestedDto(id="nested_id", weight=Decimal("1.5")),
+                                               nested_list=[FrozenNestedDto(id="item_id", weight=Decimal("2.5"))]))
+
+        # assert
+        with self.subTest(msg="slotted dto is mapped from frozen dto"):
+            self.assertEqual(mapped_back, slotted)
+
+        # assert
+        with self.subTest(msg="frozen dto is mapped to dict"):
+            self.assertEqual(as_dict, {"id": "test_id", "date": "2024-07-03T23:45:09",
+                                       "nested": {"id": "nested_id", "weight": 1.5},
+                                       "nested_list": [{"id": "item_id", "weight": 2.5}]})
+
+    def test_map_frozen_dto_with_missing_required_field(self):
+        # act
+        with self.assertRaises(MappingException):
+            ObjectMapper().map_from_dict(_from={"date": "2024-07-03T23:45:09"}, to=FrozenDto)
+
+    def test_map_many(self):
+        # arrange
+        sut = ObjectMapper()
+        dicts = [{"id": f"id_{i}", "real_decimal_num": "12.4", "list_of_decimals": ["1.5"], "date": "2024-07-03T23:45:09",
+                  "nested": {"id": f"nested_{i}", "list_of_nested": [{"name": "Jane"}], "nested": {"id": "John"}},
+                  "nested_list": []} for i in range(0, 5)]
+        dtos = [sut.map_from_dict(_from=item, to=TestOtherDto) for item in dicts]
+
+        # act
+        from_dict_many = sut.map_from_dict_many(_from=dicts, to=TestOtherDto)
+        many = sut.map_many(_from=dtos, to=TestOtherDto)
+        to_dict_many = sut.map_to_dict_many(_from=dtos, to=TestOtherDto)
+        to_dict_many_preserved = sut.map_to_dict_many(_from=dtos, to=TestOtherDto, preserve_decimal=True)
+
+        # assert
+        with self.subTest(msg="map from dict many matches map from dict"):
+            self.assertEqual(from_dict_many, dtos)
+
+        # assert
+        with self.subTest(msg="map many matches map"):
+            self.assertEqual(many, [sut.map(_from=dto, to=TestOtherDto) for dto in dtos])
+
+        # assert
+        with self.subTest(msg="map to dict many matches map to dict"):
+            self.assertEqual(to_dict_many, [sut.map_to_dict(_from=dto, to=TestOtherDto) for dto in dtos])
+
+        # assert
+        with self.subTest(msg="map to dict many preserves decimals like map to dict"):
+            self.assertEqual(to_dict_many_preserved,
+                             [sut.map_to_dict(_from=dto, to=TestOtherDto, preserve_decimal=True) for dto in dtos])
+
+    def test_map_many_lazily(self):
+        # arrange
+        sut = ObjectMapper()
+        consumed = []
+
+        def records():
+            for i in range(0, 3):
+                consumed.append(i)
+                yield {"id": f"id_{i}"}
+
+        # act
+        mapped = sut.map_from_dict_many(_from=records(), to=NestedTestDto, lazy=True)
+        first = next(mapped)
+
+        # assert
+        with self.subTest(msg="records are consumed on demand"):
+            self.assertEqual(consumed, [0])
+
+        # assert
+        with self.subTest(msg="all records are mapped"):
+            self.assertEqual([first, *mapped], [NestedTestDto(id="id_0"), NestedTestDto(id="id_1"), NestedTestDto(id="id_2")])
+
+        # assert
+        with self.subTest(msg="map to dict many is lazy"):
+            dto = NestedTestDto(id="id_0", list_of_nested=[], nested=NestedNestedTestDto(id="id_1"))
+            self.assertEqual(list(sut.map_to_dict_many(_from=[dto], to=NestedTestDto, lazy=True)),
+                             [{"id": "id_0", "name": None, "list_of_nested": [], "nested": {"id": "id_1", "name": None}}])
+
+    def test_map_many_with_invalid_item(self):
+        # act
+        with self.assertRaises(MappingException):
+            ObjectMapper().map_from_dict_many(_from=[{"id": "id_0"}, None], to=NestedTestDto)
+
+    def test_map_from_dict_lazily(self):
+        # arrange
+        sut = ObjectMapper()
+        test_dict = {"id": "test_id", "real_decimal_num": "12.4", "list_of_decimals": ["1.5"], "date": "2024-07-03T23:45:09",
+                     "nested": {"id": "nested_id", "list_of_nested": [{"name": "Jane"}], "nested": {"id": "John"}},
+                     "nested_list": [{"id": "item_id", "list_of_nested": [], "nested": {"id": "Jim"}}]}
+
+        # act
+        lazy: TestOtherDto = sut.map_from_dict_lazily(_from=test_dict, to=TestOtherDto)
+
+        # assert
+        with self.subTest(msg="lazy dto is an instance of the target type"):
+            self.assertIsInstance(lazy, TestOtherDto)
+
+        # assert
+        with self.subTest(msg="scalar fields are converted eagerly"):
+            self.assertEqual(vars(lazy)["real_decimal_num"], Decimal("12.4"))
+
+        # assert
+        with self.subTest(msg="nested fields are not converted before access"):
+            self.assertNotIsInstance(vars(lazy)["nested"], NestedTestOtherDto)
+
+        # assert
+        with self.subTest(msg="nested fields are converted and cached on access"):
+            self.assertIsInstance(lazy.nested, NestedTestOtherDto)
+            self.assertIs(lazy.nested, lazy.nested)
+            self.assertEqual(lazy.nested.list_of_nested[0].name, "Jane")
+
+        # assert
+        with self.subTest(msg="lazy dto equals the eagerly mapped dto"):
+            self.assertEqual(lazy, sut.map_from_dict(_from=test_dict, to=TestOtherDto))
+
+        # assert
+        with self.subTest(msg="lazy dto maps to the same dict as the eagerly mapped dto"):
+            self.assertEqual(sut.map_to_dict(_from=sut.map_from_dict_lazily(_from=test_dict, to=TestOtherDto), to=TestOtherDto),
+                             sut.map_to_dict(_from=sut.map_from_dict(_from=test_dict, to=TestOtherDto), to=TestOtherDto))
+
+        # assert
+        with self.subTest(msg="lazy dto pickles as the target type"):
+            restored = pickle.loads(pickle.dumps(sut.map_from_dict_lazily(_from=test_dict, to=TestOtherDto)))
+            self.assertIs(type(restored), TestOtherDto)
+            self.assertEqual(restored, sut.map_from_dict(_from=test_dict, to=TestOtherDto))
+
+        # assert
+        with self.subTest(msg="lazy dto encodes to the same json as the eagerly mapped dto"):
+            self.assertEqual(JsonDtoEncoder().encode(dto=sut.map_from_dict_lazily(_from=test_dict, to=TestOtherDto), to=TestOtherDto),
+                             JsonDtoEncoder().encode(dto=sut.map_from_dict(_from=test_dict, to=TestOtherDto), to=TestOtherDto))
+
+    def test_map_from_dict_lazily_with_slotted_dto(self):
+        # arrange
+        sut = ObjectMapper()
+        test_dict = {"id": "test_id", "nested": {"id": "nested_id", "weight": "1.5"}, "nested_list": []}
+
+        # act
+        lazy: FrozenDto = sut.map_from_dict_lazily(_from=test_dict, to=FrozenDto)
+
+        # assert
+        with self.subTest(msg="lazy dto equals the eagerly mapped dto"):
+            self.assertEqual(lazy, sut.map_from_dict(_from=test_dict, to=FrozenDto))
+
+        # assert
+        with self.subTest(msg="lazy dto pickles as the target type"):
+            restored = pickle.loads(pickle.dumps(sut.map_from_dict_lazily(_from=test_dict, to=FrozenDto)))
+            self.assertIs(type(restored), FrozenDto)
+            self.assertEqual(restored, sut.map_from_dict(_from=test_dict, to=FrozenDto))
+
+        # assert
+        with self.subTest(msg="lazy dto maps to dict"):
+            self.assertEqual(sut.map_to_dict(_from=lazy, to=FrozenDto),
+                             {"id": "test_id", "date": None, "nested": {"id": "nested_id", "weight": 1.5}, "nested_list": []})
+
+    def test_map_from_dict_lazily_with_invalid_nested_value(self):
+        # arrange
+        lazy: NestedTestDto = ObjectMapper().map_from_dict_lazily(_from={"id": "test_id", "nested": "invalid"}, to=NestedTestDto)
+
+        # act
+        with self.assertRaises(MappingException):
+            _ = lazy.nested
+
+    def test_map_logs_debug_when_enabled(self):
+        for log_mappings in [True, False]:
+            with self.subTest(msg=f"debug is logged when log mappings is {log_mappings}"):
+                # arrange
+                logger = Mock()
+                sut = ObjectMapper(logger=logger, log_mappings=log_mappings)
+
+                # act
+                sut.map_from_dict(_from={"id": "test_id", "nested": {"id": "nested_id"}}, to=NestedTestDto)
+
+                # assert
+                self.assertEqual(logger.log_debug.called, log_mappings)
+
+    def test_map_is_repeatable(self):
+        # arrange
+        sut = ObjectMapper(max_plans=1)
+        test_dict = {"nested": {"name": "John", "list_of_nested": [{"name": "Jane"}]}, "real_decimal_num": "12.4",
+                     "list_of_decimals": ["0", 1.5], "date": "2024-07-03T23:45:09"}
+
+        # act
+        results = [sut.map_from_dict(_from=test_dict, to=TestOtherDto) for _ in range(0, 3)]
+
+        # assert
+        for result in results:
+            with self.subTest(msg="each mapping matches"):
+                self.assertEqual(result, TestOtherDto(nested=NestedTestOtherDto(name="John",
+                                                                                list_of_nested=[NestedNestedTestOtherDto(name="Jane")]),
+                                                      real_decimal_num=Decimal("12.4"),
+                                                      list_of_decimals=[Decimal("0"), Decimal("1.5")],
+                                                      date=datetime.datetime(2024, 7, 3, 23, 45, 9)))
+
 
 @ddt.ddt
 class TestJsonSnakeToCamelSerializer(TestCase):
@@ -431,3 +708,446 @@ class TestBase64(TestCase):
         # assert
         with self.subTest(msg="assert string is properly encoded"):
             self.assertEqual(base64_decoded_string, "https://www.this.that.com")
+
+
+class TestCheckJsonLimits(TestCase):
+
+    def test_check_json_limits_within_limits(self):
+        # arrange
+        data = "{\"a\": [1, {\"b\": \"[{}],\\\"\"}], \"c\": null, \"d\": [ ], \"e\": {}}"
+
+        # act
+        check_json_limits(data=data, max_depth=3, max_elements=7)
+
+    def test_check_json_limits_over_max_depth(self):
+        # arrange
+        data = "{\"a\": [1, {\"b\": 2}]}"
+
+        # act
+        with self.assertRaises(PayloadTooComplexException):
+            check_json_limits(data=data, max_depth=2)
+
+    def test_check_json_limits_over_max_elements(self):
+        # arrange
+        data = "{\"a\": [1, {\"b\": 2}], \"c\": null}"
+
+        # act
+        with self.assertRaises(PayloadTooComplexException):
+            check_json_limits(data=data, max_elements=4)
+
+    def test_check_json_limits_with_brackets_in_strings(self):
+        # arrange
+        data = "[{\"a\": \"]]\\\\\"}, [\"[[\", [1]]]"
+
+        # act
+        with self.assertRaises(PayloadTooComplexException):
+            check_json_limits(data=data, max_depth=2)
+
+    def test_check_json_limits_with_bytes(self):
+        # arrange
+        data = b"[[[]]]"
+
+        # act
+        with self.assertRaises(PayloadTooComplexException):
+            check_json_limits(data=data, max_depth=2)
+
+    def test_check_json_limits_with_deeply_nested_payload(self):
+        # arrange
+        data = "[" * 200000 + "]" * 200000
+
+        # act
+        with self.assertRaises(PayloadTooComplexException):
+            check_json_limits(data=data, max_depth=5)
+
+
+class TestKeyCaseCache(TestCase):
+
+    def test_to_camel_case(self):
+        # arrange
+        sut = KeyCaseCache()
+
+        for key, expected in [("name", "name"), ("snake_in_value", "snakeInValue"), ("value_2_to_3_values", "value2To3Values")]:
+            # act
+            actual = sut.to_camel_case(key)
+
+            # assert
+            with self.subTest(msg=f"{key} is converted"):
+                self.assertEqual(actual, expected)
+
+    def test_to_snake_case(self):
+        # arrange
+        sut = KeyCaseCache()
+
+        for key, expected in [("name", "name"), ("snakeInValue", "snake_in_value"), ("capitalLETTERSValue", "capital_letters_value")]:
+            # act
+            actual = sut.to_snake_case(key)
+
+            # assert
+            with self.subTest(msg=f"{key} is converted"):
+                self.assertEqual(actual, expected)
+
+    def test_entries_are_bounded(self):
+        # arrange
+        sut = KeyCaseCache(max_entries=2)
+
+        # act
+        for i in range(0, 10):
+            sut.to_camel_case(f"key_{i}")
+            sut.to_snake_case(f"key{i}")
+
+        # assert
+        self.assertEqual(sut.entries, 4)
+
+    def test_seed(self):
+        # arrange
+        sut = KeyCaseCache()
+
+        # act
+        sut.seed(types=[TestDto])
+
+        # assert
+        self.assertEqual(sut.entries, len(all_annotations(TestDto)) * 2)
+
+    def test_clear(self):
+        # arrange
+        sut = KeyCaseCache()
+        sut.to_camel_case("snake_in_value")
+
+        # act
+        sut.clear()
+
+        # assert
+        self.assertEqual(sut.entries, 0)
+
+    def test_serializer_and_deserializer_share_cache(self):
+        # arrange
+        key_case_cache = KeyCaseCache()
+        serializer = JsonSnakeToCamelSerializer(key_case_cache=key_case_cache)
+        deserializer = JsonCamelToSnakeDeserializer(key_case_cache=key_case_cache)
+
+        # act
+        serializer.serialize(data={"snake_in_value": 1})
+        deserializer.deserialize(data="{\"camelValue\": 1}")
+
+        # assert
+        self.assertEqual(key_case_cache.entries, 2)
+
+
+class TestStrEnum(str, Enum):
+    VALUE1 = "value_1"
+
+
+@dataclass
+class EncoderLeafDto:
+    leaf_id: str = None
+    amount_g: Decimal = None
+    created_at: datetime.datetime = None
+
+
+@dataclass
+class EncoderNestedDto:
+    nested_name: str = None
+    leaf: EncoderLeafDto = None
+    leaves: list[EncoderLeafDto] = None
+    weights_g: list[Decimal] = None
+
+
+@dataclass
+class EncoderDto:
+    id: str = field(default_factory=lambda: "default_id")
+    count: int = None
+    ratio_2_to_3: float = None
+    flag: bool = None
+    tags: list[str] = None
+    created_at: datetime.datetime = None
+    price: Decimal = None
+    prices: list[Decimal] = None
+    nested: EncoderNestedDto = None
+    nested_list: list[EncoderNestedDto] = None
+    extra: dict = None
+    str_enum: TestStrEnum = None
+
+
+def create_encoder_dto(i: int) -> EncoderDto:
+    def leaf(j: int) -> EncoderLeafDto:
+        return EncoderLeafDto(leaf_id=["a", "\u00fc", "x\"y", None][j % 4],
+                              amount_g=Decimal(j) / 8,
+                              created_at=datetime.datetime(2020, 1, j % 28 + 1, j % 24, 0, 0, [0, 123][j % 2]))
+
+    def nested(j: int) -> EncoderNestedDto:
+        return EncoderNestedDto(nested_name="nested" if j % 2 == 0 else None,
+                                leaf=leaf(j),
+                                leaves=[leaf(j + k) for k in range(0, j % 3)],
+                                weights_g=[Decimal(j + k) / 4 for k in range(0, j % 3 + 1)])
+
+    return EncoderDto(count=i * 10 ** i,
+                      ratio_2_to_3=i / 3 * 1e15,
+                      flag=[True, False, None][i % 3],
+                      tags=["tag"] * (i % 3),
+                      created_at=datetime.datetime(2021, 5, 5, 10, i),
+                      price=Decimal("1.005") * i,
+                      prices=[Decimal("0.1"), Decimal(i)],
+                      nested=nested(i),
+                      nested_list=[nested(i + k) for k in range(0, i % 4)],
+                      extra=[None, {}, {"snake_key": [1, 2.5, None, True, {"inner_key": Decimal("1.10")}], 3: "x", None: "y"}][i % 3],
+                      str_enum=TestStrEnum.VALUE1)
+
+
+class TestJsonDtoEncoder(TestCase):
+
+    def test_encode_matches_map_to_dict_and_serialize(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        object_mapper = ObjectMapper()
+        serializer = JsonSnakeToCamelSerializer()
+        dtos = [create_encoder_dto(i=i) for i in range(0, 12)]
+        dtos.append(EncoderDto(created_at="2020-01-01T10:00:00.000000", price="1.50", prices=["1.1", 2.5, 3],
+                               nested=create_encoder_dto(i=1).nested, nested_list=[]))
+        dtos.append(EncoderDto(prices=[], nested=create_encoder_dto(i=2).nested, nested_list=[]))
+
+        for i, dto in enumerate(dtos):
+            for preserve_decimal in [False, True]:
+                # act
+                actual = sut.encode(dto=dto, preserve_decimal=preserve_decimal)
+
+                # assert
+                with self.subTest(msg=f"dto {i} with preserve decimal {preserve_decimal} matches"):
+                    self.assertEqual(actual, serializer.serialize(
+                        data=object_mapper.map_to_dict(_from=dto, to=EncoderDto, preserve_decimal=preserve_decimal)))
+
+    def test_encode_with_base_type(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        dto = create_encoder_dto(i=3)
+
+        # act
+        actual = sut.encode(dto=dto.nested.leaf, to=EncoderLeafDto)
+
+        # assert
+        self.assertEqual(actual, JsonSnakeToCamelSerializer().serialize(
+            data=ObjectMapper().map_to_dict(_from=dto.nested.leaf, to=EncoderLeafDto)))
+
+    def test_encode_with_undeclared_field(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        dto = create_encoder_dto(i=4)
+        dto.undeclared_field = 1
+
+        # act
+        actual = sut.encode(dto=dto)
+
+        # assert
+        self.assertEqual(actual, JsonSnakeToCamelSerializer().serialize(
+            data=ObjectMapper().map_to_dict(_from=dto, to=EncoderDto)))
+
+    def test_encode_with_enum_and_missing_nested_dto(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        dto = TestOtherDto(id="1", enum=TestEnum.VALUE1, list_of_enums=[TestEnum.VALUE2])
+
+        # act
+        actual = sut.encode(dto=dto)
+
+        # assert
+        self.assertEqual(actual, "{\"id\": \"1\", \"name\": null, \"bool\": null, \"enum\": \"VALUE1\", "
+                                 "\"listOfEnums\": [\"VALUE2\"], \"listOfStrings\": null, \"listOfInts\": null, "
+                                 "\"listOfFloats\": null, \"listOfBools\": null, \"date\": null, \"listOfDates\": null, "
+                                 "\"decimalNum\": null, \"realDecimalNum\": null, \"listOfDecimals\": null, "
+                                 "\"nested\": null, \"nestedList\": null}")
+
+    def test_encode_slotted_dto(self):
+        # arrange
+        dto = SlottedDto(id="test_id", nested=SlottedNestedDto(id="nested_id", weight=Decimal("1.5")))
+
+        # act
+        actual = JsonDtoEncoder().encode(dto=dto)
+
+        # assert
+        self.assertEqual(actual, "{\"id\": \"test_id\", \"date\": null, \"nested\": {\"id\": \"nested_id\", "
+                                 "\"weight\": 1.5}, \"nestedList\": null}")
+
+    def test_encode_frozen_slotted_dto_with_required_field(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        dtos = [FrozenDecimalListDto(id="test_id", weights=[Decimal("1.5"), Decimal("2")], total=Decimal("3.5")),
+                FrozenDecimalListDto(id="test_id")]
+
+        for i, dto in enumerate(dtos):
+            # act
+            actual = sut.encode(dto=dto)
+
+            # assert
+            with self.subTest(msg=f"dto {i} matches map to dict and serialize"):
+                self.assertEqual(actual, JsonSnakeToCamelSerializer().serialize(
+                    data=ObjectMapper().map_to_dict(_from=dto, to=FrozenDecimalListDto)))
+
+    def test_encode_with_unsupported_value(self):
+        # arrange
+        sut = JsonDtoEncoder()
+        dto = EncoderDto(extra={"value": object()})
+
+        # act
+        with self.assertRaises(MappingException):
+            sut.encode(dto=dto)
+
+
+class TestJsonCodec(TestCase):
+
+    def test_create_json_codec(self):
+        # act
+        stdlib_codec = create_json_codec(name=STDLIB_JSON_CODEC)
+        orjson_codec = create_json_codec(name=ORJSON_JSON_CODEC)
+
+        # assert
+        with self.subTest(msg="stdlib codec is created"):
+            self.assertIsInstance(stdlib_codec, StdlibJsonCodec)
+
+        # assert
+        with self.subTest(msg="orjson codec falls back to stdlib when it is not installed"):
+            self.assertIsInstance(orjson_codec, StdlibJsonCodec if orjson is None else OrjsonJsonCodec)
+
+    def test_create_json_codec_with_unknown_name(self):
+        # act
+        sut_call = lambda: create_json_codec(name="ujson")
+
+        # assert
+        with self.assertRaises(expected_exception=JsonCodecNotFoundException):
+            sut_call()
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_matches_stdlib_codec(self):
+        # arrange
+        stdlib_codec = StdlibJsonCodec()
+        sut = OrjsonJsonCodec()
+        dto = create_encoder_dto(i=5)
+
+        # act
+        serialized = JsonSnakeToCamelSerializer(json_codec=sut).serialize(data=TEST_NESTED_DICT)
+        deserialized = JsonCamelToSnakeDeserializer(json_codec=sut).deserialize(data=TEST_DICT_NESTED_JSON)
+        mapped = ObjectMapper(json_codec=sut).map_to_dict(_from=dto, to=EncoderDto)
+
+        # assert
+        with self.subTest(msg="serialized json matches"):
+            self.assertEqual(json.loads(serialized), json.loads(
+                JsonSnakeToCamelSerializer(json_codec=stdlib_codec).serialize(data=TEST_NESTED_DICT)))
+
+        # assert
+        with self.subTest(msg="deserialized dict matches"):
+            self.assertEqual(deserialized, JsonCamelToSnakeDeserializer(json_codec=stdlib_codec).deserialize(
+                data=TEST_DICT_NESTED_JSON))
+
+        # assert
+        with self.subTest(msg="mapped dict matches"):
+            self.assertEqual(mapped, ObjectMapper(json_codec=stdlib_codec).map_to_dict(_from=dto, to=EncoderDto))
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_falls_back_to_stdlib(self):
+        # arrange
+        sut = OrjsonJsonCodec()
+
+        # act
+        serialized = sut.dumps(data={"value": 2 ** 70})
+        deserialized = sut.loads(data="{\"value\": NaN}")
+
+        # assert
+        with self.subTest(msg="large integers are serialized"):
+            self.assertEqual(serialized, "{\"value\": 1180591620717411303424}")
+
+        # assert
+        with self.subTest(msg="non standard values are deserialized"):
+            self.assertNotEqual(deserialized["value"], deserialized["value"])
+
+    def test_codecs_apply_object_pairs_hook(self):
+        # arrange
+        data = "{\"outerKey\": [{\"innerKey\": 1}, [{\"deepKey\": null}], 2], \"otherKey\": {\"nestedKey\": \"value\"}}"
+        codecs = [StdlibJsonCodec()] + ([] if orjson is None else [OrjsonJsonCodec()])
+
+        for sut in codecs:
+            # act
+            actual = sut.loads(data=data, object_pairs_hook=lambda pairs: {key.upper(): value for key, value in pairs})
+
+            # assert
+            with self.subTest(msg=f"{type(sut).__name__} applies hook to every object"):
+                self.assertEqual(actual, {"OUTERKEY": [{"INNERKEY": 1}, [{"DEEPKEY": None}], 2],
+                                          "OTHERKEY": {"NESTEDKEY": "value"}})
+
+
+@dataclass
+class TelemetryDto:
+    lap: int = None
+    speeds: FloatArray = None
+    gears: IntArray = None
+
+
+class TestNumericArray(TestCase):
+
+    def test_numeric_array(self):
+        # act
+        speeds = FloatArray([1.5, 2])
+        gears = IntArray([1, 2])
+
+        # assert
+        with self.subTest(msg="float array stores doubles"):
+            self.assertEqual((speeds.typecode, speeds.tolist()), ("d", [1.5, 2.0]))
+
+        # assert
+        with self.subTest(msg="int array stores integers"):
+            self.assertEqual((gears.typecode, gears.tolist()), ("q", [1, 2]))
+
+        # assert
+        with self.subTest(msg="arrays can be copied and pickled"):
+            self.assertEqual(copy.deepcopy(speeds), speeds)
+            self.assertEqual(type(pickle.loads(pickle.dumps(speeds))), FloatArray)
+
+    def test_map_from_dict(self):
+        for speeds in [[1.5, 2.25], ["1.5", "2.25"], [Decimal("1.5"), Decimal("2.25")]]:
+            with self.subTest(msg=f"speeds {speeds} are mapped in bulk"):
+                # act
+                mapped: TelemetryDto = ObjectMapper().map_from_dict(_from={"lap": 3, "speeds": speeds, "gears": [1, 2]},
+                                                                    to=TelemetryDto)
+
+                # assert
+                self.assertEqual(mapped, TelemetryDto(lap=3, speeds=FloatArray([1.5, 2.25]), gears=IntArray([1, 2])))
+
+    def test_map_from_dict_with_whole_number_gears(self):
+        for gears in [["1", "2"], [1.0, 2.0], [Decimal("1"), Decimal("2.0")]]:
+            with self.subTest(msg=f"gears {gears} are mapped"):
+                # act
+                mapped: TelemetryDto = ObjectMapper().map_from_dict(_from={"lap": 3, "speeds": [], "gears": gears},
+                                                                    to=TelemetryDto)
+
+                # assert
+                self.assertEqual(mapped.gears, IntArray([1, 2]))
+
+    def test_map_from_dict_with_fractional_gears(self):
+        for gears in [[1.9, 2.5, -0.7], ["1.5"], [Decimal("2.5")]]:
+            with self.subTest(msg=f"gears {gears} are rejected"):
+                # act
+                sut_call = lambda: ObjectMapper().map_from_dict(_from={"lap": 3, "speeds": [], "gears": gears},
+                                                                to=TelemetryDto)
+
+                # assert
+                with self.assertRaises(expected_exception=MappingException):
+                    sut_call()
+
+    def test_serialize(self):
+        # arrange
+        dto = TelemetryDto(lap=3, speeds=FloatArray([1.5, 2.25]), gears=IntArray([1, 2]))
+        expected = "{\"lap\": 3, \"speeds\": [1.5, 2.25], \"gears\": [1, 2]}"
+
+        # act
+        mapped = ObjectMapper().map_to_dict(_from=dto, to=TelemetryDto)
+        serialized = JsonSnakeToCamelSerializer().serialize(data={"lap": 3, "speeds": dto.speeds, "gears": dto.gears})
+        encoded = JsonDtoEncoder().encode(dto=dto)
+
+        # assert
+        with self.subTest(msg="map to dict produces lists"):
+            self.assertEqual(mapped, {"lap": 3, "speeds": [1.5, 2.25], "gears": [1, 2]})
+
+        # assert
+        with self.subTest(msg="serializer writes arrays"):
+            self.assertEqual(serialized, expected)
+
+        # assert
+        with self.subTest(msg="dto encoder writes arrays"):
+            self.assertEqual(encoded, expected)
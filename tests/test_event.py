@@ -1,13 +1,19 @@
+import gzip
+import tempfile
 import uuid
 from dataclasses import dataclass
 from unittest import TestCase
 from unittest.mock import Mock, MagicMock, call
 
-from formula_thoughts_web.abstractions import SequenceBuilder, Deserializer, ApplicationContext, EventHandler
+from formula_thoughts_web.abstractions import SequenceBuilder, Deserializer, ApplicationContext, EventHandler, EventOptions
 from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, USE_EXCEPTION_ERROR
-from formula_thoughts_web.crosscutting import JsonCamelToSnakeDeserializer, ObjectMapper
-from formula_thoughts_web.events import EventHandlerBase, EventRunner
-from formula_thoughts_web.exceptions import EventNotFoundException
+from formula_thoughts_web.blob_stores import FileSystemBlobStore
+from formula_thoughts_web.crosscutting import JsonCamelToSnakeDeserializer, ObjectMapper, JsonDtoEncoder, base64encode_bytes, \
+    JsonSnakeToCamelSerializer
+from formula_thoughts_web.event_codecs import StructEventCodec, STRUCT_CONTENT_TYPE
+from formula_thoughts_web.events import EventHandlerBase, EventRunner, LazyEventHandler, SQSEventPublisher, \
+    EventPublisherSettings, GZIP_CONTENT_ENCODING, BLOB_CONTENT_ENCODING
+from formula_thoughts_web.exceptions import EventNotFoundException, SchemaValidationException, MessageTooLargeException
 
 
 @dataclass(unsafe_hash=True)
@@ -22,12 +28,14 @@ class ExampleEventHandler(EventHandlerBase):
                  mock_sequence: SequenceBuilder,
                  command_pipeline: TopLevelSequenceRunner,
                  deserializer: Deserializer,
-                 object_mapper: ObjectMapper) -> None:
+                 object_mapper: ObjectMapper,
+                 options: EventOptions = None) -> None:
         super().__init__(event=Model,
                          sequence=mock_sequence,
                          command_pipeline=command_pipeline,
                          deserializer=deserializer,
-                         object_mapper=object_mapper)
+                         object_mapper=object_mapper,
+                         options=options)
 
 
 class TestEventHandler(TestCase):
@@ -58,8 +66,237 @@ class TestEventHandler(TestCase):
                 variables={"EVENT": Model(test_prop_1=4, test_prop_2="test")},
                 error_capsules=[]
             ), top_level_sequence=self.__mock_sequence)
-            
-            
+
+    def test_run_with_invalid_event(self):
+        # arrange
+        sut = ExampleEventHandler(mock_sequence=self.__mock_sequence,
+                                  command_pipeline=self.__command_pipeline,
+                                  deserializer=JsonCamelToSnakeDeserializer(),
+                                  object_mapper=ObjectMapper(),
+                                  options=EventOptions(validate_event_type=True))
+        self.__command_pipeline.run = MagicMock()
+
+        # act
+        with self.assertRaises(SchemaValidationException) as e:
+            sut.run(event="{\"testProp1\": \"four\", \"testProp2\": \"test\"}")
+
+        # assert
+        with self.subTest(msg="assert errors are reported"):
+            self.assertEqual(e.exception.errors, ["test_prop_1: 'four' is not of type 'null', 'integer'"])
+
+        # assert
+        with self.subTest(msg="assert event pipeline is not run"):
+            self.__command_pipeline.run.assert_not_called()
+
+    def test_run_with_event_schema(self):
+        # arrange
+        sut = ExampleEventHandler(mock_sequence=self.__mock_sequence,
+                                  command_pipeline=self.__command_pipeline,
+                                  deserializer=JsonCamelToSnakeDeserializer(),
+                                  object_mapper=ObjectMapper(),
+                                  options=EventOptions(schema={"type": "object", "required": ["test_prop_1"]}))
+        self.__command_pipeline.run = MagicMock()
+
+        # act
+        sut.run(event="{\"testProp1\": 4}")
+
+        # assert
+        self.__command_pipeline.run.assert_called_once()
+
+    def test_run_with_lazy_mapping(self):
+        # arrange
+        sut = ExampleEventHandler(mock_sequence=self.__mock_sequence,
+                                  command_pipeline=self.__command_pipeline,
+                                  deserializer=JsonCamelToSnakeDeserializer(),
+                                  object_mapper=ObjectMapper(),
+                                  options=EventOptions(lazy_mapping=True))
+        self.__command_pipeline.run = MagicMock()
+
+        # act
+        sut.run(event="{\"testProp1\": 4, \"testProp2\": \"test\"}")
+
+        # assert
+        self.__command_pipeline.run.assert_called_with(context=ApplicationContext(
+            body={"test_prop_1": 4, "test_prop_2": "test"},
+            variables={"EVENT": Model(test_prop_1=4, test_prop_2="test")},
+            error_capsules=[]
+        ), top_level_sequence=self.__mock_sequence)
+
+    def test_run_with_struct_content_type(self):
+        # arrange
+        self.__command_pipeline.run = MagicMock()
+        event = StructEventCodec().encode(dto=Model(test_prop_1=4, test_prop_2="test"), to=Model)
+
+        # act
+        self.__sut.run(event=event, content_type=STRUCT_CONTENT_TYPE)
+
+        # assert
+        self.__command_pipeline.run.assert_called_with(context=ApplicationContext(
+            body={"test_prop_1": 4, "test_prop_2": "test"},
+            variables={"EVENT": Model(test_prop_1=4, test_prop_2="test")},
+            error_capsules=[]
+        ), top_level_sequence=self.__mock_sequence)
+
+    def test_run_with_gzip_content_encoding(self):
+        # arrange
+        self.__command_pipeline.run = MagicMock()
+        event = base64encode_bytes(gzip.compress(b"{\"testProp1\": 4, \"testProp2\": \"test\"}"))
+
+        # act
+        self.__sut.run(event=event, content_encoding=GZIP_CONTENT_ENCODING)
+
+        # assert
+        self.__command_pipeline.run.assert_called_with(context=ApplicationContext(
+            body={"test_prop_1": 4, "test_prop_2": "test"},
+            variables={"EVENT": Model(test_prop_1=4, test_prop_2="test")},
+            error_capsules=[]
+        ), top_level_sequence=self.__mock_sequence)
+
+    def test_run_with_blob_content_encoding(self):
+        with tempfile.TemporaryDirectory() as root_path:
+            # arrange
+            blob_store = FileSystemBlobStore(root_path=root_path)
+            blob_store.put(key="Model/1", data=gzip.compress(b"{\"testProp1\": 4, \"testProp2\": \"test\"}"))
+            sut = ExampleEventHandler(mock_sequence=self.__mock_sequence,
+                                      command_pipeline=self.__command_pipeline,
+                                      deserializer=JsonCamelToSnakeDeserializer(),
+                                      object_mapper=ObjectMapper(),
+                                      options=EventOptions(blob_store=blob_store))
+            self.__command_pipeline.run = MagicMock()
+
+            # act
+            sut.run(event="Model/1", content_encoding=BLOB_CONTENT_ENCODING)
+
+            # assert
+            self.__command_pipeline.run.assert_called_with(context=ApplicationContext(
+                body={"test_prop_1": 4, "test_prop_2": "test"},
+                variables={"EVENT": Model(test_prop_1=4, test_prop_2="test")},
+                error_capsules=[]
+            ), top_level_sequence=self.__mock_sequence)
+
+
+class TestSQSEventPublisher(TestCase):
+
+    def setUp(self):
+        self.__sqs_client = Mock()
+        self.__sqs_client.get_queue_url = MagicMock(return_value={"QueueUrl": "https://queue"})
+        self.__sqs_client.send_message = MagicMock()
+        self.__settings = EventPublisherSettings(compression_threshold=64, max_message_size=512)
+
+    def test_send_sqs_message_below_compression_threshold(self):
+        # arrange
+        sut = SQSEventPublisher(sqs_client=self.__sqs_client,
+                                queue_name="queue",
+                                dto_encoder=JsonDtoEncoder(),
+                                settings=self.__settings)
+
+        # act
+        sut.send_sqs_message(message_group_id="group", payload=Model(test_prop_1=4, test_prop_2="test"))
+
+        # assert
+        message = self.__sqs_client.send_message.call_args.kwargs
+        with self.subTest(msg="body is json"):
+            self.assertEqual(message["MessageBody"], "{\"testProp1\": 4, \"testProp2\": \"test\"}")
+
+        # assert
+        with self.subTest(msg="content encoding is not set"):
+            self.assertNotIn("contentEncoding", message["MessageAttributes"])
+
+    def test_send_sqs_message_with_deprecated_serializer_and_mapper(self):
+        for msg, create_sut in [
+            ("keyword arguments", lambda: SQSEventPublisher(sqs_client=self.__sqs_client,
+                                                            queue_name="queue",
+                                                            serializer=JsonSnakeToCamelSerializer(),
+                                                            mapper=ObjectMapper())),
+            ("positional arguments", lambda: SQSEventPublisher(self.__sqs_client, "queue",
+                                                               JsonSnakeToCamelSerializer(), ObjectMapper()))]:
+            with self.subTest(msg=msg):
+                # arrange
+                with self.assertWarns(DeprecationWarning):
+                    sut = create_sut()
+
+                # act
+                sut.send_sqs_message(message_group_id="group", payload=Model(test_prop_1=4, test_prop_2="test"))
+
+                # assert
+                self.assertEqual(self.__sqs_client.send_message.call_args.kwargs["MessageBody"],
+                                 "{\"testProp1\": 4, \"testProp2\": \"test\"}")
+
+    def test_send_sqs_message_above_compression_threshold(self):
+        # arrange
+        sut = SQSEventPublisher(sqs_client=self.__sqs_client,
+                                queue_name="queue",
+                                dto_encoder=JsonDtoEncoder(),
+                                settings=self.__settings)
+        payload = Model(test_prop_1=4, test_prop_2="test" * 100)
+        handler_pipeline = Mock()
+        handler = ExampleEventHandler(mock_sequence=Mock(),
+                                      command_pipeline=handler_pipeline,
+                                      deserializer=JsonCamelToSnakeDeserializer(),
+                                      object_mapper=ObjectMapper())
+
+        # act
+        sut.send_sqs_message(message_group_id="group", payload=payload)
+
+        # assert
+        message = self.__sqs_client.send_message.call_args.kwargs
+        with self.subTest(msg="content encoding is gzip"):
+            self.assertEqual(message["MessageAttributes"]["contentEncoding"]["StringValue"], GZIP_CONTENT_ENCODING)
+
+        # assert
+        with self.subTest(msg="handler decompresses the message"):
+            handler.run(event=message["MessageBody"], content_encoding=GZIP_CONTENT_ENCODING)
+            self.assertEqual(handler_pipeline.run.call_args.kwargs["context"].variables["EVENT"], payload)
+
+    def test_send_sqs_message_offloads_to_blob_store(self):
+        with tempfile.TemporaryDirectory() as root_path:
+            # arrange
+            blob_store = FileSystemBlobStore(root_path=root_path)
+            sut = SQSEventPublisher(sqs_client=self.__sqs_client,
+                                    queue_name="queue",
+                                    dto_encoder=JsonDtoEncoder(),
+                                    settings=self.__settings,
+                                    blob_store=blob_store)
+            payload = Model(test_prop_1=4, test_prop_2="".join(uuid.uuid4().hex for _ in range(50)))
+            handler_pipeline = Mock()
+            handler = ExampleEventHandler(mock_sequence=Mock(),
+                                          command_pipeline=handler_pipeline,
+                                          deserializer=JsonCamelToSnakeDeserializer(),
+                                          object_mapper=ObjectMapper(),
+                                          options=EventOptions(blob_store=blob_store))
+
+            # act
+            sut.send_sqs_message(message_group_id="group", payload=payload)
+
+            # assert
+            message = self.__sqs_client.send_message.call_args.kwargs
+            with self.subTest(msg="content encoding is blob"):
+                self.assertEqual(message["MessageAttributes"]["contentEncoding"]["StringValue"], BLOB_CONTENT_ENCODING)
+
+            # assert
+            with self.subTest(msg="body is a blob pointer"):
+                self.assertTrue(message["MessageBody"].startswith("Model/"))
+
+            # assert
+            with self.subTest(msg="handler fetches the message from the blob store"):
+                handler.run(event=message["MessageBody"], content_encoding=BLOB_CONTENT_ENCODING)
+                self.assertEqual(handler_pipeline.run.call_args.kwargs["context"].variables["EVENT"], payload)
+
+    def test_send_sqs_message_too_large_without_blob_store(self):
+        # arrange
+        sut = SQSEventPublisher(sqs_client=self.__sqs_client,
+                                queue_name="queue",
+                                dto_encoder=JsonDtoEncoder(),
+                                settings=self.__settings)
+
+        # act
+        with self.assertRaises(MessageTooLargeException):
+            sut.send_sqs_message(message_group_id="group", payload=Model(test_prop_2="".join(uuid.uuid4().hex for _ in range(50))))
+
+        # assert
+        self.__sqs_client.send_message.assert_not_called()
+
+
 class TestEventRunner(TestCase):
     
     def setUp(self):
@@ -116,6 +353,33 @@ class TestEventRunner(TestCase):
         with self.subTest(msg="failed messages are empty"):
             self.assertEqual(len(response['batchItemFailures']), 0)
 
+    def test_run_with_content_type(self):
+        # arrange
+        self.__event_handler.event_type = Model
+        self.__event_handler.run = MagicMock()
+
+        # act
+        self.__sut.run(event={
+            "Records": [
+                {
+                    "body": "AQ==",
+                    "messageAttributes": {
+                        "messageType": {
+                            "dataType": "String",
+                            "stringValue": "Model"
+                        },
+                        "contentType": {
+                            "dataType": "String",
+                            "stringValue": STRUCT_CONTENT_TYPE
+                        }
+                    }
+                }
+            ]
+        })
+
+        # assert
+        self.__event_handler.run.assert_called_once_with(event="AQ==", content_type=STRUCT_CONTENT_TYPE)
+
     def test_run_when_event_not_found(self):
         # arrange
         self.__event_handler.event_type = Model
@@ -199,4 +463,42 @@ class TestEventRunner(TestCase):
 
         # assert
         with self.subTest(msg="sut call returns failed messages"):
-            self.assertEqual(response['batchItemFailures'][0]['itemIdentifier'], failed_message)
\ No newline at end of file
+            self.assertEqual(response['batchItemFailures'][0]['itemIdentifier'], failed_message)
+
+
+class TestLazyEventHandler(TestCase):
+
+    def setUp(self):
+        self.__event_handler: EventHandler = Mock()
+        self.__event_handler.event_type = Model
+        self.__factory = MagicMock(return_value=self.__event_handler)
+        self.__sut = LazyEventHandler(event_type=Model, factory=self.__factory)
+
+    def test_event_type_does_not_resolve_handler(self):
+        # act
+        event_type = self.__sut.event_type
+
+        # assert
+        with self.subTest(msg="event type matches"):
+            self.assertEqual(event_type, Model)
+
+        # assert
+        with self.subTest(msg="handler is not resolved"):
+            self.__factory.assert_not_called()
+
+    def test_run_resolves_handler_once(self):
+        # arrange
+        self.__event_handler.run = MagicMock()
+        message = "{\"testProp1\": 4, \"testProp2\": \"test\"}"
+
+        # act
+        self.__sut.run(event=message)
+        self.__sut.run(event=message)
+
+        # assert
+        with self.subTest(msg="handler is resolved once"):
+            self.__factory.assert_called_once()
+
+        # assert
+        with self.subTest(msg="handler is run with event"):
+            self.__event_handler.run.assert_called_with(event=message)
@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from unittest import TestCase, skipIf
+
+from formula_thoughts_web.event_codecs import StructEventCodec, MessagePackEventCodec, get_event_codec, \
+    STRUCT_CONTENT_TYPE, MSGPACK_CONTENT_TYPE
+from formula_thoughts_web.exceptions import EventCodecException
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class Colour(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class FlatEvent:
+    count: int = None
+    ratio: float = None
+    enabled: bool = None
+    name: str = None
+    price: Decimal = None
+    created: datetime = None
+    colour: Colour = None
+
+
+@dataclass
+class RenamedFlatEvent:
+    total: int = None
+    ratio: float = None
+    enabled: bool = None
+    name: str = None
+    price: Decimal = None
+    created: datetime = None
+    colour: Colour = None
+
+
+@dataclass
+class NestedEvent:
+    inner: FlatEvent = None
+    tags: list[str] = None
+
+
+class TestStructEventCodec(TestCase):
+
+    def setUp(self):
+        self.__sut = StructEventCodec()
+
+    def test_round_trip(self):
+        # arrange
+        event = FlatEvent(count=-42,
+                          ratio=0.5,
+                          enabled=True,
+                          name="sourdough ✓",
+                          price=Decimal("10.25"),
+                          created=datetime(2024, 1, 2, 3, 4, 5),
+                          colour=Colour.BLUE)
+
+        # act
+        data = self.__sut.encode(dto=event, to=FlatEvent)
+        decoded = self.__sut.decode(data=data, to=FlatEvent)
+
+        # assert
+        self.assertEqual(decoded, {
+            "count": -42,
+            "ratio": 0.5,
+            "enabled": True,
+            "name": "sourdough ✓",
+            "price": "10.25",
+            "created": "2024-01-02T03:04:05",
+            "colour": "blue"
+        })
+
+    def test_round_trip_with_missing_values(self):
+        # act
+        decoded = self.__sut.decode(data=self.__sut.encode(dto=FlatEvent(name="rye"), to=FlatEvent), to=FlatEvent)
+
+        # assert
+        self.assertEqual(decoded, {
+            "count": None,
+            "ratio": None,
+            "enabled": None,
+            "name": "rye",
+            "price": None,
+            "created": None,
+            "colour": None
+        })
+
+    def test_decode_with_mismatched_layout(self):
+        # arrange
+        data = self.__sut.encode(dto=FlatEvent(count=1), to=FlatEvent)
+
+        # act
+        with self.assertRaises(EventCodecException):
+            self.__sut.decode(data=data, to=RenamedFlatEvent)
+
+    def test_supports(self):
+        for _type, expected in [(FlatEvent, True), (NestedEvent, False), (str, False)]:
+            with self.subTest(msg=f"{_type.__name__} support is {expected}"):
+                self.assertEqual(self.__sut.supports(_type), expected)
+
+    def test_encode_int_out_of_range(self):
+        # act
+        with self.assertRaises(EventCodecException):
+            self.__sut.encode(dto=FlatEvent(count=2 ** 70), to=FlatEvent)
+
+
+@skipIf(msgpack is None, "msgpack is not installed")
+class TestMessagePackEventCodec(TestCase):
+
+    def test_round_trip(self):
+        # arrange
+        sut = MessagePackEventCodec()
+        event = NestedEvent(inner=FlatEvent(count=3, price=Decimal("1.50"), colour=Colour.RED), tags=["a", "b"])
+
+        # act
+        decoded = sut.decode(data=sut.encode(dto=event, to=NestedEvent), to=NestedEvent)
+
+        # assert
+        self.assertEqual(decoded, {
+            "inner": {
+                "count": 3,
+                "ratio": None,
+                "enabled": None,
+                "name": None,
+                "price": "1.50",
+                "created": None,
+                "colour": "red"
+            },
+            "tags": ["a", "b"]
+        })
+
+
+class TestGetEventCodec(TestCase):
+
+    def test_get_event_codec(self):
+        for content_type in [STRUCT_CONTENT_TYPE, MSGPACK_CONTENT_TYPE]:
+            with self.subTest(msg=f"codec is found for {content_type}"):
+                self.assertEqual(get_event_codec(content_type=content_type).content_type, content_type)
+
+    def test_get_event_codec_when_unknown(self):
+        # act
+        with self.assertRaises(EventCodecException):
+            get_event_codec(content_type="text/plain")
@@ -6,12 +6,14 @@ from unittest import TestCase
 
 from formula_thoughts_web.abstractions import Command, ApplicationContext, Logger, SequenceBuilder, Deserializer, \
     ApiRequestHandler, Error, EventHandler
-from formula_thoughts_web.application import FluentSequenceBuilder, TopLevelSequenceRunner, USE_RESPONSE_ERROR
+from formula_thoughts_web.application import FluentSequenceBuilder, TopLevelSequenceRunner, USE_RESPONSE_ERROR, \
+    ErrorHandlingTypeState
 from formula_thoughts_web.crosscutting import ObjectMapper
 from formula_thoughts_web.events import EventHandlerBase, EVENT
 from formula_thoughts_web.exceptions import MappingException
-from formula_thoughts_web.ioc import register_web, Container, LambdaRunner
+from formula_thoughts_web.ioc import register_web, Container, LambdaRunner, LambdaApplication
 from formula_thoughts_web.web import ApiRequestHandlerBase
+from tests import DummyLogger
 
 BAKING_ID = str(uuid.uuid4())
 
@@ -38,6 +40,24 @@ def register_dependencies(services: Container) -> None:
      .register(EventHandler, CreateBreadRequestEventHandler))
 
 
+def register_lazy_dependencies(services: Container) -> None:
+    (services.register(BakingService)
+     .register(NotificationService)
+     .register(CreateBreadRequestCommand, CreateWhiteBreadRequestCommand)
+     .register(ValidateBreadRequestCommand, ValidateWhiteBreadRequestCommand)
+     .register(CreateBreadCommand, CreateWhiteBreadCommand)
+     .register(PublishBreadNotificationCommand, PublishWhiteBreadNotificationCommand)
+     .register(CreateBreadSequenceBuilder, CreateWhiteBreadSequenceBuilder)
+     .register_lazy_request_handler("POST /bake-bread", CreateBreadRequestHandler)
+     .register_status_code_mappings({
+        BreadResponse: 200,
+        BreadValidationError: 400
+     })
+     .register(CreateBreadAsyncSequenceBuilder, CreateWhiteBreadAsyncSequenceBuilder)
+     .register(CreateBreadAsyncCommand, CreateWhiteBreadAsyncCommand)
+     .register_lazy_event_handler(BreadModel, CreateBreadRequestEventHandler))
+
+
 def handler(event, context) -> dict:
     ioc = Container()
     register_web(services=ioc, default_error_handling_strategy=USE_RESPONSE_ERROR)
@@ -46,6 +66,30 @@ def handler(event, context) -> dict:
     return lambda_runner.run(event=event, context=context)
 
 
+def lazy_handler(event, context) -> dict:
+    ioc = Container()
+    register_web(services=ioc, default_error_handling_strategy=USE_RESPONSE_ERROR)
+    register_lazy_dependencies(services=ioc)
+    lambda_runner = ioc.resolve(service=LambdaRunner)
+    return lambda_runner.run(event=event, context=context)
+
+
+def compiled_handler(event, context) -> dict:
+    ioc = Container()
+    register_web(services=ioc, default_error_handling_strategy=USE_RESPONSE_ERROR)
+    register_lazy_dependencies(services=ioc)
+    lambda_runner = ioc.compile().resolve(service=LambdaRunner)
+    return lambda_runner.run(event=event, context=context)
+
+
+APPLICATION = LambdaApplication(register_dependencies=register_dependencies,
+                                default_error_handling_strategy=USE_RESPONSE_ERROR)
+
+
+def application_handler(event, context) -> dict:
+    return APPLICATION.run(event=event, context=context)
+
+
 @dataclass
 class PreviousBake:
     id: str = None
@@ -271,6 +315,20 @@ class CreateBreadRequestEventHandler(EventHandlerBase):
                          object_mapper)
 
 
+class RecordingLogger(DummyLogger):
+
+    def __init__(self):
+        self.global_properties = {}
+        self.added_properties = []
+
+    def add_global_properties(self, properties: dict):
+        self.added_properties.append(properties)
+        self.global_properties = properties
+
+    def clear_global_properties(self):
+        self.global_properties = {}
+
+
 class TestExampleCode(TestCase):
         
     def test_run_api_request_handler(self):
@@ -335,4 +393,123 @@ class TestExampleCode(TestCase):
         # assert
         with self.subTest(msg="assert 1 failure occured"):
             self.assertEqual(response['batchItemFailures'], [{"itemIdentifier": "059f36b4-87a3-44ab-83d2-661975830a7d"}])
-        
\ No newline at end of file
+
+    def test_run_lazy_api_request_handler(self):
+        # arrange & act
+        response = lazy_handler(event={"routeKey": "POST /bake-bread", "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}"}, context={})
+
+        # assert
+        with self.subTest(msg="assert response is OK"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="assert body matches"):
+            self.assertEqual(response['body'], "{\"bread\": {\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2, \"previousBakes\": [{\"id\": \""+BAKING_ID+"\"}]}, \"bakingId\": \""+BAKING_ID+"\"}")
+
+    def test_run_lazy_event_handler(self):
+        # arrange & act
+        response = lazy_handler(event={"Records": [
+            {
+                "messageId": "059f36b4-87a3-44ab-83d2-661975830a7d",
+                "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}",
+                "messageAttributes": {
+                    "messageType": {
+                        "dataType": "String",
+                        "stringValue": "BreadModel"
+                    }
+                }
+            }
+        ]}, context={})
+
+        # assert
+        with self.subTest(msg="assert no failures occured"):
+            self.assertEqual(response['batchItemFailures'], [])
+
+    def test_run_compiled_api_request_handler(self):
+        # arrange & act
+        response = compiled_handler(event={"routeKey": "POST /bake-bread", "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}"}, context={})
+
+        # assert
+        with self.subTest(msg="assert response is OK"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="assert body matches"):
+            self.assertEqual(response['body'], "{\"bread\": {\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2, \"previousBakes\": [{\"id\": \""+BAKING_ID+"\"}]}, \"bakingId\": \""+BAKING_ID+"\"}")
+
+    def test_run_application_across_warm_invocations(self):
+        # arrange
+        registrations = []
+        sut = LambdaApplication(register_dependencies=lambda services: registrations.append(register_dependencies(services=services)),
+                                default_error_handling_strategy=USE_RESPONSE_ERROR)
+        api_event = {"routeKey": "POST /bake-bread", "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}"}
+        failing_event = {"Records": [
+            {
+                "messageId": "059f36b4-87a3-44ab-83d2-661975830a7d",
+                "body": "{\"temperature\": 54, \"yeastG\": 0, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}",
+                "messageAttributes": {
+                    "messageType": {
+                        "dataType": "String",
+                        "stringValue": "BreadModel"
+                    }
+                }
+            }
+        ]}
+
+        # act
+        first_response = sut.run(event=api_event, context={})
+        event_response = sut.run(event=failing_event, context={})
+        error_handling_type = sut.services.resolve(ErrorHandlingTypeState).error_handling_type
+        second_response = sut.run(event=api_event, context={})
+
+        # assert
+        with self.subTest(msg="assert container is built once"):
+            self.assertEqual(len(registrations), 1)
+
+        # assert
+        with self.subTest(msg="assert event failure is reported"):
+            self.assertEqual(event_response['batchItemFailures'], [{"itemIdentifier": "059f36b4-87a3-44ab-83d2-661975830a7d"}])
+
+        # assert
+        with self.subTest(msg="assert error handling type is reset between invocations"):
+            self.assertEqual(error_handling_type, USE_RESPONSE_ERROR)
+
+        # assert
+        with self.subTest(msg="assert warm invocation matches the cold one"):
+            self.assertEqual(second_response, first_response)
+
+    def test_run_application_clears_logger_global_properties(self):
+        # arrange
+        logger = RecordingLogger()
+        sut = LambdaApplication(register_dependencies=lambda services: register_dependencies(services=services.register_factory(Logger, lambda: logger)),
+                                default_error_handling_strategy=USE_RESPONSE_ERROR)
+
+        # act
+        sut.run(event={"routeKey": "POST /bake-bread", "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}"}, context={})
+
+        # assert
+        with self.subTest(msg="assert properties were added during the invocation"):
+            self.assertIn({"request_type": "api_handler"}, logger.added_properties)
+
+        # assert
+        with self.subTest(msg="assert properties are cleared after the invocation"):
+            self.assertEqual(logger.global_properties, {})
+
+    def test_run_application_event_handler(self):
+        # arrange & act
+        response = application_handler(event={"Records": [
+            {
+                "messageId": "059f36b4-87a3-44ab-83d2-661975830a7d",
+                "body": "{\"temperature\": 14.5, \"yeastG\": 24.5, \"flourG\": 546.4, \"waterMl\": 0.1, \"oliveOilMl\": 0.2}",
+                "messageAttributes": {
+                    "messageType": {
+                        "dataType": "String",
+                        "stringValue": "BreadModel"
+                    }
+                }
+            }
+        ]}, context={})
+
+        # assert
+        with self.subTest(msg="assert no failures occured"):
+            self.assertEqual(response['batchItemFailures'], [])
@@ -0,0 +1,178 @@
+from unittest import TestCase
+
+import punq
+
+from formula_thoughts_web.exceptions import ContainerCompilationException
+from formula_thoughts_web.ioc import Container
+
+
+class Clock:
+    pass
+
+
+class Repository:
+
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+class Service:
+
+    def __init__(self, repository: Repository, clock: Clock, retries: int = 3):
+        self.repository = repository
+        self.clock = clock
+        self.retries = retries
+
+
+class Plugin:
+    pass
+
+
+class FirstPlugin(Plugin):
+    pass
+
+
+class SecondPlugin(Plugin):
+    pass
+
+
+class PluginHost:
+
+    def __init__(self, plugins: list[Plugin]):
+        self.plugins = plugins
+
+
+class Greeter:
+
+    def greet(self) -> str:
+        return "hello"
+
+
+class LoudGreeter(Greeter):
+
+    def __init__(self, greeter: Greeter):
+        self.__greeter = greeter
+
+    def greet(self) -> str:
+        return self.__greeter.greet().upper()
+
+
+class Chicken:
+
+    def __init__(self, egg: 'Egg'):
+        self.egg = egg
+
+
+class Egg:
+
+    def __init__(self, chicken: Chicken):
+        self.chicken = chicken
+
+
+class Orphan:
+
+    def __init__(self, repository: Repository, name):
+        self.repository = repository
+        self.name = name
+
+
+class TestContainer(TestCase):
+
+    def test_resolve_when_compiled(self):
+        # arrange
+        sut = (Container()
+               .register(Clock, scope=punq.Scope.transient)
+               .register(Repository, scope=punq.Scope.transient)
+               .register(Service, scope=punq.Scope.transient)
+               .compile())
+
+        # act
+        first = sut.resolve(Service)
+        second = sut.resolve(Service)
+
+        # assert
+        with self.subTest(msg="transient dependencies are shared within one resolve"):
+            self.assertIs(first.clock, first.repository.clock)
+
+        # assert
+        with self.subTest(msg="transient services are rebuilt on every resolve"):
+            self.assertIsNot(first, second)
+
+        # assert
+        with self.subTest(msg="unregistered arguments fall back to their defaults"):
+            self.assertEqual(first.retries, 3)
+
+    def test_resolve_singletons_are_shared_with_uncompiled_resolves(self):
+        # arrange
+        sut = Container().register(Clock).register(Repository)
+        repository = sut.resolve(Repository)
+
+        # act
+        sut.compile()
+
+        # assert
+        with self.subTest(msg="singleton created before compile is reused"):
+            self.assertIs(sut.resolve(Repository), repository)
+
+        # assert
+        with self.subTest(msg="singleton dependency is reused"):
+            self.assertIs(sut.resolve(Clock), repository.clock)
+
+    def test_resolve_list_dependency_when_compiled(self):
+        # arrange
+        sut = (Container()
+               .register(Plugin, FirstPlugin)
+               .register(Plugin, SecondPlugin)
+               .register(PluginHost)
+               .compile())
+
+        # act
+        host = sut.resolve(PluginHost)
+
+        # assert
+        with self.subTest(msg="every registration is resolved in order"):
+            self.assertEqual([type(x) for x in host.plugins], [FirstPlugin, SecondPlugin])
+
+        # assert
+        with self.subTest(msg="last registration wins for a single dependency"):
+            self.assertIsInstance(sut.resolve(Plugin), SecondPlugin)
+
+    def test_resolve_decorator_when_compiled(self):
+        # arrange
+        sut = Container().register(Greeter).register(Greeter, LoudGreeter).compile()
+
+        # act
+        greeting = sut.resolve(Greeter).greet()
+
+        # assert
+        self.assertEqual(greeting, "HELLO")
+
+    def test_register_after_compile_invalidates_plans(self):
+        # arrange
+        sut = Container().register(Plugin, FirstPlugin).compile()
+
+        # act
+        sut.register(Plugin, SecondPlugin)
+
+        # assert
+        self.assertIsInstance(sut.resolve(Plugin), SecondPlugin)
+
+    def test_compile_when_graph_is_invalid(self):
+        # arrange
+        sut = Container().register(Repository).register(Chicken).register(Egg).register(Orphan)
+
+        # act
+        with self.assertRaises(ContainerCompilationException) as context:
+            sut.compile()
+
+        # assert
+        with self.subTest(msg="missing dependency is reported"):
+            self.assertIn("Repository requires Clock for 'clock' which is not registered", context.exception.errors)
+
+        # assert
+        with self.subTest(msg="circular dependency is reported"):
+            self.assertIn("circular dependency Chicken -> Egg -> Chicken", context.exception.errors)
+
+        # assert
+        with self.subTest(msg="unannotated argument is reported"):
+            self.assertIn("Orphan has no type annotation for 'name'", context.exception.errors)
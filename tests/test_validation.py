@@ -0,0 +1,149 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Optional
+from unittest import TestCase
+
+from formula_thoughts_web.crosscutting import FloatArray, IntArray
+from formula_thoughts_web.validation import derive_json_schema, get_type_validator, create_schema_validator, \
+    SchemaValidator
+
+
+class Colour(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class ChildDto:
+    child_name: str = None
+
+
+@dataclass
+class ParentDto:
+    parent_id: str
+    count: int = None
+    ratio: float = None
+    flag: bool = None
+    amount: Decimal = None
+    created_at: datetime = None
+    colour: Colour = None
+    tags: list[str] = None
+    child: ChildDto = None
+    children: list[ChildDto] = field(default_factory=lambda: [])
+    extra: Optional[dict] = None
+
+
+@dataclass
+class SamplesDto:
+    speeds: FloatArray = None
+    laps: IntArray = None
+
+
+class TestDeriveJsonSchema(TestCase):
+
+    def test_derive_json_schema(self):
+        # act
+        schema = derive_json_schema(_type=ChildDto)
+
+        # assert
+        self.assertEqual(schema, {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "properties": {"child_name": {"type": ["null", "string"]}}
+        })
+
+    def test_derive_json_schema_with_numeric_arrays(self):
+        # act
+        schema = derive_json_schema(_type=SamplesDto)
+
+        # assert
+        self.assertEqual(schema["properties"], {
+            "speeds": {"type": ["null", "array"], "items": {"type": "number"}},
+            "laps": {"type": ["null", "array"], "items": {"type": "integer"}}
+        })
+
+    def test_derive_json_schema_with_required_fields(self):
+        # act
+        schema = derive_json_schema(_type=ParentDto)
+
+        # assert
+        self.assertEqual(schema["required"], ["parent_id"])
+
+
+class TestSchemaValidator(TestCase):
+
+    def test_validate_valid_data(self):
+        # arrange
+        sut = get_type_validator(_type=ParentDto)
+        data = {
+            "parent_id": "1",
+            "count": 2,
+            "ratio": 1,
+            "flag": None,
+            "amount": "12.50",
+            "created_at": "2024-01-01T00:00:00",
+            "colour": "red",
+            "tags": ["a"],
+            "child": {"child_name": "child"},
+            "children": [{"child_name": None}],
+            "extra": {"any": "thing"}
+        }
+
+        # act
+        errors = sut.validate(data=data)
+
+        # assert
+        self.assertEqual(errors, [])
+
+    def test_validate_invalid_data(self):
+        # arrange
+        sut = get_type_validator(_type=ParentDto)
+        data = {
+            "count": 1.5,
+            "amount": "twelve",
+            "colour": "green",
+            "child": None,
+            "children": [{"child_name": 1}]
+        }
+
+        # act
+        errors = sut.validate(data=data)
+
+        # assert
+        self.assertEqual(errors, [
+            "'parent_id' is a required property",
+            "amount: 'twelve' is not valid under any of the given schemas",
+            "child: None is not of type 'object'",
+            "children.0.child_name: 1 is not of type 'null', 'string'",
+            "colour: 'green' is not one of [None, 'red', 'blue']",
+            "count: 1.5 is not of type 'null', 'integer'"
+        ])
+
+    def test_type_validator_is_compiled_once(self):
+        # act
+        first = get_type_validator(_type=ChildDto)
+        second = create_schema_validator(_type=ChildDto)
+
+        # assert
+        self.assertIs(first, second)
+
+    def test_create_schema_validator_prefers_schema(self):
+        # act
+        sut = create_schema_validator(schema={"type": "array"}, _type=ChildDto)
+
+        # assert
+        self.assertEqual(sut.validate(data={}), ["{} is not of type 'array'"])
+
+    def test_create_schema_validator_without_schema(self):
+        # act
+        sut = create_schema_validator()
+
+        # assert
+        self.assertIsNone(sut)
+
+    def test_invalid_schema(self):
+        # act
+        with self.assertRaises(Exception):
+            SchemaValidator(schema={"type": "not-a-type"})
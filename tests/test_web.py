@@ -1,3 +1,7 @@
+import base64
+import gzip
+import hashlib
+import zlib
 from dataclasses import dataclass
 from unittest import TestCase
 from unittest.mock import Mock, MagicMock
@@ -5,10 +9,20 @@ from unittest.mock import Mock, MagicMock
 from callee import Captor, Any
 
 from formula_thoughts_web.abstractions import SequenceBuilder, ApplicationContext, ApiRequestHandler, Deserializer, \
-    Logger
-from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, USE_RESPONSE_ERROR
-from formula_thoughts_web.crosscutting import JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer, ObjectMapper
-from formula_thoughts_web.web import ApiRequestHandlerBase, WebRunner, StatusCodeMapping
+    Logger, RouteOptions, ResponseCachePolicy, StreamingResponse, PayloadLimits, DtoEncoder, RequestValidationError
+from formula_thoughts_web.application import TopLevelSequenceRunner, ErrorHandlingTypeState, USE_RESPONSE_ERROR, \
+    FluentSequenceBuilder, ErrorHandlingStrategyFactory, ResponseErrorHandlingStrategy
+from formula_thoughts_web.caching import ResponseCache
+from formula_thoughts_web.crosscutting import JsonSnakeToCamelSerializer, JsonCamelToSnakeDeserializer, JsonDtoEncoder, \
+    ObjectMapper
+from formula_thoughts_web.exceptions import RouteConflictException
+from formula_thoughts_web.web import ApiRequestHandlerBase, WebRunner, StatusCodeMapping, RouteTable, \
+    LazyApiRequestHandler, WebRunnerSettings, negotiate_content_encoding
+from tests import logger_factory
+
+
+def strong_etag(body: str, suffix: str = "") -> str:
+    return f"\"{hashlib.blake2b(body.encode('utf-8'), digest_size=16).hexdigest()}{suffix}\""
 
 
 class ExampleRequestHandler(ApiRequestHandlerBase):
@@ -16,12 +30,14 @@ class ExampleRequestHandler(ApiRequestHandlerBase):
     def __init__(self, mock_sequence: SequenceBuilder,
                  command_pipeline: TopLevelSequenceRunner,
                  deserializer: Deserializer,
-                 logger: Logger):
+                 logger: Logger,
+                 options: RouteOptions = None):
         super().__init__("GET /test/route",
                          mock_sequence,
                          command_pipeline,
                          deserializer,
-                         logger)
+                         logger,
+                         options)
 
 
 class TestRequestHandler(TestCase):
@@ -65,6 +81,69 @@ class TestRequestHandler(TestCase):
         with self.subTest(msg="assert context was returned"):
             self.assertEqual(context, context_captor.arg)
 
+    def test_handle_request_with_invalid_body_for_body_type(self):
+        # arrange
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=JsonCamelToSnakeDeserializer(),
+                                    logger=Mock(),
+                                    options=RouteOptions(body_type=TestResponse))
+        self.__mock_pipeline.run = MagicMock()
+        event = {"body": "{\"testProp\": \"one\"}"}
+
+        # act
+        context = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="assert pipeline was not called"):
+            self.__mock_pipeline.run.assert_not_called()
+
+        # assert
+        with self.subTest(msg="assert response is a validation error"):
+            self.assertEqual(context.response, RequestValidationError(message="request body failed validation",
+                                                                      errors=["test_prop: 'one' is not of type 'null', 'integer'"]))
+
+    def test_handle_request_with_valid_body_for_body_type(self):
+        # arrange
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=JsonCamelToSnakeDeserializer(),
+                                    logger=Mock(),
+                                    options=RouteOptions(body_type=TestResponse))
+        self.__mock_pipeline.run = MagicMock()
+        event = {"body": "{\"testProp\": 1}"}
+
+        # act
+        context = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="assert pipeline was called"):
+            self.__mock_pipeline.run.assert_called_once()
+
+        # assert
+        with self.subTest(msg="assert response is not set"):
+            self.assertIsNone(context.response)
+
+    def test_handle_request_with_body_schema(self):
+        # arrange
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=JsonCamelToSnakeDeserializer(),
+                                    logger=Mock(),
+                                    options=RouteOptions(body_schema={"type": "object", "required": ["name"]}))
+        self.__mock_pipeline.run = MagicMock()
+
+        # act
+        context = sut.run(event={"body": "{\"otherName\": 1}"})
+
+        # assert
+        with self.subTest(msg="assert pipeline was not called"):
+            self.__mock_pipeline.run.assert_not_called()
+
+        # assert
+        with self.subTest(msg="assert errors are reported"):
+            self.assertEqual(context.response.errors, ["'name' is a required property"])
+
     def test_handle_request_with_json_body(self):
         # arrange
         self.__mock_sequence.generate_sequence = MagicMock()
@@ -185,6 +264,104 @@ class TestRequestHandler(TestCase):
             context: ApplicationContext = context_captor.arg
             self.assertEqual(context.variables, {"path_param1": "value1", "path_param2": "value1", "path_param3": "value1", "path_param4": 4.2})
 
+    def test_handle_request_does_not_decode_unread_body(self):
+        # arrange
+        deserializer: Deserializer = Mock()
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=deserializer,
+                                    logger=Mock())
+        self.__mock_pipeline.run = MagicMock()
+        event = {"body": "{\"field1\": \"value1\"}"}
+
+        # act
+        context = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="body is not decoded"):
+            deserializer.deserialize.assert_not_called()
+
+        # assert
+        with self.subTest(msg="body is not marked as loaded"):
+            self.assertFalse(context.body_loaded)
+
+    def test_handle_request_decodes_body_once(self):
+        # arrange
+        deserializer: Deserializer = Mock()
+        deserializer.deserialize = MagicMock(return_value={"field_1": "value1"})
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=deserializer,
+                                    logger=Mock())
+        self.__mock_pipeline.run = MagicMock()
+        event = {"body": "{\"field1\": \"value1\"}"}
+
+        # act
+        context = sut.run(event=event)
+        first = context.body
+        second = context.body
+
+        # assert
+        with self.subTest(msg="body is decoded once"):
+            deserializer.deserialize.assert_called_once_with("{\"field1\": \"value1\"}")
+
+        # assert
+        with self.subTest(msg="decoded body is returned on each access"):
+            self.assertEqual(first, second)
+
+    def test_handle_request_with_base64_json_body(self):
+        # arrange
+        self.__mock_pipeline.run = MagicMock()
+        event = {
+            "body": base64.b64encode(b"{\"camelCaseField\": \"value\"}").decode('utf-8'),
+            "isBase64Encoded": True
+        }
+
+        # act
+        context = self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(context.body, {"camel_case_field": "value"})
+
+    def test_handle_request_with_non_json_content_type(self):
+        # arrange
+        deserializer: Deserializer = Mock()
+        sut = ExampleRequestHandler(mock_sequence=self.__mock_sequence,
+                                    command_pipeline=self.__mock_pipeline,
+                                    deserializer=deserializer,
+                                    logger=Mock())
+        self.__mock_pipeline.run = MagicMock()
+        event = {
+            "headers": {"content-type": "text/plain; charset=utf-8"},
+            "body": "[\"not\", \"parsed\"]"
+        }
+
+        # act
+        context = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="raw body is returned"):
+            self.assertEqual(context.body, "[\"not\", \"parsed\"]")
+
+        # assert
+        with self.subTest(msg="json parsing is skipped"):
+            deserializer.deserialize.assert_not_called()
+
+    def test_handle_request_with_base64_binary_body(self):
+        # arrange
+        self.__mock_pipeline.run = MagicMock()
+        event = {
+            "headers": {"Content-Type": "application/octet-stream"},
+            "body": base64.b64encode(b"\x00\x01\x02").decode('utf-8'),
+            "isBase64Encoded": True
+        }
+
+        # act
+        context = self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(context.body, b"\x00\x01\x02")
+
 
 @dataclass(unsafe_hash=True)
 class TestResponse:
@@ -197,6 +374,13 @@ class TestWebRunner(TestCase):
         self.__mock_handler1: ApiRequestHandler = Mock()
         self.__mock_handler2: ApiRequestHandler = Mock()
         self.__mock_handler3: ApiRequestHandler = Mock()
+        self.__mock_handler1.route_key = "GET /test/path1"
+        self.__mock_handler2.route_key = "GET /test/path2/{id}"
+        self.__mock_handler3.route_key = "ANY /test/path3/{proxy+}"
+        self.__mock_handler1.options = RouteOptions()
+        self.__mock_handler2.options = RouteOptions()
+        self.__mock_handler3.options = RouteOptions()
+        self.__response_cache = ResponseCache()
         self.__error_handling_state = ErrorHandlingTypeState(default_error_handling_strategy="unknown")
         self.__status_code_mapping: StatusCodeMapping = Mock()
         self.__sut = WebRunner(request_handlers=[self.__mock_handler1, self.__mock_handler2, self.__mock_handler3],
@@ -204,7 +388,9 @@ class TestWebRunner(TestCase):
                                status_code_mappings=self.__status_code_mapping,
                                logger=Mock(),
                                error_handling_state=self.__error_handling_state,
-                               object_mapper=ObjectMapper())
+                               dto_encoder=JsonDtoEncoder(),
+                               settings=WebRunnerSettings(compression_min_size=20),
+                               response_cache=self.__response_cache)
 
     def test_run_basic(self):
         # arrange
@@ -240,7 +426,8 @@ class TestWebRunner(TestCase):
             self.assertEqual(response['statusCode'], 200)
 
         with self.subTest(msg="assert headers match"):
-            self.assertEqual(response['headers'], {"Content-Type": "application/json"})
+            self.assertEqual(response['headers'], {"Content-Type": "application/json",
+                                                   "ETag": strong_etag("{\"testProp\": 1}")})
 
     def test_run_without_response(self):
         # arrange
@@ -262,6 +449,82 @@ class TestWebRunner(TestCase):
         with self.subTest(msg="status code matches"):
             self.assertEqual(response['statusCode'], 204)
 
+    def test_run_when_lazy_handler_factory_fails(self):
+        # arrange
+        sut = WebRunner(request_handlers=[LazyApiRequestHandler(route_key="GET /test/lazy",
+                                                                factory=MagicMock(side_effect=RuntimeError()))],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(),
+                        response_cache=self.__response_cache)
+
+        # act
+        response = sut.run(event={"routeKey": "GET /test/lazy"})
+
+        # assert
+        with self.subTest(msg="body matches"):
+            self.assertEqual(response['body'], "{\"message\": \"internal server error :(\"}")
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 500)
+
+    def test_run_with_handler_without_options(self):
+        # arrange
+        request_handler = Mock(spec=["route_key", "run"])
+        request_handler.route_key = "GET /test/plain"
+        request_handler.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+        sut = WebRunner(request_handlers=[request_handler],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(),
+                        response_cache=self.__response_cache)
+
+        # act
+        response = sut.run(event={"routeKey": "GET /test/plain", "body": "{\"testField\": 1}"})
+
+        # assert
+        with self.subTest(msg="body matches"):
+            self.assertEqual(response['body'], "{\"testProp\": 1}")
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 200)
+
+    def test_run_with_deprecated_object_mapper(self):
+        for msg, create_sut in [
+            ("keyword arguments", lambda: WebRunner(request_handlers=[self.__mock_handler1],
+                                                    serializer=JsonSnakeToCamelSerializer(),
+                                                    status_code_mappings=self.__status_code_mapping,
+                                                    error_handling_state=self.__error_handling_state,
+                                                    object_mapper=ObjectMapper(),
+                                                    logger=Mock())),
+            ("positional arguments", lambda: WebRunner([self.__mock_handler1],
+                                                       JsonSnakeToCamelSerializer(),
+                                                       self.__status_code_mapping,
+                                                       self.__error_handling_state,
+                                                       ObjectMapper(),
+                                                       Mock()))]:
+            with self.subTest(msg=msg):
+                # arrange
+                self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+                self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+                with self.assertWarns(DeprecationWarning):
+                    sut = create_sut()
+
+                # act
+                response = sut.run(event={"routeKey": "GET /test/path1"})
+
+                # assert
+                self.assertEqual(response['body'], "{\"testProp\": 1}")
+
     def test_run_basic_with_no_route_match(self):
         # arrange
         event = {
@@ -306,4 +569,1002 @@ class TestWebRunner(TestCase):
             self.assertEqual(response['body'], "{\"message\": \"internal server error :(\"}")
 
         with self.subTest(msg="status code matches"):
-            self.assertEqual(response['statusCode'], 500)
\ No newline at end of file
+            self.assertEqual(response['statusCode'], 500)
+
+    def test_run_with_path_template_match(self):
+        # arrange
+        event = {
+            "routeKey": "$default",
+            "rawPath": "/test/path2/1234",
+            "requestContext": {"http": {"method": "GET"}}
+        }
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=None))
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="assert templated handler was run with path parameters"):
+            self.__mock_handler2.run.assert_called_once_with(event={**event, "pathParameters": {"id": "1234"}})
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 204)
+
+    def test_run_with_gzip_accept_encoding(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"accept-encoding": "deflate;q=0.5, gzip"}
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=123456789)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="body is base64 encoded"):
+            self.assertTrue(response['isBase64Encoded'])
+
+        # assert
+        with self.subTest(msg="body is gzip compressed"):
+            self.assertEqual(gzip.decompress(base64.b64decode(response['body'])).decode('utf-8'),
+                             "{\"testProp\": 123456789}")
+
+        # assert
+        with self.subTest(msg="headers match"):
+            self.assertEqual(response['headers'], {"Content-Type": "application/json",
+                                                   "Content-Encoding": "gzip",
+                                                   "ETag": strong_etag("{\"testProp\": 123456789}", suffix="-gzip"),
+                                                   "Vary": "Accept-Encoding"})
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 200)
+
+    def test_run_with_deflate_accept_encoding(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"Accept-Encoding": "deflate"}
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=123456789)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="body is deflate compressed"):
+            self.assertEqual(zlib.decompress(base64.b64decode(response['body'])).decode('utf-8'),
+                             "{\"testProp\": 123456789}")
+
+        # assert
+        with self.subTest(msg="content encoding header matches"):
+            self.assertEqual(response['headers']['Content-Encoding'], "deflate")
+
+    def test_run_with_accept_encoding_below_min_size(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"accept-encoding": "gzip"}
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="body is not compressed"):
+            self.assertEqual(response['body'], "{\"testProp\": 1}")
+
+        # assert
+        with self.subTest(msg="content encoding header is not set"):
+            self.assertNotIn("Content-Encoding", response['headers'])
+
+    def test_run_with_accept_encoding_when_route_opts_out(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"accept-encoding": "gzip"}
+        }
+        self.__mock_handler1.options = RouteOptions(compress_response=False)
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=123456789)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['body'], "{\"testProp\": 123456789}")
+
+    def test_run_with_matching_if_none_match(self):
+        # arrange
+        etag = strong_etag("{\"testProp\": 1}")
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"if-none-match": f"\"stale\", W/{etag}"}
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is not modified"):
+            self.assertEqual(response['statusCode'], 304)
+
+        # assert
+        with self.subTest(msg="body is empty"):
+            self.assertIsNone(response['body'])
+
+        # assert
+        with self.subTest(msg="etag is returned"):
+            self.assertEqual(response['headers'], {"ETag": etag})
+
+    def test_run_with_stale_if_none_match(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"If-None-Match": "\"stale\""}
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="body matches"):
+            self.assertEqual(response['body'], "{\"testProp\": 1}")
+
+    def test_run_with_version_tag_skips_serialization(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path1",
+            "headers": {"If-None-Match": "\"v42\""}
+        }
+        dto_encoder: DtoEncoder = Mock()
+        sut = WebRunner(request_handlers=[self.__mock_handler1],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=dto_encoder,
+                        settings=WebRunnerSettings(),
+                        response_cache=self.__response_cache)
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1),
+                                                                             version_tag="v42"))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is not modified"):
+            self.assertEqual(response['statusCode'], 304)
+
+        # assert
+        with self.subTest(msg="etag is the version tag"):
+            self.assertEqual(response['headers'], {"ETag": "\"v42\""})
+
+        # assert
+        with self.subTest(msg="response is not encoded"):
+            dto_encoder.encode.assert_not_called()
+
+    def test_run_with_if_none_match_on_post(self):
+        # arrange
+        event = {
+            "routeKey": "POST /test/path1",
+            "headers": {"If-None-Match": "*"}
+        }
+        self.__mock_handler2.route_key = "POST /test/path1"
+        sut = WebRunner(request_handlers=[self.__mock_handler2],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(),
+                        response_cache=self.__response_cache)
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="etag is not set"):
+            self.assertNotIn("ETag", response['headers'])
+
+    def test_run_with_cached_route(self):
+        # arrange
+        event = {
+            "routeKey": "GET /test/path2/{id}",
+            "pathParameters": {"id": "1"},
+            "queryStringParameters": {"page": "2"}
+        }
+        self.__mock_handler2.options = RouteOptions(cache=ResponseCachePolicy(ttl_seconds=30))
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        first_response = self.__sut.run(event=event)
+        second_response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="handler is only run once"):
+            self.__mock_handler2.run.assert_called_once()
+
+        # assert
+        with self.subTest(msg="cached response matches"):
+            self.assertEqual(second_response, first_response)
+
+        # assert
+        with self.subTest(msg="cache hit is counted"):
+            self.assertEqual(self.__response_cache.statistics.hits, 1)
+
+    def test_run_with_cached_route_and_different_parameters(self):
+        # arrange
+        self.__mock_handler2.options = RouteOptions(cache=ResponseCachePolicy(ttl_seconds=30))
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        self.__sut.run(event={"routeKey": "GET /test/path2/{id}", "pathParameters": {"id": "1"}})
+        self.__sut.run(event={"routeKey": "GET /test/path2/{id}", "pathParameters": {"id": "2"}})
+
+        # assert
+        self.assertEqual(self.__mock_handler2.run.call_count, 2)
+
+    def test_run_with_cached_route_after_invalidation(self):
+        # arrange
+        event = {"routeKey": "GET /test/path2/{id}", "pathParameters": {"id": "1"}}
+        self.__mock_handler2.options = RouteOptions(cache=ResponseCachePolicy(ttl_seconds=30))
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        self.__sut.run(event=event)
+        self.__response_cache.invalidate(route_key="GET /test/path2/{id}", path_parameters={"id": "1"})
+        self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(self.__mock_handler2.run.call_count, 2)
+
+    def test_run_with_cached_route_does_not_cache_errors(self):
+        # arrange
+        event = {"routeKey": "GET /test/path2/{id}", "pathParameters": {"id": "1"}}
+        self.__mock_handler2.options = RouteOptions(cache=ResponseCachePolicy(ttl_seconds=30))
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=400)
+
+        # act
+        self.__sut.run(event=event)
+        self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(self.__mock_handler2.run.call_count, 2)
+
+    def test_run_with_streaming_response(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1"}
+        items = (TestResponse(test_prop=i) for i in range(0, 3))
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(
+            response=StreamingResponse(items=items, item_type=TestResponse)))
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="body is a json array of items"):
+            self.assertEqual(response['body'], "[{\"testProp\": 0}, {\"testProp\": 1}, {\"testProp\": 2}]")
+
+        # assert
+        with self.subTest(msg="status code matches"):
+            self.assertEqual(response['statusCode'], 200)
+
+    def test_run_with_empty_streaming_response(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1"}
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(
+            response=StreamingResponse(items=iter([]), item_type=TestResponse)))
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['body'], "[]")
+
+    def test_run_with_streaming_response_over_buffer_size(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1"}
+        sut = WebRunner(request_handlers=[self.__mock_handler1],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(max_buffered_stream_size=20),
+                        response_cache=self.__response_cache)
+        items = (TestResponse(test_prop=i) for i in range(0, 3))
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(
+            response=StreamingResponse(items=items, item_type=TestResponse)))
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['statusCode'], 500)
+
+    def test_run_streaming_consumes_items_lazily(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1"}
+        consumed = []
+
+        def items():
+            for i in range(0, 3):
+                consumed.append(i)
+                yield TestResponse(test_prop=i)
+
+        sut = WebRunner(request_handlers=[self.__mock_handler1],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(stream_chunk_size=1),
+                        response_cache=self.__response_cache)
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(
+            response=StreamingResponse(items=items(), item_type=TestResponse)))
+
+        # act
+        response = sut.run_streaming(event=event)
+        first_chunk = next(response['body'])
+
+        # assert
+        with self.subTest(msg="only the first item is consumed"):
+            self.assertEqual(consumed, [0])
+
+        # assert
+        with self.subTest(msg="first chunk contains the first item"):
+            self.assertEqual(first_chunk, "[{\"testProp\": 0}")
+
+        # assert
+        with self.subTest(msg="remaining chunks complete the array"):
+            self.assertEqual(first_chunk + "".join(response['body']),
+                             "[{\"testProp\": 0}, {\"testProp\": 1}, {\"testProp\": 2}]")
+
+    def test_run_streaming_with_regular_response(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1"}
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run_streaming(event=event)
+
+        # assert
+        self.assertEqual(list(response['body']), ["{\"testProp\": 1}"])
+
+    def test_run_with_body_over_max_size(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1", "body": "{\"testField\": \"testValue\"}"}
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_body_bytes=10))
+        self.__mock_handler1.run = MagicMock()
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is payload too large"):
+            self.assertEqual(response['statusCode'], 413)
+
+        # assert
+        with self.subTest(msg="handler is not run"):
+            self.__mock_handler1.run.assert_not_called()
+
+    def test_run_with_base64_body_under_max_size(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1",
+                 "body": base64.b64encode(b"0123456789").decode(),
+                 "isBase64Encoded": True}
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_body_bytes=10))
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['statusCode'], 200)
+
+    def __create_decoding_sut(self, command_pipeline: TopLevelSequenceRunner, options: RouteOptions) -> WebRunner:
+        request_handler = ExampleRequestHandler(mock_sequence=Mock(),
+                                                command_pipeline=command_pipeline,
+                                                deserializer=JsonCamelToSnakeDeserializer(),
+                                                logger=Mock(),
+                                                options=options)
+        return WebRunner(request_handlers=[request_handler],
+                         serializer=JsonSnakeToCamelSerializer(),
+                         status_code_mappings=self.__status_code_mapping,
+                         logger=Mock(),
+                         error_handling_state=self.__error_handling_state,
+                         dto_encoder=JsonDtoEncoder(),
+                         settings=WebRunnerSettings(),
+                         response_cache=self.__response_cache)
+
+    def test_run_with_body_over_max_depth(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1", "body": "{\"a\": {\"b\": {\"c\": 1}}}"}
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_depth=2))
+        self.__mock_handler1.run = MagicMock()
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is bad request"):
+            self.assertEqual(response['statusCode'], 400)
+
+        # assert
+        with self.subTest(msg="handler is not run"):
+            self.__mock_handler1.run.assert_not_called()
+
+    def test_run_with_body_over_max_elements(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1", "body": "[1, 2, 3, 4]"}
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_elements=3))
+        self.__mock_handler1.run = MagicMock()
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is bad request"):
+            self.assertEqual(response['statusCode'], 400)
+
+        # assert
+        with self.subTest(msg="handler is not run"):
+            self.__mock_handler1.run.assert_not_called()
+
+    def test_run_with_body_within_structural_limits(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1", "body": "{\"a\": [1, 2]}"}
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_depth=2, max_elements=3))
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is ok"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="handler receives the event unchanged"):
+            self.__mock_handler1.run.assert_called_with(event=event)
+
+    def test_run_with_deeply_nested_body_over_max_depth(self):
+        # arrange
+        command_pipeline: TopLevelSequenceRunner = Mock()
+        command_pipeline.run = MagicMock(side_effect=lambda context, top_level_sequence: context.body)
+        event = {"routeKey": "GET /test/route", "body": "[" * 200000 + "]" * 200000}
+        sut = self.__create_decoding_sut(command_pipeline=command_pipeline,
+                                         options=RouteOptions(payload_limits=PayloadLimits(max_depth=5)))
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is bad request"):
+            self.assertEqual(response['statusCode'], 400)
+
+        # assert
+        with self.subTest(msg="commands are not run"):
+            command_pipeline.run.assert_not_called()
+
+    def test_run_with_deeply_nested_body_without_limits(self):
+        # arrange
+        command_pipeline: TopLevelSequenceRunner = Mock()
+        command_pipeline.run = MagicMock(side_effect=lambda context, top_level_sequence: context.body)
+        event = {"routeKey": "GET /test/route", "body": "[" * 200000 + "]" * 200000}
+        sut = self.__create_decoding_sut(command_pipeline=command_pipeline, options=RouteOptions())
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is bad request"):
+            self.assertEqual(response['statusCode'], 400)
+
+        # assert
+        with self.subTest(msg="body matches"):
+            self.assertEqual(response['body'], "{\"message\": \"payload is nested too deeply\"}")
+
+    def test_run_with_route_limits_overriding_global_limits(self):
+        # arrange
+        event = {"routeKey": "GET /test/path1", "body": "{\"testField\": \"testValue\"}"}
+        sut = WebRunner(request_handlers=[self.__mock_handler1],
+                        serializer=JsonSnakeToCamelSerializer(),
+                        status_code_mappings=self.__status_code_mapping,
+                        logger=Mock(),
+                        error_handling_state=self.__error_handling_state,
+                        dto_encoder=JsonDtoEncoder(),
+                        settings=WebRunnerSettings(payload_limits=PayloadLimits(max_body_bytes=10, max_depth=1)),
+                        response_cache=self.__response_cache)
+        self.__mock_handler1.options = RouteOptions(payload_limits=PayloadLimits(max_body_bytes=100))
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['statusCode'], 200)
+
+    def __create_batch_sut(self, **settings) -> WebRunner:
+        return WebRunner(request_handlers=[self.__mock_handler1, self.__mock_handler2, self.__mock_handler3],
+                         serializer=JsonSnakeToCamelSerializer(),
+                         status_code_mappings=self.__status_code_mapping,
+                         logger=Mock(),
+                         error_handling_state=self.__error_handling_state,
+                         dto_encoder=JsonDtoEncoder(),
+                         settings=WebRunnerSettings(batch_route_key="POST /batch",
+                                                    batch_route_keys=["GET /test/path1", "GET /test/path2/{id}"],
+                                                    **settings),
+                         response_cache=self.__response_cache)
+
+    def test_run_batch(self):
+        # arrange
+        sut = self.__create_batch_sut()
+        event = {
+            "routeKey": "POST /batch",
+            "requestContext": {"authorizer": {"jwt": {"claims": {"username": "test_user"}}}},
+            "body": "[{\"routeKey\": \"GET /test/path1\", \"body\": {\"testField\": 1}}, "
+                    "{\"routeKey\": \"GET /test/path2/{id}\", \"pathParameters\": {\"id\": \"2\"}}, "
+                    "{\"routeKey\": \"GET /test/missing\"}]"
+        }
+        self.__mock_handler1.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=1)))
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=2)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="status code is ok"):
+            self.assertEqual(response['statusCode'], 200)
+
+        # assert
+        with self.subTest(msg="body contains every result in order"):
+            self.assertEqual(response['body'], "[{\"statusCode\": 200, \"body\": {\"testProp\": 1}}, "
+                                               "{\"statusCode\": 200, \"body\": {\"testProp\": 2}}, "
+                                               "{\"statusCode\": 404, \"body\": {\"message\": \"route GET /test/missing not found\"}}]")
+
+        # assert
+        with self.subTest(msg="entry body is passed to handler"):
+            self.assertEqual(self.__mock_handler1.run.call_args.kwargs['event']['body'], "{\"testField\": 1}")
+
+        # assert
+        with self.subTest(msg="entry inherits request context"):
+            self.assertEqual(self.__mock_handler1.run.call_args.kwargs['event']['requestContext'], event['requestContext'])
+
+        # assert
+        with self.subTest(msg="path parameters are passed to handler"):
+            self.assertEqual(self.__mock_handler2.run.call_args.kwargs['event']['pathParameters'], {"id": "2"})
+
+    def test_run_batch_with_stop_on_error(self):
+        # arrange
+        sut = self.__create_batch_sut(batch_stop_on_error=True)
+        event = {
+            "routeKey": "POST /batch",
+            "body": "[{\"routeKey\": \"GET /test/path1\"}, {\"routeKey\": \"GET /test/path2/1\"}]"
+        }
+        self.__mock_handler1.run = MagicMock(side_effect=Exception())
+        self.__mock_handler2.run = MagicMock()
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="remaining entries are skipped"):
+            self.assertEqual(response['body'], "[{\"statusCode\": 500, \"body\": {\"message\": \"internal server error :(\"}}, "
+                                               "{\"statusCode\": 424, \"body\": {\"message\": \"skipped after an earlier request failed\"}}]")
+
+        # assert
+        with self.subTest(msg="skipped handler is not run"):
+            self.__mock_handler2.run.assert_not_called()
+
+    def test_run_batch_continues_on_error(self):
+        # arrange
+        sut = self.__create_batch_sut()
+        event = {
+            "routeKey": "POST /batch",
+            "body": "[{\"routeKey\": \"GET /test/path1\"}, {\"routeKey\": \"GET /test/path2/1\"}]"
+        }
+        self.__mock_handler1.run = MagicMock(side_effect=Exception())
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=2)))
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['body'], "[{\"statusCode\": 500, \"body\": {\"message\": \"internal server error :(\"}}, "
+                                           "{\"statusCode\": 200, \"body\": {\"testProp\": 2}}]")
+
+    def test_run_batch_with_route_that_cannot_be_batched(self):
+        # arrange
+        sut = self.__create_batch_sut()
+        event = {
+            "routeKey": "POST /batch",
+            "body": "[{\"routeKey\": \"GET /test/path3/a/b\"}, {\"routeKey\": \"GET /test/path2/1\"}]"
+        }
+        self.__mock_handler2.run = MagicMock(return_value=ApplicationContext(response=TestResponse(test_prop=2)))
+        self.__mock_handler3.run = MagicMock()
+        self.__status_code_mapping.get_mappings = MagicMock(return_value=200)
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="route outside the allow list is forbidden"):
+            self.assertEqual(response['body'], "[{\"statusCode\": 403, \"body\": {\"message\": \"route GET /test/path3/a/b cannot be batched\"}}, "
+                                               "{\"statusCode\": 200, \"body\": {\"testProp\": 2}}]")
+
+        # assert
+        with self.subTest(msg="handler outside the allow list is not run"):
+            self.__mock_handler3.run.assert_not_called()
+
+    def test_run_batch_with_invalid_body(self):
+        # arrange
+        sut = self.__create_batch_sut(batch_max_requests=1)
+        events = [
+            {"routeKey": "POST /batch"},
+            {"routeKey": "POST /batch", "body": "not json"},
+            {"routeKey": "POST /batch", "body": "{\"routeKey\": \"GET /test/path1\"}"},
+            {"routeKey": "POST /batch", "body": "[{\"body\": 1}]"},
+            {"routeKey": "POST /batch", "body": "[{\"routeKey\": \"GET /test/path1\"}, {\"routeKey\": \"GET /test/path1\"}]"}
+        ]
+        self.__mock_handler1.run = MagicMock()
+
+        for event in events:
+            # act
+            response = sut.run(event=event)
+
+            # assert
+            with self.subTest(msg=f"bad request for {event.get('body')}"):
+                self.assertEqual(response['statusCode'], 400)
+
+        # assert
+        with self.subTest(msg="handler is not run"):
+            self.__mock_handler1.run.assert_not_called()
+
+    def test_run_batch_with_nested_batch(self):
+        # arrange
+        sut = self.__create_batch_sut()
+        event = {"routeKey": "POST /batch", "body": "[{\"routeKey\": \"POST /batch\", \"body\": []}]"}
+
+        # act
+        response = sut.run(event=event)
+
+        # assert
+        self.assertEqual(response['body'], "[{\"statusCode\": 400, \"body\": {\"message\": \"batch requests cannot be nested\"}}]")
+
+
+class CountingCommand:
+
+    def __init__(self):
+        self.runs = 0
+
+    def run(self, context: ApplicationContext) -> None:
+        self.runs += 1
+        context.response = TestResponse(test_prop=self.runs)
+
+
+class CountingSequenceBuilder(FluentSequenceBuilder):
+
+    def __init__(self, command: CountingCommand):
+        super().__init__()
+        self.__command = command
+
+    def build(self):
+        self._add_command(self.__command)
+
+
+class TestWebRunnerBatchPipeline(TestCase):
+
+    def setUp(self):
+        self.__command = CountingCommand()
+        error_handling_state = ErrorHandlingTypeState(default_error_handling_strategy=USE_RESPONSE_ERROR)
+        error_handling_strategy_factory = ErrorHandlingStrategyFactory(
+            error_handling_strategies=[ResponseErrorHandlingStrategy()],
+            error_handling_type_state=error_handling_state)
+        request_handler = ExampleRequestHandler(mock_sequence=CountingSequenceBuilder(command=self.__command),
+                                                command_pipeline=TopLevelSequenceRunner(
+                                                    error_handling_strategy_factory=error_handling_strategy_factory,
+                                                    logger=logger_factory()),
+                                                deserializer=JsonCamelToSnakeDeserializer(),
+                                                logger=logger_factory())
+        status_code_mapping = StatusCodeMapping()
+        status_code_mapping.add_mapping(_type=TestResponse, status_code=200)
+        self.__sut = WebRunner(request_handlers=[request_handler],
+                               serializer=JsonSnakeToCamelSerializer(),
+                               status_code_mappings=status_code_mapping,
+                               logger=logger_factory(),
+                               error_handling_state=error_handling_state,
+                               dto_encoder=JsonDtoEncoder(),
+                               settings=WebRunnerSettings(batch_route_key="POST /batch",
+                                                          batch_route_keys=["GET /test/route"]),
+                               response_cache=ResponseCache())
+
+    def test_run_batch_runs_each_command_once_per_entry(self):
+        # arrange
+        event = {"routeKey": "POST /batch", "body": "[" + ", ".join(["{\"routeKey\": \"GET /test/route\"}"] * 3) + "]"}
+
+        # act
+        response = self.__sut.run(event=event)
+
+        # assert
+        with self.subTest(msg="command runs once per entry"):
+            self.assertEqual(self.__command.runs, 3)
+
+        # assert
+        with self.subTest(msg="entries see one command run each"):
+            self.assertEqual(response['body'], "[{\"statusCode\": 200, \"body\": {\"testProp\": 1}}, "
+                                               "{\"statusCode\": 200, \"body\": {\"testProp\": 2}}, "
+                                               "{\"statusCode\": 200, \"body\": {\"testProp\": 3}}]")
+
+
+class TestStatusCodeMapping(TestCase):
+
+    def test_request_validation_error_is_bad_request(self):
+        # arrange
+        sut = StatusCodeMapping()
+
+        # act
+        status_code = sut.get_mappings(response=RequestValidationError)
+
+        # assert
+        self.assertEqual(status_code, 400)
+
+
+class TestNegotiateContentEncoding(TestCase):
+
+    def test_negotiate_prefers_highest_weight(self):
+        # act
+        encoding = negotiate_content_encoding(accept_encoding="gzip;q=0.2, deflate;q=0.8")
+
+        # assert
+        self.assertEqual(encoding, "deflate")
+
+    def test_negotiate_prefers_gzip_on_equal_weight(self):
+        # act
+        encoding = negotiate_content_encoding(accept_encoding="deflate, gzip, br")
+
+        # assert
+        self.assertEqual(encoding, "gzip")
+
+    def test_negotiate_with_rejected_encodings(self):
+        # act
+        encoding = negotiate_content_encoding(accept_encoding="gzip;q=0, br")
+
+        # assert
+        self.assertIsNone(encoding)
+
+    def test_negotiate_with_wildcard(self):
+        # act
+        encoding = negotiate_content_encoding(accept_encoding="*")
+
+        # assert
+        self.assertEqual(encoding, "gzip")
+
+
+class TestLazyApiRequestHandler(TestCase):
+
+    def setUp(self):
+        self.__request_handler: ApiRequestHandler = Mock()
+        self.__request_handler.route_key = "GET /test/route"
+        self.__factory = MagicMock(return_value=self.__request_handler)
+        self.__sut = LazyApiRequestHandler(route_key="GET /test/route", factory=self.__factory)
+
+    def test_route_key_does_not_resolve_handler(self):
+        # act
+        route_key = self.__sut.route_key
+
+        # assert
+        with self.subTest(msg="route key matches"):
+            self.assertEqual(route_key, "GET /test/route")
+
+        # assert
+        with self.subTest(msg="handler is not resolved"):
+            self.__factory.assert_not_called()
+
+    def test_run_resolves_handler_once(self):
+        # arrange
+        context = ApplicationContext()
+        self.__request_handler.run = MagicMock(return_value=context)
+
+        # act
+        self.__sut.run(event={"routeKey": "GET /test/route"})
+        response = self.__sut.run(event={"routeKey": "GET /test/route"})
+
+        # assert
+        with self.subTest(msg="handler is resolved once"):
+            self.__factory.assert_called_once()
+
+        # assert
+        with self.subTest(msg="handler context is returned"):
+            self.assertEqual(response, context)
+
+    def test_run_when_resolved_handler_has_different_route(self):
+        # arrange
+        self.__request_handler.route_key = "GET /other/route"
+
+        # act
+        sut_call = lambda: self.__sut.run(event={"routeKey": "GET /test/route"})
+
+        # assert
+        with self.assertRaises(expected_exception=RouteConflictException):
+            sut_call()
+
+
+class DummyRouteHandler:
+
+    def __init__(self, route_key: str):
+        self.route_key = route_key
+
+
+class TestRouteTable(TestCase):
+
+    def setUp(self):
+        self.__exact = DummyRouteHandler("GET /users/me")
+        self.__param = DummyRouteHandler("GET /users/{user_id}")
+        self.__nested_param = DummyRouteHandler("GET /users/{user_id}/posts/{post_id}")
+        self.__proxy = DummyRouteHandler("GET /files/{proxy+}")
+        self.__any = DummyRouteHandler("ANY /any/{id}")
+        self.__sut = RouteTable(request_handlers=[self.__exact, self.__param, self.__nested_param, self.__proxy,
+                                                  self.__any])
+
+    def test_match_exact_route(self):
+        # act
+        route_match = self.__sut.match(route_key="GET /users/me")
+
+        # assert
+        with self.subTest(msg="literal route takes precedence over template"):
+            self.assertEqual(route_match.request_handler, self.__exact)
+
+        # assert
+        with self.subTest(msg="no path parameters are extracted"):
+            self.assertEqual(route_match.path_parameters, {})
+
+    def test_match_template_route_key(self):
+        # act
+        route_match = self.__sut.match(route_key="GET /users/{user_id}")
+
+        # assert
+        self.assertEqual(route_match.request_handler, self.__param)
+
+    def test_match_path_parameters(self):
+        # act
+        route_match = self.__sut.match(route_key="GET /users/1234/posts/5678")
+
+        # assert
+        with self.subTest(msg="nested template handler matches"):
+            self.assertEqual(route_match.request_handler, self.__nested_param)
+
+        # assert
+        with self.subTest(msg="path parameters are extracted"):
+            self.assertEqual(route_match.path_parameters, {"user_id": "1234", "post_id": "5678"})
+
+    def test_match_greedy_proxy(self):
+        # act
+        route_match = self.__sut.match(route_key="GET /files/a/b/c.txt")
+
+        # assert
+        with self.subTest(msg="proxy handler matches"):
+            self.assertEqual(route_match.request_handler, self.__proxy)
+
+        # assert
+        with self.subTest(msg="proxy parameter captures the remaining path"):
+            self.assertEqual(route_match.path_parameters, {"proxy": "a/b/c.txt"})
+
+    def test_match_any_method(self):
+        # act
+        route_match = self.__sut.match(route_key="DELETE /any/1")
+
+        # assert
+        self.assertEqual(route_match.request_handler, self.__any)
+
+    def test_match_any_method_literal_route(self):
+        # arrange
+        health = DummyRouteHandler("ANY /health")
+        sut = RouteTable(request_handlers=[health, DummyRouteHandler("$default")])
+
+        # act
+        route_match = sut.match(route_key="GET /health")
+
+        # assert
+        self.assertEqual(route_match.request_handler, health)
+
+    def test_match_literal_route_with_trailing_slash(self):
+        # arrange
+        literal = DummyRouteHandler("GET /a/b")
+        sut = RouteTable(request_handlers=[DummyRouteHandler("GET /a/{id}"), literal, DummyRouteHandler("$default")])
+
+        # act
+        route_match = sut.match(route_key="GET /a/b/")
+
+        # assert
+        with self.subTest(msg="literal route takes precedence over template"):
+            self.assertEqual(route_match.request_handler, literal)
+
+        # assert
+        with self.subTest(msg="no path parameters are extracted"):
+            self.assertEqual(route_match.path_parameters, {})
+
+    def test_build_with_literal_routes_differing_by_trailing_slash(self):
+        # act
+        sut_call = lambda: RouteTable(request_handlers=[DummyRouteHandler("GET /a/b"),
+                                                        DummyRouteHandler("GET /a/b/")])
+
+        # assert
+        with self.assertRaises(expected_exception=RouteConflictException):
+            sut_call()
+
+    def test_match_when_there_is_no_route(self):
+        # act
+        route_match = self.__sut.match(route_key="POST /users/1234")
+
+        # assert
+        self.assertIsNone(route_match)
+
+    def test_match_falls_back_to_default_route(self):
+        # arrange
+        default = DummyRouteHandler("$default")
+        sut = RouteTable(request_handlers=[self.__exact, default])
+
+        # act
+        route_match = sut.match(route_key="POST /unknown")
+
+        # assert
+        self.assertEqual(route_match.request_handler, default)
+
+    def test_build_with_duplicate_route(self):
+        # act
+        sut_call = lambda: RouteTable(request_handlers=[DummyRouteHandler("GET /users/me"),
+                                                        DummyRouteHandler("GET /users/me")])
+
+        # assert
+        with self.assertRaises(expected_exception=RouteConflictException):
+            sut_call()
+
+    def test_build_with_ambiguous_path_variables(self):
+        # act
+        sut_call = lambda: RouteTable(request_handlers=[DummyRouteHandler("GET /users/{user_id}"),
+                                                        DummyRouteHandler("GET /users/{id}")])
+
+        # assert
+        with self.assertRaises(expected_exception=RouteConflictException):
+            sut_call()
+
+    def test_build_with_greedy_path_variable_not_last(self):
+        # act
+        sut_call = lambda: RouteTable(request_handlers=[DummyRouteHandler("GET /files/{proxy+}/meta")])
+
+        # assert
+        with self.assertRaises(expected_exception=RouteConflictException):
+            sut_call()